@@ -11,7 +11,7 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 from app.core.database import Base
-from app.models import User, Job, JobApplication, InterviewSession, SiteSettings
+from app.models import User, Job, JobApplication, InterviewSession, SiteSettings, FetchCacheEntry, FetchTask, ActivityDaily
 
 target_metadata = Base.metadata
 
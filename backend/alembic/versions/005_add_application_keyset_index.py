@@ -0,0 +1,34 @@
+"""Add (user_id, applied_at, id) index for keyset pagination of applications
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY (Postgres) must run outside a transaction and does not block writes while it builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_job_applications_user_applied_at_id",
+            "job_applications",
+            ["user_id", "applied_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_job_applications_user_applied_at_id", table_name="job_applications", postgresql_concurrently=True
+        )
@@ -0,0 +1,96 @@
+"""Add full-text search: tsvector + trigram indexes (Postgres) or FTS5 tables (SQLite)
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, tsvector expression) - generated columns keep the vectors current on insert/update
+PG_VECTORS = [
+    (
+        "jobs",
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(company, '')), 'B')",
+    ),
+    ("job_applications", "to_tsvector('simple', coalesce(notes, ''))"),
+    ("interview_sessions", "to_tsvector('simple', coalesce(notes, ''))"),
+]
+
+# (fts table, source table, indexed columns) - external-content FTS5 tables synced by triggers
+SQLITE_FTS = [
+    ("jobs_fts", "jobs", ["title", "company"]),
+    ("job_applications_fts", "job_applications", ["notes"]),
+    ("interview_sessions_fts", "interview_sessions", ["notes"]),
+]
+
+
+def _upgrade_postgresql() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, expr in PG_VECTORS:
+        op.execute(f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({expr}) STORED")
+    # CONCURRENTLY must run outside a transaction and does not block writes while it builds
+    with op.get_context().autocommit_block():
+        for table, _ in PG_VECTORS:
+            op.execute(f"CREATE INDEX CONCURRENTLY ix_{table}_search_vector ON {table} USING gin (search_vector)")
+        # Trigram indexes serve the substring (ILIKE '%x%') part of title/company search
+        op.execute("CREATE INDEX CONCURRENTLY ix_jobs_title_trgm ON jobs USING gin (title gin_trgm_ops)")
+        op.execute("CREATE INDEX CONCURRENTLY ix_jobs_company_trgm ON jobs USING gin (company gin_trgm_ops)")
+
+
+def _upgrade_sqlite() -> None:
+    for fts, source, cols in SQLITE_FTS:
+        col_list = ", ".join(cols)
+        new_vals = ", ".join(f"new.{c}" for c in cols)
+        old_vals = ", ".join(f"old.{c}" for c in cols)
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({col_list}, content='{source}', content_rowid='id')"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {source} BEGIN "
+            f"INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_vals}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {source} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_vals}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {col_list} ON {source} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_vals}); "
+            f"INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_vals}); END"
+        )
+        # Index rows that existed before the migration
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        _upgrade_postgresql()
+    elif dialect == "sqlite":
+        _upgrade_sqlite()
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_company_trgm")
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_title_trgm")
+            for table, _ in PG_VECTORS:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_search_vector")
+        for table, _ in PG_VECTORS:
+            op.drop_column(table, "search_vector")
+    elif dialect == "sqlite":
+        for fts, _, _ in SQLITE_FTS:
+            for suffix in ("ai", "ad", "au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {fts}")
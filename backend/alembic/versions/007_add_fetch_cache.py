@@ -0,0 +1,35 @@
+"""Add fetch_cache table (persistent cache of parsed job pages)
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fetch_cache",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("url", sa.String(2048), nullable=False),
+        sa.Column("etag", sa.String(512), nullable=True),
+        sa.Column("last_modified", sa.String(64), nullable=True),
+        sa.Column("result", sa.JSON(), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_fetch_cache_url"), "fetch_cache", ["url"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_fetch_cache_url"), table_name="fetch_cache")
+    op.drop_table("fetch_cache")
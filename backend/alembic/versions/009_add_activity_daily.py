@@ -0,0 +1,42 @@
+"""Add activity_daily table (per-user daily application rollups)
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+Fill it for existing data with: python -m app.commands.rebuild_activity
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COUNTERS = (
+    "applications",
+    "status_applied",
+    "status_in_progress",
+    "status_done",
+    "status_rejected",
+    "status_got_offer",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "activity_daily",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("source_domain", sa.String(255), nullable=False, server_default=""),
+        *(sa.Column(name, sa.Integer(), nullable=False, server_default="0") for name in COUNTERS),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "day", "source_domain"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("activity_daily")
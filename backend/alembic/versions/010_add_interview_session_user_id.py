@@ -0,0 +1,55 @@
+"""Denormalize user_id onto interview_sessions with a (user_id, scheduled_at) index
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("interview_sessions", sa.Column("user_id", sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE interview_sessions SET user_id = "
+        "(SELECT user_id FROM job_applications WHERE job_applications.id = interview_sessions.job_application_id)"
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column("interview_sessions", "user_id", nullable=False)
+        op.create_foreign_key(
+            "fk_interview_sessions_user_id_users",
+            "interview_sessions",
+            "users",
+            ["user_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+    # SQLite can only add constraints by rebuilding the table, which would drop the FTS triggers
+    # from migration 006; the column stays nullable there and the ORM always sets it.
+    # CONCURRENTLY (Postgres) must run outside a transaction and does not block writes while it builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_interview_sessions_user_scheduled_at",
+            "interview_sessions",
+            ["user_id", "scheduled_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_interview_sessions_user_scheduled_at", table_name="interview_sessions", postgresql_concurrently=True
+        )
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_constraint("fk_interview_sessions_user_id_users", "interview_sessions", type_="foreignkey")
+    op.drop_column("interview_sessions", "user_id")
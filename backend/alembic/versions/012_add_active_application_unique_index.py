@@ -0,0 +1,58 @@
+"""Partial unique index: at most one active (applied / in_progress) application per user and job
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "012"
+down_revision: str | None = "011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ACTIVE = "status IN ('applied', 'in_progress')"
+
+
+def upgrade() -> None:
+    # The old check-then-insert could race (double submit). Which duplicate to keep is the
+    # user's call, and closing one changes their counters and rollups: report, don't fix
+    duplicates = op.get_bind().execute(
+        sa.text(
+            f"SELECT user_id, job_id, id FROM job_applications WHERE {ACTIVE} AND EXISTS ("
+            "SELECT 1 FROM job_applications d WHERE d.user_id = job_applications.user_id "
+            f"AND d.job_id = job_applications.job_id AND d.id != job_applications.id AND d.{ACTIVE}) "
+            "ORDER BY user_id, job_id, id"
+        )
+    ).all()
+    if duplicates:
+        groups: dict[tuple[int, int], list[int]] = {}
+        for user_id, job_id, app_id in duplicates:
+            groups.setdefault((user_id, job_id), []).append(app_id)
+        raise RuntimeError(
+            "These users have more than one active (applied / in_progress) application for a job. "
+            "Set all but one of each to another status (PATCH /api/applications/{id} keeps counters "
+            "and rollups right) and rerun the upgrade:\n  "
+            + "\n  ".join(f"user {u}, job {j}: applications {ids}" for (u, j), ids in groups.items())
+        )
+    # Partial indexes work the same on SQLite (3.8+) and Postgres. CONCURRENTLY (Postgres) must
+    # run outside a transaction and does not block writes to the table while it builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_job_applications_active",
+            "job_applications",
+            ["user_id", "job_id"],
+            unique=True,
+            postgresql_where=sa.text(ACTIVE),
+            sqlite_where=sa.text(ACTIVE),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("uq_job_applications_active", table_name="job_applications", postgresql_concurrently=True)
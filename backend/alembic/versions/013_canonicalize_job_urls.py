@@ -0,0 +1,117 @@
+"""Store jobs.source_url in canonical form and merge jobs that are the same posting
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-18
+
+Jobs created before upsert_job canonicalized URLs are keyed by the raw URL, so a create with a
+tracking-parameter variant would no longer find them. Each group of jobs with the same canonical
+URL is merged into its oldest job (applications move to it, its empty fields are filled from the
+others) and that job gets the canonical URL. If the merge would give a user two active
+applications for one job, nothing is changed and the upgrade fails with the list.
+"""
+from collections.abc import Sequence
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "013"
+down_revision: str | None = "012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+FIELDS = ("title", "company", "description", "location", "source_domain")
+
+# Frozen copy of app.services.job_fetch.canonicalize_url as of this revision: the migration must
+# keep producing these URLs whatever the app code later becomes
+_TRACKING_PARAMS = {"trk", "trkinfo", "refid", "trackingid", "ref", "gclid", "fbclid", "lipi"}
+
+
+def canonicalize_url(url: str) -> str:
+    url = url.strip()
+    try:
+        parsed = urlparse(url)
+        port = parsed.port
+    except ValueError:
+        return url
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse((scheme, host, path, "", urlencode(query), ""))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    jobs = bind.execute(sa.text(f"SELECT id, source_url, {', '.join(FIELDS)} FROM jobs ORDER BY id")).all()
+    groups: dict[str, list] = {}
+    for job in jobs:
+        groups.setdefault(canonicalize_url(job.source_url), []).append(job)
+    merges = {url: group for url, group in groups.items() if len(group) > 1}
+
+    conflicts = []
+    for url, group in merges.items():
+        ids = [job.id for job in group]
+        rows = bind.execute(
+            sa.text(
+                "SELECT user_id, job_id FROM job_applications "
+                "WHERE job_id IN :ids AND status IN ('applied', 'in_progress') ORDER BY user_id, job_id"
+            ).bindparams(sa.bindparam("ids", expanding=True)),
+            {"ids": ids},
+        ).all()
+        by_user: dict[int, list[int]] = {}
+        for user_id, job_id in rows:
+            by_user.setdefault(user_id, []).append(job_id)
+        conflicts.extend(f"user {u}: jobs {j} ({url})" for u, j in by_user.items() if len(j) > 1)
+    if conflicts:
+        raise RuntimeError(
+            "Merging jobs with the same canonical URL would give these users two active applications "
+            "for one job. Set all but one to another status and rerun the upgrade:\n  " + "\n  ".join(conflicts)
+        )
+
+    for group in merges.values():
+        keep, *others = group
+        other_ids = [job.id for job in others]
+        filled = {}
+        for name in FIELDS:
+            if getattr(keep, name) is None:
+                filled[name] = next((getattr(job, name) for job in others if getattr(job, name) is not None), None)
+        if any(value is not None for value in filled.values()):
+            bind.execute(
+                sa.text(f"UPDATE jobs SET {', '.join(f'{n} = :{n}' for n in filled)} WHERE id = :id"),
+                {**filled, "id": keep.id},
+            )
+        params = {"keep": keep.id, "ids": other_ids}
+        expanding = sa.bindparam("ids", expanding=True)
+        for sql in (
+            "UPDATE job_applications SET job_id = :keep WHERE job_id IN :ids",
+            "DELETE FROM fetch_tasks WHERE job_id IN :ids",
+            "DELETE FROM jobs WHERE id IN :ids",
+        ):
+            bind.execute(sa.text(sql).bindparams(expanding), params)
+        # The merged job's users see different job ids and fields: invalidate their ETags
+        bind.execute(
+            sa.text(
+                "UPDATE users SET data_version = data_version + 1 "
+                "WHERE id IN (SELECT user_id FROM job_applications WHERE job_id = :keep)"
+            ),
+            params,
+        )
+
+    for url, group in groups.items():
+        if group[0].source_url != url:
+            bind.execute(sa.text("UPDATE jobs SET source_url = :url WHERE id = :id"), {"url": url, "id": group[0].id})
+
+
+def downgrade() -> None:
+    # The raw URLs and merged jobs are not kept; canonical URLs are valid for the old code too
+    pass
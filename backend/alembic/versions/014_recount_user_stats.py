@@ -0,0 +1,39 @@
+"""Recount users.total_applied / total_rejected / total_success as current-status counters
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-18
+
+The counters used to be cumulative (every transition to rejected / got_offer added one and
+nothing was ever subtracted). They now hold how many applications exist and are currently
+rejected / have an offer, maintained by in-place increments (app.services.user_stats). Same
+computation as python -m app.commands.reconcile_user_stats, done here so no deploy runs with
+counters in the old meaning.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "014"
+down_revision: str | None = "013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _count(where: str = "") -> str:
+    return f"(SELECT COUNT(*) FROM job_applications a WHERE a.user_id = users.id{where})"
+
+
+def upgrade() -> None:
+    # The dashboard stats change for everyone: bump data_version so cached ETags are not reused
+    rejected = _count(" AND a.status = 'rejected'")
+    success = _count(" AND a.status = 'got_offer'")
+    op.execute(
+        f"UPDATE users SET total_applied = {_count()}, total_rejected = {rejected}, "
+        f"total_success = {success}, data_version = data_version + 1"
+    )
+
+
+def downgrade() -> None:
+    # The cumulative history is not recoverable; current-status counts are a lower bound of it
+    pass
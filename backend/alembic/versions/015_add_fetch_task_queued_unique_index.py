@@ -0,0 +1,46 @@
+"""Partial unique index: at most one pending / running fetch task per job
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-18
+
+Enqueueing used to check for a queued task and then insert, so concurrent requests could queue
+the same job twice. Extra pending duplicates are deleted first (the queue's own rows; the job is
+still fetched once). If a job has two running tasks, wait for their leases to end and rerun.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "015"
+down_revision: str | None = "014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+QUEUED = "status IN ('pending', 'running')"
+
+
+def upgrade() -> None:
+    # Keep a running task over a pending one, then the oldest
+    op.execute(
+        "DELETE FROM fetch_tasks WHERE status = 'pending' AND EXISTS ("
+        "SELECT 1 FROM fetch_tasks d WHERE d.job_id = fetch_tasks.job_id AND d.id != fetch_tasks.id "
+        "AND (d.status = 'running' OR (d.status = 'pending' AND d.id < fetch_tasks.id)))"
+    )
+    # CONCURRENTLY (Postgres) must run outside a transaction and does not block writes while it builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_fetch_tasks_queued_job",
+            "fetch_tasks",
+            ["job_id"],
+            unique=True,
+            postgresql_where=sa.text(QUEUED),
+            sqlite_where=sa.text(QUEUED),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("uq_fetch_tasks_queued_job", table_name="fetch_tasks", postgresql_concurrently=True)
@@ -1,12 +1,16 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_admin
-from app.core.database import get_db
+from app.core.database import get_async_db, pool_stats
+from app.core.responses import fast_json
 from app.models.user import User
-from app.models.settings import SiteSettings
+from app.services import export, principal_cache, site_settings
+from app.services.parse_pool import parse_pool
 from app.schemas.admin import (
     SiteSettingsResponse,
     SiteSettingsUpdate,
@@ -17,83 +21,84 @@ from app.schemas.admin import (
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
 
-def _get_setting(db: Session, key: str) -> str | None:
-    row = db.query(SiteSettings).filter(SiteSettings.key == key).first()
-    return row.value if row else None
-
-
-def _set_setting(db: Session, key: str, value: str | None) -> None:
-    row = db.query(SiteSettings).filter(SiteSettings.key == key).first()
-    if row:
-        row.value = value
-    else:
-        db.add(SiteSettings(key=key, value=value))
-    db.commit()
+def _settings_response(snapshot: site_settings.SettingsSnapshot) -> SiteSettingsResponse:
+    return SiteSettingsResponse(
+        site_name=snapshot.get(site_settings.SITE_NAME) or None,
+        maintenance_mode=snapshot.maintenance_mode,
+    )
 
 
 @router.get("/settings", response_model=SiteSettingsResponse)
-def get_settings(
+async def get_settings(
     _admin: Annotated[User, Depends(get_current_admin)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
-    site_name = _get_setting(db, "site_name") or None
-    maintenance = _get_setting(db, "maintenance_mode")
-    return SiteSettingsResponse(
-        site_name=site_name,
-        maintenance_mode=maintenance == "true",
-    )
+    # Version check (one small query) so the admin page never shows a setting another worker replaced
+    await site_settings.refresh_if_changed(db)
+    return _settings_response(site_settings.current())
 
 
 @router.patch("/settings", response_model=SiteSettingsResponse)
-def update_settings(
+async def update_settings(
     _admin: Annotated[User, Depends(get_current_admin)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     body: SiteSettingsUpdate,
 ):
+    changes = {}
     if body.site_name is not None:
-        _set_setting(db, "site_name", body.site_name or "")
+        changes[site_settings.SITE_NAME] = body.site_name or ""
     if body.maintenance_mode is not None:
-        _set_setting(db, "maintenance_mode", "true" if body.maintenance_mode else "false")
-    return get_settings(_admin, db)
+        changes[site_settings.MAINTENANCE_MODE] = "true" if body.maintenance_mode else "false"
+    if not changes:
+        return await get_settings(_admin, db)
+    return _settings_response(await site_settings.update(db, changes))
 
 
 @router.get("/users", response_model=list[UserListResponse])
-def list_users(
+async def list_users(
     _admin: Annotated[User, Depends(get_current_admin)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
 ):
-    users = db.query(User).order_by(User.created_at.desc()).offset(skip).limit(limit).all()
-    return [
-        UserListResponse(
-            id=u.id,
-            email=u.email,
-            name=u.name,
-            is_admin=u.is_admin,
-            is_active=u.is_active,
-            created_at=u.created_at.isoformat() if u.created_at else "",
-        )
-        for u in users
-    ]
+    rows = await db.execute(
+        select(User.id, User.email, User.name, User.is_admin, User.is_active, User.created_at)
+        .order_by(User.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return fast_json(
+        [
+            {
+                "id": row.id,
+                "email": row.email,
+                "name": row.name,
+                "is_admin": row.is_admin,
+                "is_active": row.is_active,
+                "created_at": row.created_at.isoformat() if row.created_at else "",
+            }
+            for row in rows
+        ]
+    )
 
 
 @router.patch("/users/{user_id}", response_model=UserListResponse)
-def update_user(
+async def update_user(
     user_id: int,
     _admin: Annotated[User, Depends(get_current_admin)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     body: UserUpdateBody,
 ):
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     if body.is_admin is not None:
         user.is_admin = body.is_admin
     if body.is_active is not None:
         user.is_active = body.is_active
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    principal_cache.invalidate_user(user.id)
     return UserListResponse(
         id=user.id,
         email=user.email,
@@ -102,3 +107,24 @@ def update_user(
         is_active=user.is_active,
         created_at=user.created_at.isoformat() if user.created_at else "",
     )
+
+
+@router.get("/export")
+async def export_all_applications(
+    _admin: Annotated[User, Depends(get_current_admin)],
+    format: Literal["csv", "ndjson"] = Query("ndjson"),
+    notes: bool = Query(True),
+    sessions: bool = Query(True),
+):
+    """Every user's applications (with user_id and user_email), streamed for backups."""
+    return StreamingResponse(
+        export.stream(format, None, notes=notes, sessions=sessions),
+        media_type=export.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="applications-all.{format}"'},
+    )
+
+
+@router.get("/metrics")
+def metrics(_admin: Annotated[User, Depends(get_current_admin)]):
+    """Process-local runtime metrics for this worker."""
+    return {"parse_pool": parse_pool.stats.snapshot(), "db_pool": pool_stats()}
@@ -1,114 +1,216 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.api.conditional import check_etag
 from app.api.deps import get_current_user
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.responses import fast_json
 from app.models.user import User
+from app.models.application import ACTIVE_INDEX, JobApplication, InterviewSession
 from app.models.job import Job
-from app.models.application import JobApplication, InterviewSession
 from app.schemas.application import (
+    ApplicationBulkUpdate,
+    ApplicationBulkUpdateResult,
     ApplicationCreate,
     ApplicationUpdate,
     ApplicationResponse,
     ApplicationListResponse,
-    JobResponse,
+    ImportResult,
     InterviewSessionCreate,
     InterviewSessionUpdate,
     InterviewSessionResponse,
 )
-from app.services.job_service import get_or_create_job
+from app.services import activity, bulk_import, data_version, export, user_stats
+from app.services.fetch_queue import enqueue_job_fetch, needs_enrichment
+from app.services.job_service import upsert_job
+from app.services.pagination import (
+    InvalidCursor,
+    decode_cursor,
+    decode_rank_cursor,
+    encode_cursor,
+    encode_rank_cursor,
+)
+from app.services.search import search_applications
 
 router = APIRouter(prefix="/api/applications", tags=["applications"])
 
 
-def _to_response(app: JobApplication) -> ApplicationResponse:
+# Exactly the ApplicationListResponse fields, selected as plain rows (no ORM entities, never description)
+LIST_COLUMNS = (
+    JobApplication.id,
+    JobApplication.job_id,
+    JobApplication.applied_at,
+    JobApplication.status,
+    JobApplication.created_at,
+    Job.source_url,
+    Job.title,
+    Job.company,
+    Job.source_domain,
+)
+LIST_FIELDS = tuple(column.key for column in LIST_COLUMNS)
+# Page size when a cursor is sent without a limit
+DEFAULT_PAGE_SIZE = 50
+
+# Job.description is deferred; the detail views include it
+_JOB_WITH_DESCRIPTION = joinedload(JobApplication.job).undefer(Job.description)
+
+
+def _to_payload(app: JobApplication) -> dict:
+    """ApplicationResponse as plain data for FastJSONResponse."""
     job = app.job
-    return ApplicationResponse(
-        id=app.id,
-        user_id=app.user_id,
-        job_id=app.job_id,
-        applied_at=app.applied_at,
-        status=app.status,
-        notes=app.notes,
-        created_at=app.created_at,
-        updated_at=app.updated_at,
-        job=JobResponse(
-            id=job.id,
-            source_url=job.source_url,
-            title=job.title,
-            company=job.company,
-            description=job.description,
-            location=job.location,
-            source_domain=job.source_domain,
-        ),
-        interview_sessions=[
-            InterviewSessionResponse(
-                id=s.id,
-                job_application_id=s.job_application_id,
-                name=s.name,
-                scheduled_at=s.scheduled_at,
-                sort_order=s.sort_order,
-                notes=s.notes,
-            )
+    return {
+        "id": app.id,
+        "user_id": app.user_id,
+        "job_id": app.job_id,
+        "applied_at": app.applied_at,
+        "status": app.status,
+        "notes": app.notes,
+        "created_at": app.created_at,
+        "updated_at": app.updated_at,
+        "job": {
+            "id": job.id,
+            "source_url": job.source_url,
+            "title": job.title,
+            "company": job.company,
+            "description": job.description,
+            "location": job.location,
+            "source_domain": job.source_domain,
+        },
+        "interview_sessions": [
+            {
+                "name": s.name,
+                "scheduled_at": s.scheduled_at,
+                "sort_order": s.sort_order,
+                "notes": s.notes,
+                "id": s.id,
+                "job_application_id": s.job_application_id,
+            }
             for s in app.interview_sessions
         ],
-    )
+    }
+
+
+def _constraint_name(exc: IntegrityError) -> str | None:
+    """The violated constraint's name where the driver reports it: psycopg in ``diag``, asyncpg on
+    its own error, which SQLAlchemy's adapter keeps as the cause of ``exc.orig``."""
+    orig = exc.orig
+    name = getattr(getattr(orig, "diag", None), "constraint_name", None)
+    return name or getattr(orig, "constraint_name", None) or getattr(orig.__cause__, "constraint_name", None)
+
+
+def _raise_if_active_conflict(exc: IntegrityError) -> None:
+    """409 when ``exc`` is a violation of the one-active-application index; anything else is left
+    to the caller to re-raise. SQLite names no constraint, only the columns in its message."""
+    name = _constraint_name(exc)
+    if name is not None:
+        conflict = name == ACTIVE_INDEX
+    else:
+        message = str(exc.orig)
+        conflict = ACTIVE_INDEX in message or "job_applications.user_id, job_applications.job_id" in message
+    if conflict:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="You already have an active application for this job (Applied or In progress). Update the existing one or set its status to Done/Rejected first.",
+        ) from exc
 
 
 @router.get("", response_model=list[ApplicationListResponse])
-def list_applications(
+async def list_applications(
     user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    request: Request,
+    response: Response,
     status_filter: str | None = Query(None, alias="status"),
     search: str | None = Query(None),
     sort: str = Query("-applied_at"),
+    limit: int | None = Query(None, ge=1, le=200),
+    cursor: str | None = Query(None),
 ):
-    q = (
-        db.query(JobApplication)
-        .options(joinedload(JobApplication.job))
-        .filter(JobApplication.user_id == user.id)
-    )
+    """List ordered by (applied_at, id), or by (score, id) with sort=relevance. `search` matches
+    job title/company, application notes and interview-session notes via the full-text index.
+    Paging is opt-in: with `limit` or `cursor` (pages of DEFAULT_PAGE_SIZE) and more rows left,
+    the opaque cursor for the next page is returned in the X-Next-Cursor header; without either
+    every row is returned. Answers 304 when If-None-Match carries the current ETag.
+    """
+    await check_etag(request, response, db, user.id)
+    q = select(*LIST_COLUMNS).join(Job, Job.id == JobApplication.job_id).where(JobApplication.user_id == user.id)
     if status_filter:
-        q = q.filter(JobApplication.status == status_filter)
+        q = q.where(JobApplication.status == status_filter)
+    matches = None
     if search:
-        search_term = f"%{search}%"
-        q = q.join(Job).filter(
-            (JobApplication.job_id == Job.id)
-            & ((Job.title.ilike(search_term)) | (Job.company.ilike(search_term)))
-        ).distinct()
-    if sort == "-applied_at":
-        q = q.order_by(JobApplication.applied_at.desc())
-    elif sort == "applied_at":
-        q = q.order_by(JobApplication.applied_at.asc())
-    apps = q.all()
-    return [
-        ApplicationListResponse(
-            id=app.id,
-            job_id=app.job_id,
-            applied_at=app.applied_at,
-            status=app.status,
-            created_at=app.created_at,
-            source_url=app.job.source_url,
-            title=app.job.title,
-            company=app.job.company,
-            source_domain=app.job.source_domain,
+        matches = search_applications(db, search, user.id)
+        if matches is None:
+            return []
+        q = q.join(matches, matches.c.app_id == JobApplication.id)
+    by_relevance = matches is not None and sort == "relevance"
+    ascending = sort == "applied_at"
+    try:
+        if by_relevance:
+            q = q.add_columns(matches.c.score)
+            if cursor:
+                q = q.where(tuple_(matches.c.score, JobApplication.id) < tuple_(*decode_rank_cursor(cursor)))
+            q = q.order_by(matches.c.score.desc(), JobApplication.id.desc())
+        else:
+            key = tuple_(JobApplication.applied_at, JobApplication.id)
+            if cursor:
+                after = tuple_(*decode_cursor(cursor))
+                q = q.where(key > after if ascending else key < after)
+            if ascending:
+                q = q.order_by(JobApplication.applied_at.asc(), JobApplication.id.asc())
+            else:
+                q = q.order_by(JobApplication.applied_at.desc(), JobApplication.id.desc())
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if limit is None and cursor is None:
+        # No paging asked for (the web app): every row
+        rows = (await db.execute(q)).all()
+        return fast_json([dict(zip(LIST_FIELDS, row)) for row in rows], response)
+    limit = limit or DEFAULT_PAGE_SIZE
+    # Fetch one extra row to know whether another page exists
+    result = await db.execute(q.limit(limit + 1))
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if has_more:
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = (
+            encode_rank_cursor(last.score, last.id) if by_relevance else encode_cursor(last.applied_at, last.id)
         )
-        for app in apps
-    ]
+    # zip() stops at the list fields, dropping the relevance score
+    return fast_json([dict(zip(LIST_FIELDS, row)) for row in rows], response)
 
 
-ACTIVE_STATUSES = ("applied", "in_progress")
+@router.get("/export")
+async def export_applications(
+    user: Annotated[User, Depends(get_current_user)],
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    notes: bool = Query(False),
+    sessions: bool = Query(False),
+):
+    """Stream all of the user's applications as CSV (importable again via /import) or NDJSON,
+    optionally with notes and interview sessions. Memory use does not grow with the row count."""
+    return StreamingResponse(
+        export.stream(format, user.id, notes=notes, sessions=sessions),
+        media_type=export.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="applications.{format}"'},
+    )
 
 
 @router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
-def create_application(
+async def create_application(
     user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     body: ApplicationCreate,
 ):
-    job = get_or_create_job(
+    """One transaction of single-statement writes: Job upsert, application insert, rollup upsert
+    and in-place counter update. The response is built from what those return."""
+    job = await upsert_job(
         db,
         source_url=body.source_url,
         title=body.title,
@@ -116,94 +218,178 @@ def create_application(
         description=body.description,
         source_domain=body.source_domain,
     )
-    existing = (
-        db.query(JobApplication)
-        .filter(
-            JobApplication.user_id == user.id,
-            JobApplication.job_id == job.id,
-            JobApplication.status.in_(ACTIVE_STATUSES),
-        )
-        .first()
-    )
-    if existing:
+    # ACTIVE_INDEX rejects a second active application for the job: no check query, no race
+    try:
+        row = (
+            await db.execute(
+                insert(JobApplication)
+                .values(user_id=user.id, job_id=job.id, applied_at=body.applied_at, status=body.status)
+                .returning(JobApplication.id, JobApplication.created_at, JobApplication.updated_at)
+            )
+        ).one()
+    except IntegrityError as exc:
+        _raise_if_active_conflict(exc)
+        raise
+    if needs_enrichment(job):
+        # Don't make the user wait on the job site; a fetch worker fills the Job in later
+        await enqueue_job_fetch(db, job.id)
+    deltas = activity.new_deltas()
+    activity.count(deltas, user.id, body.applied_at, job.source_url, body.status)
+    await activity.apply(db, deltas)
+    # Passed job fields may have changed a shared job: bump everyone on it (this user included)
+    job_changed = any(v is not None for v in (body.title, body.company, body.description, body.source_domain))
+    bump = data_version.bump_job_users(job.id) if job_changed else data_version.bump_users(user.id)
+    counts = user_stats.new_counts()
+    user_stats.count_change(counts, None, body.status)
+    await db.execute(user_stats.add_counts(bump, counts, user.id))
+    await db.commit()
+    payload = {
+        "id": row.id,
+        "user_id": user.id,
+        "job_id": job.id,
+        "applied_at": body.applied_at,
+        "status": body.status,
+        "notes": None,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "job": job._asdict(),
+        "interview_sessions": [],
+    }
+    return fast_json(payload, status_code=status.HTTP_201_CREATED)
+
+
+_IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@router.post("/import", response_model=ImportResult)
+async def import_applications(
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    request: Request,
+    format: Literal["csv", "ndjson"] | None = Query(None),
+):
+    """Create many applications from a CSV (header row with source_url, applied_at and optionally
+    status, notes, title, company, location, source_domain) or NDJSON body, streamed rather than
+    read whole. Format comes from `format` or the Content-Type. Invalid rows, and rows that would
+    duplicate an active application, are skipped and reported by row number; the rest commit together.
+    """
+    fmt = format or _IMPORT_CONTENT_TYPES.get(request.headers.get("content-type", "").split(";")[0].strip().lower())
+    if fmt is None:
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="You already have an active application for this job (Applied or In progress). Update the existing one or set its status to Done/Rejected first.",
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or pass format=csv|ndjson",
         )
-    app = JobApplication(
-        user_id=user.id,
-        job_id=job.id,
-        applied_at=body.applied_at,
-        status=body.status,
-    )
-    db.add(app)
-    u = db.query(User).filter(User.id == user.id).first()
-    if u:
-        u.total_applied = (u.total_applied or 0) + 1
-    db.commit()
-    db.refresh(app)
-    app = (
-        db.query(JobApplication)
-        .options(
-            joinedload(JobApplication.job),
-            joinedload(JobApplication.interview_sessions),
-        )
-        .filter(JobApplication.id == app.id)
-        .first()
+    try:
+        return await bulk_import.import_applications(db, user.id, bulk_import.parse(fmt, request.stream()))
+    except bulk_import.TooManyRows as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc))
+    except bulk_import.InvalidUpload as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except IntegrityError as exc:
+        # A concurrent request created an active application the import's check had not seen
+        _raise_if_active_conflict(exc)
+        raise
+
+
+@router.patch("/bulk", response_model=ApplicationBulkUpdateResult)
+async def bulk_update_applications(
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    body: ApplicationBulkUpdate,
+):
+    """Set applied_at/status/notes on many of the user's applications with one UPDATE. Counters
+    and rollups follow the actual transitions, as if each row went through update_application."""
+    changes = body.model_dump(include={"applied_at", "status", "notes"}, exclude_none=True)
+    if not changes:
+        raise HTTPException(status_code=400, detail="Nothing to update")
+    ids = list(dict.fromkeys(body.ids))
+    # Old values decide the counters; the row locks (Postgres) keep them current until commit
+    result = await db.execute(
+        select(JobApplication.id, JobApplication.applied_at, JobApplication.status, Job.source_url)
+        .join(Job, Job.id == JobApplication.job_id)
+        .where(JobApplication.id.in_(ids), JobApplication.user_id == user.id)
+        .with_for_update(of=JobApplication)
     )
-    return _to_response(app)
+    rows = result.all()
+    found = [row.id for row in rows]
+    if found:
+        try:
+            await db.execute(
+                update(JobApplication)
+                .where(JobApplication.id.in_(found), JobApplication.user_id == user.id)
+                .values(changes)
+                .execution_options(synchronize_session=False)
+            )
+        except IntegrityError as exc:
+            _raise_if_active_conflict(exc)
+            raise
+        deltas = activity.new_deltas()
+        counts = user_stats.new_counts()
+        for row in rows:
+            after = (changes.get("applied_at", row.applied_at), changes.get("status", row.status))
+            activity.count_change(deltas, user.id, row.source_url, (row.applied_at, row.status), after)
+            user_stats.count_change(counts, row.status, after[1])
+        await activity.apply(db, deltas)
+        await db.execute(user_stats.add_counts(data_version.bump_users(user.id), counts))
+        await db.commit()
+    missing = set(ids).difference(found)
+    return ApplicationBulkUpdateResult(updated=found, not_found=[i for i in ids if i in missing])
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
-def get_application(
+async def get_application(
     application_id: int,
     user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    request: Request,
+    response: Response,
 ):
-    app = (
-        db.query(JobApplication)
+    result = await db.execute(
+        select(JobApplication)
         .options(
-            joinedload(JobApplication.job),
+            _JOB_WITH_DESCRIPTION,
             joinedload(JobApplication.interview_sessions),
         )
-        .filter(JobApplication.id == application_id, JobApplication.user_id == user.id)
-        .first()
+        .where(JobApplication.id == application_id, JobApplication.user_id == user.id)
     )
+    app = result.unique().scalar_one_or_none()
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
-    return _to_response(app)
+    # After the lookup: an id that is not (or no longer) the user's is 404, never 304
+    await check_etag(request, response, db, user.id)
+    return fast_json(_to_payload(app), response)
 
 
 @router.patch("/{application_id}", response_model=ApplicationResponse)
-def update_application(
+async def update_application(
     application_id: int,
     user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     body: ApplicationUpdate,
 ):
-    app = (
-        db.query(JobApplication)
-        .options(joinedload(JobApplication.job), joinedload(JobApplication.interview_sessions))
-        .filter(JobApplication.id == application_id, JobApplication.user_id == user.id)
-        .first()
+    result = await db.execute(
+        select(JobApplication)
+        .options(_JOB_WITH_DESCRIPTION, joinedload(JobApplication.interview_sessions))
+        .where(JobApplication.id == application_id, JobApplication.user_id == user.id)
     )
+    app = result.unique().scalar_one_or_none()
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
+    before = (app.applied_at, app.status)
     if body.applied_at is not None:
         app.applied_at = body.applied_at
     if body.status is not None:
-        old_status = app.status
         app.status = body.status
-        if old_status != body.status:
-            u = db.query(User).filter(User.id == user.id).first()
-            if u:
-                if body.status == "rejected":
-                    u.total_rejected = (u.total_rejected or 0) + 1
-                elif body.status == "got_offer":
-                    u.total_success = (u.total_success or 0) + 1
     if body.notes is not None:
         app.notes = body.notes
-    if body.title is not None or body.company is not None or body.description is not None or body.location is not None or body.source_domain is not None:
+    job_changed = any(
+        v is not None for v in (body.title, body.company, body.description, body.location, body.source_domain)
+    )
+    if job_changed:
         job = app.job
         if body.title is not None:
             job.title = body.title
@@ -215,21 +401,33 @@ def update_application(
             job.location = body.location
         if body.source_domain is not None:
             job.source_domain = body.source_domain
-    db.commit()
-    db.refresh(app)
-    return _to_response(app)
+    deltas = activity.new_deltas()
+    activity.count_change(deltas, user.id, app.job.source_url, before, (app.applied_at, app.status))
+    await activity.apply(db, deltas)
+    counts = user_stats.new_counts()
+    user_stats.count_change(counts, before[1], app.status)
+    # The job is shared: everyone who applied to it sees the edit
+    bump = data_version.bump_job_users(app.job_id) if job_changed else data_version.bump_users(user.id)
+    await db.execute(user_stats.add_counts(bump, counts, user.id))
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        _raise_if_active_conflict(exc)
+        raise
+    await db.refresh(app)
+    return fast_json(_to_payload(app))
 
 
 @router.post("/{application_id}/sessions", response_model=InterviewSessionResponse, status_code=status.HTTP_201_CREATED)
-def create_session(
+async def create_session(
     application_id: int,
     user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     body: InterviewSessionCreate,
 ):
-    app = db.query(JobApplication).filter(
-        JobApplication.id == application_id, JobApplication.user_id == user.id
-    ).first()
+    app = await db.scalar(
+        select(JobApplication).where(JobApplication.id == application_id, JobApplication.user_id == user.id)
+    )
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
     if app.status not in ("applied", "in_progress"):
@@ -239,6 +437,7 @@ def create_session(
         )
     session = InterviewSession(
         job_application_id=app.id,
+        user_id=app.user_id,
         name=body.name,
         scheduled_at=body.scheduled_at,
         sort_order=body.sort_order or 0,
@@ -247,8 +446,13 @@ def create_session(
     db.add(session)
     if app.status == "applied":
         app.status = "in_progress"
-    db.commit()
-    db.refresh(session)
+        deltas = activity.new_deltas()
+        source_url = await db.scalar(select(Job.source_url).where(Job.id == app.job_id))
+        activity.count_change(deltas, user.id, source_url, (app.applied_at, "applied"), (app.applied_at, "in_progress"))
+        await activity.apply(db, deltas)
+    await db.execute(data_version.bump_users(user.id))
+    await db.commit()
+    await db.refresh(session)
     return InterviewSessionResponse(
         id=session.id,
         job_application_id=session.job_application_id,
@@ -260,22 +464,21 @@ def create_session(
 
 
 @router.patch("/{application_id}/sessions/{session_id}", response_model=InterviewSessionResponse)
-def update_session(
+async def update_session(
     application_id: int,
     session_id: int,
     user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     body: InterviewSessionUpdate,
 ):
-    session = (
-        db.query(InterviewSession)
+    session = await db.scalar(
+        select(InterviewSession)
         .join(JobApplication)
-        .filter(
+        .where(
             InterviewSession.id == session_id,
             InterviewSession.job_application_id == application_id,
             JobApplication.user_id == user.id,
         )
-        .first()
     )
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -287,8 +490,9 @@ def update_session(
         session.sort_order = body.sort_order
     if body.notes is not None:
         session.notes = body.notes
-    db.commit()
-    db.refresh(session)
+    await db.execute(data_version.bump_users(user.id))
+    await db.commit()
+    await db.refresh(session)
     return InterviewSessionResponse(
         id=session.id,
         job_application_id=session.job_application_id,
@@ -300,23 +504,23 @@ def update_session(
 
 
 @router.delete("/{application_id}/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_session(
+async def delete_session(
     application_id: int,
     session_id: int,
     user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
-    session = (
-        db.query(InterviewSession)
+    session = await db.scalar(
+        select(InterviewSession)
         .join(JobApplication)
-        .filter(
+        .where(
             InterviewSession.id == session_id,
             InterviewSession.job_application_id == application_id,
             JobApplication.user_id == user.id,
         )
-        .first()
     )
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    db.delete(session)
-    db.commit()
+    await db.delete(session)
+    await db.execute(data_version.bump_users(user.id))
+    await db.commit()
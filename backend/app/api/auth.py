@@ -2,13 +2,13 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
-from authlib.integrations.httpx_client import AsyncOAuth2Client
-from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from authlib.oauth2.rfc6749.parameters import prepare_grant_uri
 
 from app.api.deps import get_current_user
+from app.core import outbound
 from app.core.config import get_settings
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.core.security import create_access_token
 from app.models.user import User
 from app.schemas.user import TokenResponse, UserResponse
@@ -32,14 +32,14 @@ class DevLoginBody(BaseModel):
 
 
 @router.post("/dev-login", response_model=TokenResponse)
-def dev_login(
+async def dev_login(
     body: DevLoginBody,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """Create or get a user and return JWT. Only if ADMIN_EMAILS is set (dev mode)."""
     if not settings.admin_emails_list:
         raise HTTPException(status_code=404, detail="Dev login disabled")
-    user = get_or_create_user(
+    user = await get_or_create_user(
         db,
         email=body.email.strip().lower(),
         name="Dev User",
@@ -52,7 +52,7 @@ def dev_login(
 
 
 @router.get("/me", response_model=UserResponse)
-def me(user: Annotated[User, Depends(get_current_user)]):
+async def me(user: Annotated[User, Depends(get_current_user)]):
     return user_to_response(user)
 
 
@@ -65,14 +65,11 @@ def _backend_callback_url() -> str:
 def google_login():
     if not settings.google_client_id:
         raise HTTPException(status_code=503, detail="Google login not configured")
-    redirect_uri = _backend_callback_url()
-    client = AsyncOAuth2Client(
-        client_id=settings.google_client_id,
-        client_secret=settings.google_client_secret,
-        redirect_uri=redirect_uri,
-    )
-    url, _ = client.create_authorization_url(
+    url = prepare_grant_uri(
         GOOGLE_AUTHORIZE,
+        client_id=settings.google_client_id,
+        response_type="code",
+        redirect_uri=_backend_callback_url(),
         scope="openid email profile",
         state="google",
     )
@@ -83,53 +80,64 @@ def google_login():
 def linkedin_login():
     if not settings.linkedin_client_id or not (settings.linkedin_client_secret or "").strip():
         raise HTTPException(status_code=503, detail="LinkedIn login not configured")
-    redirect_uri = _backend_callback_url()
-    # LinkedIn token endpoint expects client_secret in POST body, not Basic auth
-    client = AsyncOAuth2Client(
-        client_id=settings.linkedin_client_id,
-        client_secret=settings.linkedin_client_secret,
-        redirect_uri=redirect_uri,
-        token_endpoint_auth_method="client_secret_post",
-    )
-    url, _ = client.create_authorization_url(
+    url = prepare_grant_uri(
         LINKEDIN_AUTHORIZE,
+        client_id=settings.linkedin_client_id,
+        response_type="code",
+        redirect_uri=_backend_callback_url(),
         scope="openid profile email",
         state="linkedin",
     )
     return RedirectResponse(url=url)
 
 
+async def _exchange_code(token_url: str, *, code: str, redirect_uri: str, client_id: str, client_secret: str) -> dict:
+    """Authorization-code token exchange with client credentials in the POST body (client_secret_post)."""
+    http = outbound.get_client(outbound.AUTH)
+    resp = await http.post(
+        token_url,
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": redirect_uri,
+            "client_id": client_id,
+            "client_secret": client_secret,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+async def _fetch_userinfo(userinfo_url: str, access_token: str) -> dict:
+    http = outbound.get_client(outbound.AUTH)
+    r = await http.get(userinfo_url, headers={"Authorization": f"Bearer {access_token}"})
+    r.raise_for_status()
+    return r.json()
+
+
 @router.get("/callback")
 async def auth_callback(
     code: str,
     state: str,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     redirect_uri = _backend_callback_url()
     if state == "google":
         if not settings.google_client_id:
             raise HTTPException(status_code=503, detail="Google login not configured")
-        client = AsyncOAuth2Client(
-            client_id=settings.google_client_id,
-            client_secret=settings.google_client_secret,
-            redirect_uri=redirect_uri,
-        )
-        token = await client.fetch_token(
+        token = await _exchange_code(
             GOOGLE_TOKEN,
             code=code,
             redirect_uri=redirect_uri,
+            client_id=settings.google_client_id,
+            client_secret=settings.google_client_secret,
         )
-        async with AsyncClient() as http:
-            r = await http.get(
-                GOOGLE_USERINFO,
-                headers={"Authorization": f"Bearer {token['access_token']}"},
-            )
-            r.raise_for_status()
-            data = r.json()
+        data = await _fetch_userinfo(GOOGLE_USERINFO, token["access_token"])
         email = data.get("email")
         if not email:
             raise HTTPException(status_code=400, detail="Email not provided by Google")
-        user = get_or_create_user(
+        user = await get_or_create_user(
             db,
             email=email,
             name=data.get("name"),
@@ -144,31 +152,19 @@ async def auth_callback(
                 status_code=503,
                 detail="LinkedIn client secret not set. Set LINKEDIN_CLIENT_SECRET on Render Environment.",
             )
-        # LinkedIn requires client_id and client_secret in POST body; do token exchange explicitly
-        async with AsyncClient() as http:
-            token_resp = await http.post(
-                LINKEDIN_TOKEN,
-                data={
-                    "grant_type": "authorization_code",
-                    "code": code,
-                    "redirect_uri": redirect_uri,
-                    "client_id": settings.linkedin_client_id,
-                    "client_secret": secret,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            token_resp.raise_for_status()
-            token = token_resp.json()
-            r = await http.get(
-                LINKEDIN_USERINFO,
-                headers={"Authorization": f"Bearer {token['access_token']}"},
-            )
-            r.raise_for_status()
-            data = r.json()
+        # LinkedIn requires client_id and client_secret in POST body
+        token = await _exchange_code(
+            LINKEDIN_TOKEN,
+            code=code,
+            redirect_uri=redirect_uri,
+            client_id=settings.linkedin_client_id,
+            client_secret=secret,
+        )
+        data = await _fetch_userinfo(LINKEDIN_USERINFO, token["access_token"])
         email = data.get("email")
         if not email:
             raise HTTPException(status_code=400, detail="Email not provided by LinkedIn")
-        user = get_or_create_user(
+        user = await get_or_create_user(
             db,
             email=email,
             name=data.get("name"),
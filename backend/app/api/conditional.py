@@ -0,0 +1,43 @@
+"""ETag / If-None-Match for per-user read endpoints.
+
+The ETag combines the user id, users.data_version and any extra inputs the response depends on
+(query string, today's date). Checking it costs one primary-key lookup, so an unchanged poll is
+answered 304 before the real query runs or anything is serialized.
+"""
+import zlib
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services import data_version
+
+CACHE_CONTROL = "private, no-cache"  # browsers may store it but must revalidate every time
+
+
+def make_etag(user_id: int, version: int, *extra: object) -> str:
+    digest = zlib.crc32("|".join(map(str, extra)).encode()) if extra else 0
+    return f'W/"{user_id}-{version}-{digest:08x}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" match
+    wanted = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == wanted for tag in if_none_match.split(","))
+
+
+def ensure_modified(request: Request, response: Response, etag: str) -> None:
+    """Raise 304 Not Modified when the client's copy is current; otherwise set ETag on ``response``."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+
+async def check_etag(request: Request, response: Response, db: AsyncSession, user_id: int, *extra: object) -> None:
+    """ensure_modified() for a response that depends on the user's data, the URL and ``extra``."""
+    version = await db.scalar(data_version.current(user_id)) or 0
+    ensure_modified(request, response, make_etag(user_id, version, request.url.path, request.url.query, *extra))
@@ -1,27 +1,34 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.conditional import check_etag, ensure_modified, make_etag
 from app.api.deps import get_current_user
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.models.user import User
 from app.models.application import JobApplication, InterviewSession
 from app.models.job import Job
+from app.services import activity
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
 
 @router.get("/stats")
-def dashboard_stats(
+async def dashboard_stats(
     user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    request: Request,
+    response: Response,
 ):
-    """Return cumulative job stats stored on the user (total_applied, total_rejected, total_success)."""
-    u = db.query(User).filter(User.id == user.id).first()
+    """Return the job stats stored on the user: applications, currently rejected, currently with an offer
+    (total_applied, total_rejected, total_success; see app.services.user_stats)."""
+    u = await db.get(User, user.id)
     if not u:
         return {"applied": 0, "rejected": 0, "success": 0}
+    ensure_modified(request, response, make_etag(u.id, u.data_version, request.url.path))
     return {
         "applied": u.total_applied or 0,
         "rejected": u.total_rejected or 0,
@@ -29,36 +36,61 @@ def dashboard_stats(
     }
 
 
+@router.get("/timeseries")
+async def timeseries(
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    request: Request,
+    response: Response,
+    days: int = Query(90, ge=1, le=730),
+    bucket: str = Query("day", pattern="^(day|week)$"),
+):
+    """Applications per day/week, status funnel and response rate by domain over the last ``days``
+    (by applied date). Reads only the activity_daily rollups."""
+    end = datetime.now(timezone.utc).date()
+    await check_etag(request, response, db, user.id, end)
+    return await activity.timeseries(db, user.id, end - timedelta(days=days - 1), end, bucket)
+
+
 @router.get("/upcoming-interviews")
-def upcoming_interviews(
+async def upcoming_interviews(
     user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    request: Request,
+    response: Response,
     limit: int = Query(5, ge=1, le=50),
 ):
     now = datetime.now(timezone.utc)
-    sessions = (
-        db.query(InterviewSession)
-        .join(JobApplication)
-        .options(joinedload(InterviewSession.application).joinedload(JobApplication.job))
-        .filter(
-            JobApplication.user_id == user.id,
-            InterviewSession.scheduled_at.isnot(None),
+    # Interviews drop off the list as time passes, so the ETag also changes every minute
+    await check_etag(request, response, db, user.id, now.strftime("%Y-%m-%dT%H:%M"))
+    # Range scan on ix_interview_sessions_user_scheduled_at; the joins are primary-key lookups
+    # for at most ``limit`` rows, and only the columns in the response are selected
+    rows = await db.execute(
+        select(
+            InterviewSession.id,
+            InterviewSession.name,
+            InterviewSession.scheduled_at,
+            InterviewSession.job_application_id,
+            Job.title,
+            Job.company,
+        )
+        .join(JobApplication, JobApplication.id == InterviewSession.job_application_id)
+        .join(Job, Job.id == JobApplication.job_id)
+        .where(
+            InterviewSession.user_id == user.id,
             InterviewSession.scheduled_at >= now,
         )
         .order_by(InterviewSession.scheduled_at.asc())
         .limit(limit)
-        .all()
     )
-    out = []
-    for s in sessions:
-        app = s.application
-        job = app.job
-        out.append({
-            "application_id": app.id,
-            "session_id": s.id,
-            "session_name": s.name,
-            "scheduled_at": s.scheduled_at.isoformat() if s.scheduled_at else None,
-            "job_title": job.title if job else None,
-            "company": job.company if job else None,
-        })
-    return out
+    return [
+        {
+            "application_id": row.job_application_id,
+            "session_id": row.id,
+            "session_name": row.name,
+            "scheduled_at": row.scheduled_at.isoformat(),
+            "job_title": row.title,
+            "company": row.company,
+        }
+        for row in rows
+    ]
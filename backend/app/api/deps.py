@@ -2,32 +2,37 @@ from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import decode_access_token
+from app.core.database import get_async_db
 from app.models.user import User
+from app.services import principal_cache
 
 security = HTTPBearer(auto_error=False)
 
 
-def get_current_user_optional(
+async def get_current_user_optional(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> User | None:
     if not credentials:
         return None
-    payload = decode_access_token(credentials.credentials)
-    if not payload or "sub" not in payload:
+    user_id = principal_cache.token_user_id(credentials.credentials)
+    if user_id is None:
         return None
-    user_id = payload.get("sub")
-    if not user_id:
-        return None
-    user = db.query(User).filter(User.id == int(user_id), User.is_active).first()
+    user = principal_cache.get_user(user_id)
+    if user is None:
+        user = await db.scalar(select(User).where(User.id == user_id, User.is_active))
+        if user is None:
+            return None
+        # Detach so handlers that load the user in this session get their own instance
+        db.expunge(user)
+        principal_cache.put_user(user)
     return user
 
 
-def get_current_user(
+async def get_current_user(
     user: Annotated[User | None, Depends(get_current_user_optional)],
 ) -> User:
     if user is None:
@@ -39,7 +44,7 @@ def get_current_user(
     return user
 
 
-def get_current_admin(
+async def get_current_admin(
     user: Annotated[User, Depends(get_current_user)],
 ) -> User:
     if not user.is_admin:
@@ -1,12 +1,18 @@
+import asyncio
+import json
+from collections import defaultdict
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel, HttpUrl
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, HttpUrl
 
 from app.api.deps import get_current_user
+from app.core.config import get_settings
 from app.models.user import User
-from app.services.job_fetch import fetch_job_from_url
+from app.services.job_fetch import canonicalize_url, extract_domain, fetch_job_from_url
 
+settings = get_settings()
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
 
@@ -14,6 +20,10 @@ class FetchJobBody(BaseModel):
     url: HttpUrl
 
 
+class FetchJobBatchBody(BaseModel):
+    urls: list[HttpUrl] = Field(..., min_length=1, max_length=500)
+
+
 @router.post("/fetch")
 async def fetch_job(
     body: FetchJobBody,
@@ -21,3 +31,38 @@ async def fetch_job(
 ):
     result = await fetch_job_from_url(str(body.url))
     return result
+
+
+@router.post("/fetch-batch")
+async def fetch_job_batch(
+    body: FetchJobBatchBody,
+    user: Annotated[User, Depends(get_current_user)],
+):
+    """Fetch many job URLs concurrently and stream one NDJSON line per unique (canonical) URL
+    as soon as it completes. Each line is the fetch result plus `url` and the `inputs` that
+    canonicalized to it."""
+    inputs: dict[str, list[str]] = {}
+    for raw in body.urls:
+        inputs.setdefault(canonicalize_url(str(raw)), []).append(str(raw))
+
+    overall = asyncio.Semaphore(settings.fetch_batch_concurrency)
+    per_domain: dict[str | None, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(settings.fetch_batch_per_domain)
+    )
+
+    async def fetch_one(url: str) -> dict:
+        async with overall, per_domain[extract_domain(url)]:
+            result = await fetch_job_from_url(url)
+        return {"url": url, "inputs": inputs[url], **result}
+
+    async def stream():
+        tasks = [asyncio.create_task(fetch_one(url)) for url in inputs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield json.dumps(await next_done) + "\n"
+        finally:
+            # Client went away or we are done: stop any fetches still waiting or running
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
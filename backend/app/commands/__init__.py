@@ -0,0 +1 @@
+# One-off maintenance commands (python -m app.commands.<name>)
@@ -0,0 +1,33 @@
+"""Recompute the activity_daily rollups from job_applications.
+
+    python -m app.commands.rebuild_activity              # every user
+    python -m app.commands.rebuild_activity --user-id 42
+
+Rollups are kept current on every write; run this after migration 009, after bulk data fixes,
+or if they drift. Each run replaces the selected rows in one transaction.
+"""
+import argparse
+import logging
+
+from app.core.database import SessionLocal
+from app.services.activity import rebuild
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild per-user daily activity rollups.")
+    parser.add_argument("--user-id", type=int, default=None, help="Only rebuild this user's rollups")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    db = SessionLocal()
+    try:
+        written = rebuild(db, user_id=args.user_id, batch_size=args.batch_size)
+    finally:
+        db.close()
+    logger.info("rebuilt %d activity rollup rows", written)
+
+
+if __name__ == "__main__":
+    main()
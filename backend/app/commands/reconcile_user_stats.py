@@ -0,0 +1,33 @@
+"""Recompute users' statistics counters (total_applied/rejected/success) from job_applications.
+
+    python -m app.commands.reconcile_user_stats              # every user
+    python -m app.commands.reconcile_user_stats --user-id 42
+
+Writes keep the counters current with in-place increments; run this after bulk data fixes, once
+after upgrading (earlier versions counted status transitions rather than current statuses), or
+on a schedule to catch drift. Only users whose counters differ are updated.
+"""
+import argparse
+import logging
+
+from app.core.database import SessionLocal
+from app.services.user_stats import reconcile
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reconcile per-user statistics counters.")
+    parser.add_argument("--user-id", type=int, default=None, help="Only reconcile this user")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    db = SessionLocal()
+    try:
+        fixed = reconcile(db, user_id=args.user_id)
+    finally:
+        db.close()
+    logger.info("corrected statistics counters of %d users", fixed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""CORS as a single pure-ASGI middleware.
+
+Preflight (any OPTIONS request) is answered here and never reaches the router. Other responses
+get the CORS headers added to their start message when the Origin is allowed. Header lists are
+built once, and the allow decision is memoized per Origin value.
+"""
+import re
+from functools import lru_cache
+from typing import Iterable
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Allow these origins for CORS (and regex for *.vercel.app)
+_LOCAL_ORIGINS = ("http://localhost:3000", "http://127.0.0.1:3000")
+_CORS_ORIGIN_REGEX = re.compile(r"^https://[a-z0-9-]+\.vercel\.app$", re.I)
+
+
+def cors_allow_origin(origin: str | None) -> str | None:
+    if not origin:
+        return None
+    if origin in _LOCAL_ORIGINS:
+        return origin
+    if settings.frontend_url and origin.strip() == settings.frontend_url.strip():
+        return origin
+    if _CORS_ORIGIN_REGEX.match(origin):
+        return origin
+    return None
+
+
+@lru_cache(maxsize=512)
+def _origin_allowed(origin: bytes) -> bool:
+    return cors_allow_origin(origin.decode("latin-1")) is not None
+
+
+class CORSMiddleware:
+    def __init__(self, app, expose_headers: Iterable[str] = (), max_age: int = 86400):
+        self.app = app
+        self._preflight = [
+            (b"access-control-max-age", str(max_age).encode()),
+            (b"access-control-allow-methods", b"GET, POST, PUT, PATCH, DELETE, OPTIONS"),
+            (b"access-control-allow-headers", b"*"),
+            (b"access-control-allow-credentials", b"true"),
+            (b"content-length", b"0"),
+        ]
+        self._simple = [(b"access-control-allow-credentials", b"true")]
+        if expose_headers:
+            self._simple.append((b"access-control-expose-headers", ", ".join(expose_headers).encode()))
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        origin = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+                break
+        allowed = origin is not None and _origin_allowed(origin)
+
+        if scope["method"] == "OPTIONS":
+            headers = self._preflight
+            if allowed:
+                headers = [*headers, (b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                for i, (name, value) in enumerate(headers):
+                    if name.lower() == b"vary":
+                        headers[i] = (name, value + b", Origin")
+                        break
+                else:
+                    headers.append((b"vary", b"Origin"))
+                headers.append((b"access-control-allow-origin", origin))
+                headers.extend(self._simple)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
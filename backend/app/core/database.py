@@ -1,24 +1,144 @@
+import threading
+import time
+
 from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+_is_sqlite = settings.database_url.startswith("sqlite")
+
 # SQLite needs check_same_thread=False for FastAPI
 connect_args = {}
-if settings.database_url.startswith("sqlite"):
+if _is_sqlite:
     connect_args["check_same_thread"] = False
 
+
+class PoolStats:
+    """Checkout counters for one engine's pool; wait time covers queueing for a slot and connecting."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool: Pool) -> dict:
+        with self._lock:
+            done = self.checkouts or 1
+            out = {
+                "pool": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total / done * 1000, 3),
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+        if isinstance(pool, QueuePool):
+            out.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+            )
+        return out
+
+
+class _TimedCheckout:
+    """Pool mixin that times every checkout from the pool's own queue."""
+
+    stats: PoolStats
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.record_timeout()
+            raise
+        self.stats.record(time.perf_counter() - started)
+        return conn
+
+
+def _timed_pool(base: type[Pool], stats: PoolStats) -> type[Pool]:
+    # A subclass per engine: Pool.recreate() (on dispose) rebuilds from self.__class__ and keeps the stats
+    return type(f"Timed{base.__name__}", (_TimedCheckout, base), {"stats": stats})
+
+
+def _pool_options(base: type[Pool], stats: PoolStats) -> dict:
+    if _is_sqlite:
+        return {}
+    return {
+        "poolclass": _timed_pool(base, stats),
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+sync_pool_stats = PoolStats()
+async_pool_stats = PoolStats()
+
+# Sync engine: Alembic, scripts and the background worker
 engine = create_engine(
     settings.database_url,
     connect_args=connect_args,
     echo=False,
+    **_pool_options(QueuePool, sync_pool_stats),
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL to its asyncio driver (asyncpg / aiosqlite)."""
+    scheme, sep, rest = url.partition("://")
+    driver = scheme.split("+")[0]
+    if driver in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    if driver == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    return url
+
+
+# Async engine: API request handlers, so a request waiting on the database holds no thread
+async_engine = create_async_engine(
+    async_database_url(settings.database_url),
+    echo=False,
+    **_pool_options(AsyncAdaptedQueuePool, async_pool_stats),
+)
+
+# expire_on_commit=False: attributes stay readable after commit without an implicit (sync) reload
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+def pool_stats() -> dict:
+    return {
+        "async": async_pool_stats.snapshot(async_engine.pool),
+        "sync": sync_pool_stats.snapshot(engine.pool),
+    }
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -29,3 +149,10 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Request-scoped session. Its connection is checked out on the first query, not here, and
+    goes back to the pool at commit/rollback or when the request ends; a request that never queries holds none."""
+    async with AsyncSessionLocal() as db:
+        yield db
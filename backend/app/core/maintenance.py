@@ -0,0 +1,34 @@
+"""Maintenance-mode gate as a pure-ASGI middleware.
+
+While ``enabled()`` is true, API requests get 503 except health checks, auth (so admins can sign
+in) and the admin API (so maintenance can be switched off). ``enabled`` must be cheap: it runs on
+every request (app.services.site_settings.maintenance_enabled reads the in-process snapshot).
+"""
+import json
+from typing import Callable
+
+EXEMPT_PREFIXES = ("/api/health", "/api/auth/", "/api/admin/")
+
+_BODY = json.dumps({"detail": "Service is under maintenance, please try again shortly"}).encode()
+_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_BODY)).encode()),
+    (b"retry-after", b"60"),
+]
+
+
+class MaintenanceModeMiddleware:
+    def __init__(self, app, enabled: Callable[[], bool]):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not self.enabled():
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"]
+        if not path.startswith("/api/") or path.startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await send({"type": "http.response.start", "status": 503, "headers": _HEADERS})
+        await send({"type": "http.response.body", "body": _BODY})
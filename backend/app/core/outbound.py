@@ -0,0 +1,300 @@
+"""Shared outbound HTTP clients, owned by the app lifespan.
+
+One pooled ``httpx.AsyncClient`` per purpose ("fetch" for job pages, "auth" for OAuth providers)
+so TLS sessions and keep-alive connections are reused across requests, and a burst of job fetches
+can never take the sockets the login flow needs. Every request also goes through a per-host
+concurrency cap, and connections resolve hostnames through a small DNS cache.
+"""
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+
+import httpcore
+import httpx
+
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+FETCH = "fetch"
+AUTH = "auth"
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+class CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches host -> addresses lookups for ``ttl`` seconds.
+
+    Every address a lookup returns is kept and tried in order until one connects, like
+    httpcore does with the system resolver. Only the TCP connect target changes:
+    connection-pool keys, the Host header and TLS verification (SNI) all still use the
+    original hostname.
+    """
+
+    def __init__(self, inner: httpcore.AsyncNetworkBackend, ttl: float):
+        self._inner = inner
+        self.ttl = ttl
+        self._entries: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+    async def _resolve(self, host: str, port: int) -> list[str]:
+        if host == "localhost" or _is_ip(host):
+            return [host]
+        key = (host, port)
+        hit = self._entries.get(key)
+        if hit and hit[0] > time.monotonic():
+            return hit[1]
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError as exc:
+            # socket.gaierror and friends: surface as a connect failure, like httpcore's own lookup
+            raise httpcore.ConnectError(str(exc)) from exc
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._entries[key] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        addresses = await self._resolve(host, port)
+        for address in addresses:
+            try:
+                return await self._inner.connect_tcp(
+                    address, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                if address == addresses[-1]:
+                    # None answered; the host may have moved: resolve again on the next attempt
+                    self._entries.pop((host, port), None)
+                    raise
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._inner.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._inner.sleep(seconds)
+
+
+# httpcore exception -> the httpx one callers catch (most specific first along the MRO)
+_HTTPCORE_ERRORS = {
+    httpcore.ConnectTimeout: httpx.ConnectTimeout,
+    httpcore.ReadTimeout: httpx.ReadTimeout,
+    httpcore.WriteTimeout: httpx.WriteTimeout,
+    httpcore.PoolTimeout: httpx.PoolTimeout,
+    httpcore.TimeoutException: httpx.TimeoutException,
+    httpcore.ConnectError: httpx.ConnectError,
+    httpcore.ReadError: httpx.ReadError,
+    httpcore.WriteError: httpx.WriteError,
+    httpcore.NetworkError: httpx.NetworkError,
+    httpcore.ProxyError: httpx.ProxyError,
+    httpcore.UnsupportedProtocol: httpx.UnsupportedProtocol,
+    httpcore.LocalProtocolError: httpx.LocalProtocolError,
+    httpcore.RemoteProtocolError: httpx.RemoteProtocolError,
+    httpcore.ProtocolError: httpx.ProtocolError,
+}
+
+
+def _httpx_error(exc: Exception) -> Exception | None:
+    for cls in type(exc).__mro__:
+        if cls in _HTTPCORE_ERRORS:
+            return _HTTPCORE_ERRORS[cls](str(exc))
+    return None
+
+
+class _PoolStream(httpx.AsyncByteStream):
+    def __init__(self, stream):
+        self._stream = stream
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except Exception as exc:
+            mapped = _httpx_error(exc)
+            if mapped is None:
+                raise
+            raise mapped from exc
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class PoolTransport(httpx.AsyncBaseTransport):
+    """httpx transport over an ``httpcore.AsyncConnectionPool`` built by the caller, so the pool
+    gets its network backend through the public constructor (httpx.AsyncHTTPTransport does not
+    take one)."""
+
+    def __init__(self, pool: httpcore.AsyncConnectionPool):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        req = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        try:
+            resp = await self._pool.handle_async_request(req)
+        except Exception as exc:
+            mapped = _httpx_error(exc)
+            if mapped is None:
+                raise
+            raise mapped from exc
+        return httpx.Response(
+            status_code=resp.status,
+            headers=resp.headers,
+            stream=_PoolStream(resp.stream),
+            extensions=resp.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that frees the per-host slot once the body is consumed or closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Caps concurrent in-flight requests (and so connections) per host.
+
+    The slot is held until the response body has been read or closed, and waiting for a slot
+    longer than ``acquire_timeout`` raises httpx.PoolTimeout.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, per_host: int, acquire_timeout: float):
+        self._inner = inner
+        self._per_host = per_host
+        self._acquire_timeout = acquire_timeout
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    def _slot(self, host: str) -> asyncio.Semaphore:
+        slot = self._slots.get(host)
+        if slot is None:
+            slot = self._slots[host] = asyncio.Semaphore(self._per_host)
+        return slot
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        slot = self._slot(host)
+        try:
+            await asyncio.wait_for(slot.acquire(), timeout=self._acquire_timeout)
+        except asyncio.TimeoutError:
+            raise httpx.PoolTimeout(f"Too many concurrent requests to {host}", request=request)
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        response.stream = _ReleasingStream(response.stream, slot.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_client(
+    *,
+    max_connections: int,
+    per_host: int,
+    timeout: float,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    http2 = settings.outbound_http2
+    if http2 and not _http2_available():
+        logger.warning("OUTBOUND_HTTP2 is set but the h2 package is not installed; using HTTP/1.1")
+        http2 = False
+    inner = transport
+    if inner is None:
+        backend = None
+        if settings.outbound_dns_ttl_seconds > 0:
+            backend = CachingResolverBackend(httpcore.AnyIOBackend(), settings.outbound_dns_ttl_seconds)
+        inner = PoolTransport(
+            httpcore.AsyncConnectionPool(
+                ssl_context=httpx.create_ssl_context(),
+                max_connections=max_connections,
+                max_keepalive_connections=settings.outbound_max_keepalive,
+                keepalive_expiry=settings.outbound_keepalive_expiry,
+                http2=http2,
+                network_backend=backend,
+            )
+        )
+    return httpx.AsyncClient(
+        transport=HostLimitedTransport(inner, per_host, settings.outbound_pool_timeout),
+        follow_redirects=True,
+        timeout=httpx.Timeout(timeout, pool=settings.outbound_pool_timeout),
+    )
+
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _build(name: str) -> httpx.AsyncClient:
+    if name == AUTH:
+        return build_client(
+            max_connections=settings.outbound_auth_max_connections,
+            per_host=settings.outbound_auth_max_connections,
+            timeout=10.0,
+        )
+    return build_client(
+        max_connections=settings.outbound_max_connections,
+        per_host=settings.outbound_per_host_limit,
+        timeout=20.0,
+    )
+
+
+def get_client(name: str = FETCH) -> httpx.AsyncClient:
+    """Return the shared client for ``name``; created on first use when running outside the app lifespan."""
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        client = _clients[name] = _build(name)
+    return client
+
+
+async def startup() -> None:
+    for name in (FETCH, AUTH):
+        get_client(name)
+
+
+async def shutdown() -> None:
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,39 @@
+"""Fast JSON responses for trusted, already-shaped data.
+
+Returning a Response from an endpoint makes FastAPI skip response_model validation and
+jsonable_encoder, while the decorator's response_model still documents the schema in OpenAPI.
+Use FastJSONResponse only for payloads built from our own rows (plain dicts/lists of str, int,
+float, bool, None, date, datetime) whose shape already matches the declared response_model.
+Encodes with orjson when installed, otherwise pydantic-core's Rust encoder.
+"""
+from typing import Any
+
+import pydantic_core
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        # UTC datetimes as "...Z", like pydantic's own serializer
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    return pydantic_core.to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_json(content: Any, response: Response | None = None, status_code: int = 200) -> FastJSONResponse:
+    """FastJSONResponse carrying the headers already set on the endpoint's injected ``response``
+    (FastAPI only merges those into responses it builds itself)."""
+    out = FastJSONResponse(content, status_code=status_code)
+    if response is not None:
+        out.raw_headers.extend((k, v) for k, v in response.raw_headers if k != b"content-length")
+    return out
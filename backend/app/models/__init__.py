@@ -2,6 +2,9 @@ from app.models.user import User
 from app.models.job import Job
 from app.models.application import JobApplication, InterviewSession
 from app.models.settings import SiteSettings
+from app.models.fetch_cache import FetchCacheEntry
+from app.models.fetch_task import FetchTask
+from app.models.activity import ActivityDaily
 
 __all__ = [
     "User",
@@ -9,4 +12,7 @@ __all__ = [
     "JobApplication",
     "InterviewSession",
     "SiteSettings",
+    "FetchCacheEntry",
+    "FetchTask",
+    "ActivityDaily",
 ]
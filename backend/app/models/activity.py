@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Date, ForeignKey, Integer, String
+
+from app.core.database import Base
+
+
+class ActivityDaily(Base):
+    """Per-user rollup of applications by applied day and posting domain. Maintained by app.services.activity."""
+    __tablename__ = "activity_daily"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    source_domain = Column(String(255), primary_key=True, default="")  # "" when the URL has no host
+    applications = Column(Integer, nullable=False, default=0)
+    # The same applications split by their current status
+    status_applied = Column(Integer, nullable=False, default=0)
+    status_in_progress = Column(Integer, nullable=False, default=0)
+    status_done = Column(Integer, nullable=False, default=0)
+    status_rejected = Column(Integer, nullable=False, default=0)
+    status_got_offer = Column(Integer, nullable=False, default=0)
@@ -1,13 +1,31 @@
 from datetime import date, datetime
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 
+# A user may hold at most one application in these statuses per job (enforced by ACTIVE_INDEX)
+ACTIVE_STATUSES = ("applied", "in_progress")
+ACTIVE_INDEX = "uq_job_applications_active"
+_ACTIVE_WHERE = text("status IN ('applied', 'in_progress')")
+
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
+    __table_args__ = (
+        # Serves the keyset-paginated list: WHERE user_id = ? ORDER BY applied_at, id
+        Index("ix_job_applications_user_applied_at_id", "user_id", "applied_at", "id"),
+        # Makes a second active application for the same job an IntegrityError (the API's 409)
+        Index(
+            ACTIVE_INDEX,
+            "user_id",
+            "job_id",
+            unique=True,
+            postgresql_where=_ACTIVE_WHERE,
+            sqlite_where=_ACTIVE_WHERE,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -30,9 +48,15 @@ class JobApplication(Base):
 
 class InterviewSession(Base):
     __tablename__ = "interview_sessions"
+    __table_args__ = (
+        # Serves upcoming interviews: WHERE user_id = ? AND scheduled_at >= now ORDER BY scheduled_at
+        Index("ix_interview_sessions_user_scheduled_at", "user_id", "scheduled_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     job_application_id = Column(Integer, ForeignKey("job_applications.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Denormalized from the application (which never changes owner) so per-user queries skip the join
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
     scheduled_at = Column(DateTime(timezone=True), nullable=True)
     sort_order = Column(Integer, default=0, nullable=True)
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Integer, String
+
+from app.core.database import Base
+
+
+class FetchCacheEntry(Base):
+    """Persistent (tier-2) cache of parsed job pages, keyed by URL, with HTTP validators for revalidation."""
+    __tablename__ = "fetch_cache"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    url = Column(String(2048), unique=True, nullable=False, index=True)
+    etag = Column(String(512), nullable=True)
+    last_modified = Column(String(64), nullable=True)
+    result = Column(JSON, nullable=False)
+    fetched_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
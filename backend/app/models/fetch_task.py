@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, text
+
+from app.core.database import Base
+
+# A job has at most one pending or running task (enforced by QUEUED_INDEX)
+QUEUED_INDEX = "uq_fetch_tasks_queued_job"
+QUEUED_WHERE = text("status IN ('pending', 'running')")
+
+
+class FetchTask(Base):
+    """Queued background fetch that fills in a Job's metadata. Claimed by app.workers.fetch."""
+    __tablename__ = "fetch_tasks"
+    __table_args__ = (
+        # Serves the claim query: pending tasks due now, oldest first
+        Index("ix_fetch_tasks_status_next_attempt_at", "status", "next_attempt_at"),
+        # Target of enqueue's ON CONFLICT DO NOTHING: concurrent enqueues cannot queue a job twice
+        Index(QUEUED_INDEX, "job_id", unique=True, postgresql_where=QUEUED_WHERE, sqlite_where=QUEUED_WHERE),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    status = Column(String(16), default="pending", nullable=False)  # pending | running | done | failed
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    locked_by = Column(String(128), nullable=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from sqlalchemy import Column, DateTime, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 
@@ -14,7 +14,8 @@ class Job(Base):
     source_url = Column(String(2048), unique=True, nullable=False, index=True)
     title = Column(String(512), nullable=True)
     company = Column(String(255), nullable=True)
-    description = Column(Text, nullable=True)
+    # Up to 10k chars and only shown on detail views: load with undefer(Job.description)
+    description = deferred(Column(Text, nullable=True))
     location = Column(String(255), nullable=True)
     source_domain = Column(String(128), nullable=True)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
@@ -21,5 +21,7 @@ class User(Base):
     total_applied = Column(Integer, default=0, nullable=False)
     total_rejected = Column(Integer, default=0, nullable=False)
     total_success = Column(Integer, default=0, nullable=False)
+    # Bumped with every write to data the user sees (applications, sessions, their jobs); ETag source
+    data_version = Column(Integer, default=0, nullable=False)
 
     applications = relationship("JobApplication", back_populates="user", cascade="all, delete-orphan")
@@ -1,7 +1,7 @@
 from datetime import date, datetime
-from typing import List
+from typing import List, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # Job (shared) - from fetch or manual
@@ -69,6 +69,19 @@ class ApplicationUpdate(BaseModel):
     source_domain: str | None = None
 
 
+class ApplicationBulkUpdate(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=500)
+    applied_at: date | None = None
+    status: str | None = None
+    notes: str | None = None
+
+
+class ApplicationBulkUpdateResult(BaseModel):
+    updated: List[int]
+    # Requested ids that are not the user's applications
+    not_found: List[int]
+
+
 class ApplicationResponse(BaseModel):
     id: int
     user_id: int
@@ -98,3 +111,27 @@ class ApplicationListResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Bulk import (POST /api/applications/import): one CSV row / NDJSON line
+class ApplicationImportRow(BaseModel):
+    source_url: str = Field(..., max_length=2048)
+    applied_at: date
+    status: Literal["applied", "in_progress", "done", "rejected", "got_offer"] = "applied"
+    notes: str | None = None
+    title: str | None = Field(None, max_length=512)
+    company: str | None = Field(None, max_length=255)
+    location: str | None = Field(None, max_length=255)
+    source_domain: str | None = Field(None, max_length=128)
+
+
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+
+class ImportResult(BaseModel):
+    imported: int
+    failed: int
+    # The lowest-numbered failures by row (see bulk_import.MAX_REPORTED_ERRORS); `failed` has the full count
+    errors: List[ImportRowError]
@@ -0,0 +1,179 @@
+"""Per-user daily activity rollups (activity_daily) for dashboard analytics.
+
+Each application counts once in the row for (user, applied day, posting domain): in
+``applications`` and in the ``status_*`` column of its current status. Write paths send the
+changes as deltas, applied with one INSERT ... ON CONFLICT DO UPDATE that adds to the counters in
+the caller's transaction. Reads (timeseries) then only touch rollup rows, never job_applications.
+rebuild() recomputes rows from job_applications (python -m app.commands.rebuild_activity).
+"""
+from collections import defaultdict
+from datetime import date, timedelta
+from urllib.parse import urlparse
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.activity import ActivityDaily
+from app.models.application import JobApplication
+from app.models.job import Job
+
+STATUSES = ("applied", "in_progress", "done", "rejected", "got_offer")
+# Statuses that mean the employer answered
+RESPONDED = ("in_progress", "rejected", "got_offer")
+COUNTERS = ("applications",) + tuple(f"status_{s}" for s in STATUSES)
+
+RollupKey = tuple[int, date, str]
+Deltas = dict[RollupKey, dict[str, int]]
+
+
+def rollup_domain(source_url: str | None) -> str:
+    """Host of the posting URL without "www." (stable, unlike the editable Job.source_domain)."""
+    try:
+        host = (urlparse(source_url or "").hostname or "").lower()
+    except ValueError:
+        return ""
+    return host[4:] if host.startswith("www.") else host
+
+
+def new_deltas() -> Deltas:
+    return defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+
+
+def count(deltas: Deltas, user_id: int, applied_at: date, source_url: str | None, status: str, sign: int = 1) -> None:
+    """Add (sign=1) or remove (sign=-1) one application in ``status`` from ``deltas``."""
+    row = deltas[(user_id, applied_at, rollup_domain(source_url))]
+    row["applications"] += sign
+    if status in STATUSES:
+        row[f"status_{status}"] += sign
+
+
+def count_change(
+    deltas: Deltas,
+    user_id: int,
+    source_url: str | None,
+    old: tuple[date, str],
+    new: tuple[date, str],
+) -> None:
+    """Move one application from its old (applied_at, status) bucket to the new one."""
+    if old != new:
+        count(deltas, user_id, old[0], source_url, old[1], sign=-1)
+        count(deltas, user_id, new[0], source_url, new[1])
+
+
+def upsert_statement(dialect: str, deltas: Deltas):
+    """INSERT ... ON CONFLICT DO UPDATE adding ``deltas`` to the counters; None when nothing changes."""
+    rows = [
+        {"user_id": user_id, "day": day, "source_domain": domain, **counters}
+        for (user_id, day, domain), counters in deltas.items()
+        if any(counters.values())
+    ]
+    if not rows:
+        return None
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    stmt = insert(ActivityDaily).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["user_id", "day", "source_domain"],
+        set_={name: getattr(ActivityDaily, name) + getattr(stmt.excluded, name) for name in COUNTERS},
+    )
+
+
+async def apply(db: AsyncSession, deltas: Deltas) -> None:
+    """Add ``deltas`` to the rollups in the current transaction. Caller commits."""
+    stmt = upsert_statement(db.bind.dialect.name, deltas)
+    if stmt is not None:
+        await db.execute(stmt)
+
+
+def rebuild(db: Session, user_id: int | None = None, batch_size: int = 1000) -> int:
+    """Recompute the rollups (of one user, or everyone) from job_applications and commit.
+    Returns the number of rollup rows written."""
+    deltas = new_deltas()
+    rows = (
+        select(JobApplication.user_id, JobApplication.applied_at, JobApplication.status, Job.source_url)
+        .join(Job, Job.id == JobApplication.job_id)
+        .execution_options(yield_per=batch_size)
+    )
+    wipe = delete(ActivityDaily)
+    if user_id is not None:
+        rows = rows.where(JobApplication.user_id == user_id)
+        wipe = wipe.where(ActivityDaily.user_id == user_id)
+    for app_user_id, applied_at, status, source_url in db.execute(rows):
+        count(deltas, app_user_id, applied_at, source_url, status)
+    db.execute(wipe)
+    items = list(deltas.items())
+    dialect = db.get_bind().dialect.name
+    for start in range(0, len(items), batch_size):
+        stmt = upsert_statement(dialect, dict(items[start : start + batch_size]))
+        if stmt is not None:
+            db.execute(stmt)
+    db.commit()
+    return len(items)
+
+
+def _bucket_start(day: date, bucket: str) -> date:
+    return day - timedelta(days=day.weekday()) if bucket == "week" else day
+
+
+def _rate(part: int, whole: int) -> float:
+    return round(part / whole, 4) if whole > 0 else 0.0
+
+
+async def timeseries(db: AsyncSession, user_id: int, start: date, end: date, bucket: str = "day") -> dict:
+    """Applications per day/week, status funnel and response rate by domain for [start, end]."""
+    result = await db.execute(
+        select(ActivityDaily).where(
+            ActivityDaily.user_id == user_id,
+            ActivityDaily.day >= start,
+            ActivityDaily.day <= end,
+        )
+    )
+    per_bucket: dict[date, int] = {}
+    day = _bucket_start(start, bucket)
+    step = timedelta(days=7 if bucket == "week" else 1)
+    while day <= end:
+        per_bucket[day] = 0
+        day += step
+    funnel = dict.fromkeys(STATUSES, 0)
+    domains: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    total = 0
+    for row in result.scalars():
+        per_bucket[_bucket_start(row.day, bucket)] += row.applications
+        total += row.applications
+        responded = 0
+        for status in STATUSES:
+            n = getattr(row, f"status_{status}")
+            funnel[status] += n
+            if status in RESPONDED:
+                responded += n
+        domain = domains[row.source_domain]
+        domain[0] += row.applications
+        domain[1] += responded
+    responded_total = sum(funnel[s] for s in RESPONDED)
+    return {
+        "bucket": bucket,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "series": [{"date": d.isoformat(), "applications": n} for d, n in per_bucket.items()],
+        "funnel": {
+            **funnel,
+            "total": total,
+            "response_rate": _rate(responded_total, total),
+            "offer_rate": _rate(funnel["got_offer"], total),
+        },
+        "by_domain": sorted(
+            (
+                {
+                    "source_domain": domain or None,
+                    "applications": apps,
+                    "responses": responses,
+                    "response_rate": _rate(responses, apps),
+                }
+                for domain, (apps, responses) in domains.items()
+                if apps
+            ),
+            key=lambda d: (-d["applications"], d["source_domain"] or ""),
+        ),
+    }
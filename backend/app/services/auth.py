@@ -1,14 +1,16 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.models.user import User
 from app.schemas.user import UserResponse
+from app.services import principal_cache
 
 settings = get_settings()
 
 
-def get_or_create_user(
-    db: Session,
+async def get_or_create_user(
+    db: AsyncSession,
     *,
     email: str,
     name: str | None,
@@ -17,7 +19,7 @@ def get_or_create_user(
     provider_id: str,
 ) -> User:
     email = email.lower().strip()
-    user = db.query(User).filter(User.email == email).first()
+    user = await db.scalar(select(User).where(User.email == email))
     if user:
         user.name = name or user.name
         user.avatar_url = avatar_url or user.avatar_url
@@ -25,8 +27,9 @@ def get_or_create_user(
         user.provider_id = provider_id
         if email in settings.admin_emails_list:
             user.is_admin = True
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
+        principal_cache.invalidate_user(user.id)
         return user
     is_admin = email in settings.admin_emails_list
     user = User(
@@ -39,8 +42,8 @@ def get_or_create_user(
         is_active=True,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 
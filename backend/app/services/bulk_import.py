@@ -0,0 +1,323 @@
+"""Bulk import of applications from a streamed CSV or NDJSON upload.
+
+The body is parsed as it arrives (csv_records / ndjson_records) and written in chunks of
+``import_chunk_size`` rows. Per chunk: one SELECT of the jobs already known, one
+INSERT ... ON CONFLICT (source_url) for the new jobs (and existing ones with empty fields to
+fill), one batched INSERT of the applications and one for any fetch tasks. Rollups,
+counters and data_version are written once at the end, and everything commits in a
+single transaction. Rows that fail validation or the one-active-application rule are skipped
+and reported; they never abort the import.
+"""
+import codecs
+import csv
+import heapq
+import io
+import json
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.application import ACTIVE_STATUSES, JobApplication
+from app.models.job import Job
+from app.schemas.application import ApplicationImportRow
+from app.services import activity, data_version, user_stats
+from app.services.export import FORMULA_PREFIXES
+from app.services.fetch_queue import enqueue_job_fetches
+from app.services.job_fetch import canonicalize_url
+
+settings = get_settings()
+
+MAX_REPORTED_ERRORS = 1000
+# Longest NDJSON line kept in memory; a longer one is skipped and reported as a failed row
+MAX_LINE_BYTES = 64 * 1024
+# Job fields an import may fill in; existing values are never overwritten
+JOB_FIELDS = ("title", "company", "location", "source_domain")
+
+# (row number, parsed fields, parse error)
+Record = tuple[int, dict | None, str | None]
+
+
+class InvalidUpload(ValueError):
+    """The upload as a whole is unusable (bad encoding, missing CSV columns)."""
+
+
+class TooManyRows(InvalidUpload):
+    pass
+
+
+def _cell(value: str) -> str:
+    """A stripped CSV cell, without the ' that export.csv_cell puts before formula-like text."""
+    value = value.strip()
+    if value.startswith("'") and value[1:].startswith(FORMULA_PREFIXES):
+        return value[1:]
+    return value
+
+
+def _complete_prefix(text: str) -> int:
+    """Length of the leading whole CSV records in ``text``: up to the last newline that is not
+    inside a quoted field (an even number of quotes before it)."""
+    end = start = quotes = 0
+    while (newline := text.find("\n", start)) >= 0:
+        quotes += text.count('"', start, newline)
+        start = newline + 1
+        if quotes % 2 == 0:
+            end = start
+    return end
+
+
+async def csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    """Rows of a UTF-8 CSV with a header line, as dicts keyed by the lowercased header.
+    Empty cells are left out so the row defaults apply. Row numbers count data rows from 1.
+    Cells exported as formula-safe ('=...) get their original value back."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    header: list[str] | None = None
+    row = 0
+    pending = ""
+    done = False
+    while not done:
+        try:
+            chunk = await anext(chunks)
+        except StopAsyncIteration:
+            chunk, done = b"", True
+        try:
+            pending += decoder.decode(chunk, final=done)
+        except UnicodeDecodeError:
+            raise InvalidUpload("CSV must be UTF-8 encoded")
+        cut = len(pending) if done else _complete_prefix(pending)
+        if not cut:
+            continue
+        block, pending = pending[:cut], pending[cut:]
+        try:
+            rows = list(csv.reader(io.StringIO(block)))
+        except csv.Error as exc:
+            raise InvalidUpload(f"Malformed CSV after data row {row}: {exc}")
+        for cells in rows:
+            if not any(cell.strip() for cell in cells):
+                continue
+            if header is None:
+                header = [name.strip().lower() for name in cells]
+                missing = {"source_url", "applied_at"} - set(header)
+                if missing:
+                    raise InvalidUpload(f"CSV header is missing: {', '.join(sorted(missing))}")
+                continue
+            row += 1
+            yield row, {name: _cell(cell) for name, cell in zip(header, cells) if name and cell.strip()}, None
+    if header is None:
+        raise InvalidUpload("CSV is empty")
+
+
+async def ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    """One JSON object per line; blank lines are skipped. Row numbers count non-blank lines from 1.
+    Lines over MAX_LINE_BYTES are reported without being buffered whole."""
+    too_long = f"Line is longer than {MAX_LINE_BYTES} bytes"
+    row = 0
+    pending = b""
+    skipping = False
+    done = False
+    while not done:
+        try:
+            chunk = await anext(chunks)
+        except StopAsyncIteration:
+            chunk, done = b"\n", True
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if skipping:
+                # The end of a line already reported as too long
+                skipping = False
+                continue
+            if not line.strip():
+                continue
+            row += 1
+            if len(line) > MAX_LINE_BYTES:
+                yield row, None, too_long
+                continue
+            try:
+                fields = json.loads(line)
+            except ValueError:
+                yield row, None, "Invalid JSON"
+                continue
+            if not isinstance(fields, dict):
+                yield row, None, "Expected a JSON object"
+                continue
+            yield row, fields, None
+        if len(pending) > MAX_LINE_BYTES:
+            if not skipping:
+                row += 1
+                yield row, None, too_long
+                skipping = True
+            pending = b""
+
+
+def parse(fmt: str, chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    return csv_records(chunks) if fmt == "csv" else ndjson_records(chunks)
+
+
+def _error_text(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc'])) or 'row'}: {e['msg']}" for e in exc.errors())
+
+
+def validate(fields: dict) -> tuple[ApplicationImportRow | None, str | None]:
+    """The import row with its canonical URL, or the reason it is rejected."""
+    try:
+        item = ApplicationImportRow.model_validate(fields)
+    except ValidationError as exc:
+        return None, _error_text(exc)
+    if not item.source_url.strip().lower().startswith(("http://", "https://")):
+        return None, "source_url: must be an http(s) URL"
+    item.source_url = canonicalize_url(item.source_url)
+    if len(item.source_url) > 2048:
+        return None, "source_url: too long"
+    return item, None
+
+
+class _Import:
+    def __init__(self, db: AsyncSession, user_id: int):
+        self.db = db
+        self.user_id = user_id
+        self.imported = 0
+        self.failed = 0
+        # The MAX_REPORTED_ERRORS lowest rows as (-row, error): a max-heap on the row number,
+        # since active-duplicate failures are found a chunk after later rows' validation errors
+        self._errors: list[tuple[int, str]] = []
+        self.deltas = activity.new_deltas()
+        self.counts = user_stats.new_counts()
+        # Jobs this user has an active application for (existing, then imported)
+        self.active_jobs: set[int] = set()
+
+    def fail(self, row: int, error: str) -> None:
+        self.failed += 1
+        if len(self._errors) < MAX_REPORTED_ERRORS:
+            heapq.heappush(self._errors, (-row, error))
+        elif row < -self._errors[0][0]:
+            heapq.heapreplace(self._errors, (-row, error))
+
+    @property
+    def errors(self) -> list[dict]:
+        return [{"row": -neg_row, "error": error} for neg_row, error in sorted(self._errors, reverse=True)]
+
+    async def start(self) -> None:
+        self.active_jobs.update(
+            await self.db.scalars(
+                select(JobApplication.job_id).where(
+                    JobApplication.user_id == self.user_id, JobApplication.status.in_(ACTIVE_STATUSES)
+                )
+            )
+        )
+
+    async def _upsert_jobs(self, batch: list[tuple[int, ApplicationImportRow]]) -> dict[str, int]:
+        """Job id per URL in ``batch``, creating missing jobs and filling empty fields of known ones."""
+        wanted: dict[str, dict] = {}
+        for _, item in batch:
+            fields = wanted.setdefault(item.source_url, dict.fromkeys(JOB_FIELDS))
+            for name in JOB_FIELDS:
+                if fields[name] is None:
+                    fields[name] = getattr(item, name)
+        known = {
+            row.source_url: row
+            for row in await self.db.execute(
+                select(Job.id, Job.source_url, *(getattr(Job, name) for name in JOB_FIELDS)).where(
+                    Job.source_url.in_(wanted)
+                )
+            )
+        }
+        job_ids = {url: row.id for url, row in known.items()}
+        filled = []
+        upserts = []
+        for url, fields in wanted.items():
+            row = known.get(url)
+            if row is None:
+                upserts.append({"source_url": url, **fields})
+            elif any(fields[name] is not None and getattr(row, name) is None for name in JOB_FIELDS):
+                upserts.append({"source_url": url, **fields})
+                filled.append(row.id)
+        if upserts:
+            insert_ = pg_insert if self.db.bind.dialect.name == "postgresql" else sqlite_insert
+            stmt = insert_(Job)
+            # Also absorbs a job created concurrently since the select. Executed with a parameter
+            # list, so SQLAlchemy batches it into multi-row statements from one cached compilation.
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Job.source_url],
+                set_={name: func.coalesce(getattr(Job, name), getattr(stmt.excluded, name)) for name in JOB_FIELDS},
+            ).returning(Job.source_url, Job.id)
+            job_ids.update((await self.db.execute(stmt, upserts)).tuples().all())
+        if filled:
+            await self.db.execute(data_version.bump_job_users(*filled))
+        # Enrich like create_application does: jobs still lacking a title or company
+        await enqueue_job_fetches(
+            self.db,
+            [
+                job_ids[url]
+                for url, fields in wanted.items()
+                if not (fields["title"] or getattr(known.get(url), "title", None))
+                or not (fields["company"] or getattr(known.get(url), "company", None))
+            ],
+        )
+        return job_ids
+
+    async def write(self, batch: list[tuple[int, ApplicationImportRow]]) -> None:
+        job_ids = await self._upsert_jobs(batch)
+        rows = []
+        for row, item in batch:
+            job_id = job_ids[item.source_url]
+            if item.status in ACTIVE_STATUSES:
+                if job_id in self.active_jobs:
+                    self.fail(row, "An active application (Applied or In progress) for this job already exists")
+                    continue
+                self.active_jobs.add(job_id)
+            rows.append(
+                {
+                    "user_id": self.user_id,
+                    "job_id": job_id,
+                    "applied_at": item.applied_at,
+                    "status": item.status,
+                    "notes": item.notes,
+                }
+            )
+            activity.count(self.deltas, self.user_id, item.applied_at, item.source_url, item.status)
+            user_stats.count_change(self.counts, None, item.status)
+        if rows:
+            await self.db.execute(insert(JobApplication), rows)
+            self.imported += len(rows)
+
+    async def finish(self) -> None:
+        if self.imported:
+            await activity.apply(self.db, self.deltas)
+            await self.db.execute(user_stats.add_counts(data_version.bump_users(self.user_id), self.counts))
+        await self.db.commit()
+
+
+async def import_applications(
+    db: AsyncSession,
+    user_id: int,
+    records: AsyncIterator[Record],
+    chunk_size: int = settings.import_chunk_size,
+    max_rows: int = settings.import_max_rows,
+) -> dict:
+    """Validate and write ``records`` for ``user_id`` and commit. Raises InvalidUpload (nothing is
+    written) when the upload itself is unusable or has more than ``max_rows`` rows."""
+    state = _Import(db, user_id)
+    await state.start()
+    batch: list[tuple[int, ApplicationImportRow]] = []
+    async for row, fields, error in records:
+        if row > max_rows:
+            raise TooManyRows(f"Imports are limited to {max_rows} rows")
+        item = None
+        if error is None:
+            item, error = validate(fields)
+        if error is not None:
+            state.fail(row, error)
+            continue
+        batch.append((row, item))
+        if len(batch) >= chunk_size:
+            await state.write(batch)
+            batch = []
+    if batch:
+        await state.write(batch)
+    await state.finish()
+    return {"imported": state.imported, "failed": state.failed, "errors": state.errors}
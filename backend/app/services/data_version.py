@@ -0,0 +1,33 @@
+"""Per-user data version (users.data_version), the validator behind ETags on read endpoints.
+
+Every write to something a user's reads show must bump the version in the same transaction:
+their applications and interview sessions, and any Job they applied to (jobs are shared, so a job
+edit bumps every user with an application for it). The statements work on sync and async sessions.
+"""
+from sqlalchemy import Update, select, update
+
+from app.models.application import JobApplication
+from app.models.user import User
+
+
+def bump_users(*user_ids: int) -> Update:
+    return (
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(data_version=User.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump_job_users(*job_ids: int) -> Update:
+    owners = select(JobApplication.user_id).where(JobApplication.job_id.in_(job_ids))
+    return (
+        update(User)
+        .where(User.id.in_(owners))
+        .values(data_version=User.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def current(user_id: int):
+    return select(User.data_version).where(User.id == user_id)
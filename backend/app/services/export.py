@@ -0,0 +1,140 @@
+"""Streaming export of applications as CSV or NDJSON.
+
+Rows come from AsyncSession.stream() with yield_per (a server-side cursor on Postgres) and
+are encoded and sent one batch at a time, so memory stays flat whatever the row count. Interview
+sessions, when requested, are loaded per batch with one IN query. The CSV uses the import
+column names (app.services.bulk_import), so an export can be imported again.
+
+Text cells that a spreadsheet would evaluate as a formula (leading =, +, -, @, tab or CR; job
+fields are scraped from third-party pages) get a leading ' in the CSV, which csv_records strips
+again on import.
+
+The stream opens its own session: it runs after the endpoint returned, when the request's
+get_async_db session is already closed.
+"""
+import csv
+import io
+from typing import AsyncIterator
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.core.responses import dumps
+from app.models.application import InterviewSession, JobApplication
+from app.models.job import Job
+from app.models.user import User
+
+settings = get_settings()
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+# Leading characters that make spreadsheet apps treat a cell as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+EXPORT_COLUMNS = (
+    JobApplication.id,
+    Job.source_url,
+    JobApplication.applied_at,
+    JobApplication.status,
+    Job.title,
+    Job.company,
+    Job.location,
+    Job.source_domain,
+    JobApplication.created_at,
+    JobApplication.updated_at,
+)
+
+
+def export_query(user_id: int | None, notes: bool) -> Select:
+    """One user's applications by id, or everyone's (owner columns first) by owner and id."""
+    columns = [JobApplication.user_id, User.email.label("user_email")] if user_id is None else []
+    columns.extend(EXPORT_COLUMNS)
+    if notes:
+        columns.append(JobApplication.notes)
+    q = select(*columns).join(Job, Job.id == JobApplication.job_id)
+    if user_id is not None:
+        return q.where(JobApplication.user_id == user_id).order_by(JobApplication.id)
+    return q.join(User, User.id == JobApplication.user_id).order_by(JobApplication.user_id, JobApplication.id)
+
+
+def export_fields(user_id: int | None, notes: bool, sessions: bool) -> list[str]:
+    fields = [c.key for c in export_query(user_id, notes).selected_columns]
+    if sessions:
+        fields.append("interview_sessions")
+    return fields
+
+
+async def _sessions_by_application(db: AsyncSession, app_ids: list[int], notes: bool) -> dict[int, list[dict]]:
+    columns = [
+        InterviewSession.job_application_id,
+        InterviewSession.name,
+        InterviewSession.scheduled_at,
+        InterviewSession.sort_order,
+    ]
+    if notes:
+        columns.append(InterviewSession.notes)
+    result = await db.execute(
+        select(*columns)
+        .where(InterviewSession.job_application_id.in_(app_ids))
+        .order_by(InterviewSession.job_application_id, InterviewSession.scheduled_at, InterviewSession.id)
+    )
+    out: dict[int, list[dict]] = {}
+    for row in result.mappings():
+        session = dict(row)
+        out.setdefault(session.pop("job_application_id"), []).append(session)
+    return out
+
+
+async def export_batches(
+    user_id: int | None,
+    notes: bool = False,
+    sessions: bool = False,
+    batch_size: int = settings.export_batch_size,
+) -> AsyncIterator[list[dict]]:
+    """Rows of export_query as dicts, ``batch_size`` at a time."""
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(export_query(user_id, notes).execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions():
+            rows = [dict(row) for row in partition]
+            if sessions:
+                by_app = await _sessions_by_application(db, [row["id"] for row in rows], notes)
+                for row in rows:
+                    row["interview_sessions"] = by_app.get(row["id"], [])
+            yield rows
+
+
+def csv_cell(value):
+    if isinstance(value, str):
+        return "'" + value if value.startswith(FORMULA_PREFIXES) else value
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+async def encode_csv(batches: AsyncIterator[list[dict]], fields: list[str]) -> AsyncIterator[bytes]:
+    """Header line, then one chunk per batch. Interview sessions go in one JSON-encoded cell,
+    formula-like text is neutralized (csv_cell)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(fields)
+    yield buf.getvalue().encode()
+    async for rows in batches:
+        buf.seek(0)
+        buf.truncate()
+        for row in rows:
+            if "interview_sessions" in row:
+                row["interview_sessions"] = dumps(row["interview_sessions"]).decode()
+            writer.writerow(map(csv_cell, map(row.get, fields)))
+        yield buf.getvalue().encode()
+
+
+async def encode_ndjson(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    async for rows in batches:
+        yield b"".join(dumps(row) + b"\n" for row in rows)
+
+
+def stream(fmt: str, user_id: int | None, notes: bool = False, sessions: bool = False) -> AsyncIterator[bytes]:
+    """Encoded export of one user (``user_id``) or of all users (None)."""
+    batches = export_batches(user_id, notes, sessions)
+    if fmt == "csv":
+        return encode_csv(batches, export_fields(user_id, notes, sessions))
+    return encode_ndjson(batches)
@@ -0,0 +1,235 @@
+"""Job page field extraction.
+
+The page is parsed once, keeping only the tags extraction reads (meta, title, h1, script), and
+collected into a PageData in a single traversal. Fields are then filled, first value wins, from:
+
+1. a schema.org ``JobPosting`` in an ``application/ld+json`` block (title, company, location,
+   description in one object),
+2. the extractor registered for the page's domain (``@register("example.com")``),
+3. generic Open Graph / Twitter / <title> / <h1> heuristics.
+"""
+import json
+import re
+from typing import Callable
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+LIMITS = {"title": 512, "company": 255, "location": 255, "description": 10000}
+
+_COLLECTED_TAGS = SoupStrainer(["meta", "title", "h1", "script"])
+# Elements that separate words in a JSON-LD description's HTML
+_BLOCK_TAGS = ["p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "tr", "td", "th"]
+_AT_COMPANY_RE = re.compile(r"\s+at\s+([A-Za-z0-9&\s]+?)(?:\s*[-|]|$)")
+
+
+class PageData:
+    """Everything the extractors read from a page, gathered in one pass."""
+
+    def __init__(self) -> None:
+        self.meta: dict[str, str] = {}  # lowercased property/name -> first non-empty content
+        self.title: str | None = None
+        self.h1: str | None = None
+        self.json_ld: list = []
+
+    def meta_matching(self, fragment: str) -> str | None:
+        """First meta content whose name contains ``fragment`` (e.g. "title"), in document order."""
+        for key, value in self.meta.items():
+            if fragment in key:
+                return value
+        return None
+
+
+def collect_page(text: str) -> PageData:
+    page = PageData()
+    soup = BeautifulSoup(text, "html.parser", parse_only=_COLLECTED_TAGS)
+    for el in soup.find_all(["meta", "title", "h1", "script"]):
+        name = el.name
+        if name == "meta":
+            key = (el.get("property") or el.get("name") or "").strip().lower()
+            content = (el.get("content") or "").strip()
+            if key and content and key not in page.meta:
+                page.meta[key] = content
+        elif name == "title":
+            if page.title is None and el.string and el.string.strip():
+                page.title = el.string.strip()
+        elif name == "h1":
+            if page.h1 is None:
+                page.h1 = el.get_text(strip=True) or None
+        elif (el.get("type") or "").lower() == "application/ld+json" and el.string:
+            try:
+                page.json_ld.append(json.loads(el.string))
+            except ValueError:
+                pass
+    return page
+
+
+def _set(result: dict, field: str, value) -> None:
+    if result.get(field) or not isinstance(value, str):
+        return
+    value = value.strip()
+    if value:
+        result[field] = value[: LIMITS[field]]
+
+
+# --- JSON-LD ---------------------------------------------------------------------------
+
+
+def _iter_ld_objects(node):
+    if isinstance(node, list):
+        for item in node:
+            yield from _iter_ld_objects(item)
+    elif isinstance(node, dict):
+        yield node
+        if "@graph" in node:
+            yield from _iter_ld_objects(node["@graph"])
+
+
+def find_job_posting(blocks: list) -> dict | None:
+    for obj in _iter_ld_objects(blocks):
+        kind = obj.get("@type")
+        kinds = kind if isinstance(kind, list) else [kind]
+        if "JobPosting" in kinds:
+            return obj
+    return None
+
+
+def _ld_name(value) -> str | None:
+    if isinstance(value, dict):
+        return value.get("name")
+    return value if isinstance(value, str) else None
+
+
+def _ld_location(posting: dict) -> str | None:
+    places = posting.get("jobLocation") or []
+    if isinstance(places, dict):
+        places = [places]
+    names = []
+    for place in places if isinstance(places, list) else []:
+        address = place.get("address") if isinstance(place, dict) else None
+        if isinstance(address, dict):
+            country = _ld_name(address.get("addressCountry"))
+            parts = [address.get("addressLocality"), address.get("addressRegion"), country]
+            label = ", ".join(p.strip() for p in parts if isinstance(p, str) and p.strip())
+        else:
+            label = address if isinstance(address, str) else None
+        if label and label not in names:
+            names.append(label)
+    if str(posting.get("jobLocationType", "")).upper() == "TELECOMMUTE":
+        names.insert(0, "Remote")
+    return "; ".join(names) or None
+
+
+def _html_to_text(value) -> str | None:
+    """Plain text of an HTML fragment. Only block elements separate words, so inline markup
+    ("Build <b>things</b>.") does not add spaces inside a sentence."""
+    if not isinstance(value, str):
+        return None
+    if "<" not in value:
+        return value
+    soup = BeautifulSoup(value, "html.parser")
+    for el in soup.find_all(_BLOCK_TAGS):
+        el.insert_before(" ")
+        el.insert_after(" ")
+    return " ".join(soup.get_text().split())
+
+
+def apply_json_ld(page: PageData, result: dict) -> None:
+    posting = find_job_posting(page.json_ld)
+    if posting is None:
+        return
+    _set(result, "title", posting.get("title"))
+    _set(result, "company", _ld_name(posting.get("hiringOrganization")))
+    _set(result, "location", _ld_location(posting))
+    _set(result, "description", _html_to_text(posting.get("description")))
+
+
+# --- Per-domain extractors -------------------------------------------------------------
+
+Extractor = Callable[[PageData, dict], None]
+_EXTRACTORS: dict[str, Extractor] = {}
+
+
+def register(*domains: str) -> Callable[[Extractor], Extractor]:
+    """Register an extractor for ``domains`` and their subdomains."""
+    def decorator(fn: Extractor) -> Extractor:
+        for domain in domains:
+            _EXTRACTORS[domain.lower()] = fn
+        return fn
+    return decorator
+
+
+def extractor_for(domain: str | None) -> Extractor | None:
+    if not domain:
+        return None
+    host = domain.lower().split(":")[0]
+    while host:
+        fn = _EXTRACTORS.get(host)
+        if fn is not None:
+            return fn
+        _, _, host = host.partition(".")
+    return None
+
+
+_LINKEDIN_TITLE_RE = re.compile(r"^(?P<company>.+?) hiring (?P<title>.+?)(?: in (?P<location>.+?))?(?: \| LinkedIn)?$")
+
+
+@register("linkedin.com")
+def linkedin(page: PageData, result: dict) -> None:
+    # og:title: "Acme hiring Senior Engineer in Berlin, Germany | LinkedIn"
+    match = _LINKEDIN_TITLE_RE.match(page.meta.get("og:title") or page.title or "")
+    if match:
+        _set(result, "title", match.group("title"))
+        _set(result, "company", match.group("company"))
+        _set(result, "location", match.group("location"))
+
+
+_GREENHOUSE_TITLE_RE = re.compile(r"^Job Application for (?P<title>.+) at (?P<company>.+)$")
+
+
+@register("greenhouse.io")
+def greenhouse(page: PageData, result: dict) -> None:
+    # <title>: "Job Application for Senior Engineer at Acme"
+    match = _GREENHOUSE_TITLE_RE.match(page.title or "")
+    if match:
+        _set(result, "title", match.group("title"))
+        _set(result, "company", match.group("company"))
+
+
+@register("lever.co")
+def lever(page: PageData, result: dict) -> None:
+    # og:title / <title>: "Acme - Senior Engineer"
+    company, sep, title = (page.meta.get("og:title") or page.title or "").partition(" - ")
+    if sep:
+        _set(result, "company", company)
+        _set(result, "title", title)
+
+
+# --- Generic heuristics ----------------------------------------------------------------
+
+
+def apply_generic(page: PageData, result: dict, source_domain: str | None) -> None:
+    meta = page.meta
+    # Open Graph / Twitter card / standard meta (most job sites set these)
+    _set(result, "title", meta.get("og:title") or meta.get("twitter:title") or page.meta_matching("title"))
+    _set(result, "description", meta.get("og:description") or page.meta_matching("description"))
+    # Fallbacks: <title>, then the first <h1> (many job pages have "Job Title" in h1)
+    _set(result, "title", page.title)
+    _set(result, "title", page.h1)
+    # Company from title (e.g. "Senior Engineer at Acme" -> Acme), else from the domain
+    if result["title"]:
+        at_match = _AT_COMPANY_RE.search(result["title"])
+        if at_match:
+            _set(result, "company", at_match.group(1))
+    if source_domain:
+        _set(result, "company", source_domain.replace("www.", "").split(".")[0])
+
+
+def extract(text: str, result: dict) -> dict:
+    """Fill ``result`` (which carries source_domain) from the page HTML; returns it."""
+    page = collect_page(text)
+    apply_json_ld(page, result)
+    domain_extractor = extractor_for(result.get("source_domain"))
+    if domain_extractor is not None:
+        domain_extractor(page, result)
+    apply_generic(page, result, result.get("source_domain"))
+    return result
@@ -0,0 +1,66 @@
+"""Two-tier cache for fetched job pages.
+
+Tier 1 is an in-process LRU with TTL (per worker). Tier 2 is the fetch_cache table, shared by all
+workers, which also keeps the ETag / Last-Modified validators so stale entries can be revalidated
+with a conditional request instead of a full download.
+"""
+from datetime import datetime, timezone
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.models.fetch_cache import FetchCacheEntry
+
+settings = get_settings()
+
+memory_cache = TTLCache(
+    maxsize=settings.fetch_cache_max_entries,
+    ttl=settings.fetch_cache_ttl_seconds,
+)
+
+
+def entry_age_seconds(entry: FetchCacheEntry) -> float:
+    fetched_at = entry.fetched_at
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - fetched_at).total_seconds()
+
+
+def is_fresh(entry: FetchCacheEntry) -> bool:
+    return entry_age_seconds(entry) < settings.fetch_cache_ttl_seconds
+
+
+async def load_entry(url: str) -> FetchCacheEntry | None:
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(select(FetchCacheEntry).where(FetchCacheEntry.url == url))
+
+
+async def store_entry(url: str, result: dict, etag: str | None, last_modified: str | None) -> None:
+    """Insert or refresh the persistent entry. A concurrent insert for the same URL is not an error."""
+    async with AsyncSessionLocal() as db:
+        try:
+            entry = await db.scalar(select(FetchCacheEntry).where(FetchCacheEntry.url == url))
+            if entry is None:
+                entry = FetchCacheEntry(url=url)
+                db.add(entry)
+            entry.result = result
+            entry.etag = etag
+            entry.last_modified = last_modified
+            entry.fetched_at = datetime.now(timezone.utc)
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+
+
+async def touch_entry(url: str) -> None:
+    """Mark an entry fresh again after the origin answered 304 Not Modified."""
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(FetchCacheEntry)
+            .where(FetchCacheEntry.url == url)
+            .values(fetched_at=datetime.now(timezone.utc))
+        )
+        await db.commit()
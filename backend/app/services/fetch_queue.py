@@ -0,0 +1,133 @@
+"""DB-backed queue of background job metadata fetches (fetch_tasks).
+
+Workers claim due tasks with a lease: on Postgres with SELECT ... FOR UPDATE SKIP LOCKED so
+any number of workers can poll concurrently without blocking each other; on SQLite (a single
+writer anyway) with one UPDATE that stamps the lease. A task whose lease expires (worker died)
+becomes claimable again. Failed attempts are retried with exponential backoff.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Row, and_, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, undefer
+
+from app.core.config import get_settings
+from app.models.fetch_task import QUEUED_WHERE, FetchTask
+from app.models.job import Job
+from app.services import data_version
+
+settings = get_settings()
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def needs_enrichment(job: Job | Row) -> bool:
+    return not job.title or not job.company
+
+
+async def enqueue_job_fetch(db: AsyncSession, job_id: int) -> bool:
+    """Queue a fetch for the job unless one is already pending or running. Caller commits.
+    Returns whether a task was queued."""
+    return bool(await enqueue_job_fetches(db, [job_id]))
+
+
+async def enqueue_job_fetches(db: AsyncSession, job_ids: list[int]) -> int:
+    """Queue a fetch for each job that has no pending or running task, in one batched
+    INSERT ... ON CONFLICT DO NOTHING on QUEUED_INDEX (so concurrent enqueues cannot race into a
+    duplicate). Caller commits. Returns the number of tasks queued."""
+    if not job_ids:
+        return 0
+    now = _now()
+    rows = [
+        {"job_id": job_id, "status": PENDING, "attempts": 0, "next_attempt_at": now}
+        for job_id in dict.fromkeys(job_ids)
+    ]
+    insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    stmt = (
+        insert(FetchTask)
+        .on_conflict_do_nothing(index_elements=[FetchTask.job_id], index_where=QUEUED_WHERE)
+        .returning(FetchTask.id)
+    )
+    return len((await db.execute(stmt, rows)).all())
+
+
+def _claimable(now: datetime):
+    return or_(
+        and_(FetchTask.status == PENDING, FetchTask.next_attempt_at <= now),
+        and_(FetchTask.status == RUNNING, FetchTask.locked_until < now),
+    )
+
+
+def claim_tasks(db: Session, worker_id: str, limit: int) -> list[FetchTask]:
+    """Lease up to ``limit`` due tasks to ``worker_id`` and commit. Returns the claimed tasks."""
+    now = _now()
+    lease_until = now + timedelta(seconds=settings.fetch_queue_lease_seconds)
+    lease = {
+        FetchTask.status: RUNNING,
+        FetchTask.locked_by: worker_id,
+        FetchTask.locked_until: lease_until,
+        FetchTask.attempts: FetchTask.attempts + 1,
+    }
+    due = select(FetchTask.id).where(_claimable(now)).order_by(FetchTask.next_attempt_at).limit(limit)
+    if db.get_bind().dialect.name == "postgresql":
+        ids = db.execute(due.with_for_update(skip_locked=True)).scalars().all()
+        if not ids:
+            db.rollback()
+            return []
+        db.execute(update(FetchTask).where(FetchTask.id.in_(ids)).values(lease))
+    else:
+        # SQLite serializes writers, so a single UPDATE ... WHERE id IN (due) is the claim
+        db.execute(
+            update(FetchTask).where(FetchTask.id.in_(due.scalar_subquery()), _claimable(now)).values(lease),
+            execution_options={"synchronize_session": False},
+        )
+    db.commit()
+    return (
+        db.query(FetchTask)
+        .filter(FetchTask.locked_by == worker_id, FetchTask.status == RUNNING, FetchTask.locked_until == lease_until)
+        .all()
+    )
+
+
+def complete_task(db: Session, task: FetchTask, result: dict) -> None:
+    """Fill the Job's missing fields from a fetch result (never overwriting edits) and finish the task."""
+    job = db.query(Job).options(undefer(Job.description)).filter(Job.id == task.job_id).first()
+    if job is not None:
+        for field in ("title", "company", "location", "description", "source_domain"):
+            if result.get(field) and not getattr(job, field):
+                setattr(job, field, result[field])
+        if db.is_modified(job):
+            db.execute(data_version.bump_job_users(job.id))
+    task.status = DONE
+    task.locked_by = None
+    task.locked_until = None
+    task.last_error = None
+    db.commit()
+
+
+def backoff_seconds(attempts: int) -> float:
+    base = settings.fetch_queue_backoff_seconds * (2 ** max(attempts - 1, 0))
+    return base * random.uniform(0.8, 1.2)
+
+
+def fail_task(db: Session, task: FetchTask, error: str) -> None:
+    """Record a failed attempt: retry later with exponential backoff, or give up after max attempts."""
+    task.last_error = error[:2000]
+    task.locked_by = None
+    task.locked_until = None
+    if task.attempts >= settings.fetch_queue_max_attempts:
+        task.status = FAILED
+    else:
+        task.status = PENDING
+        task.next_attempt_at = _now() + timedelta(seconds=backoff_seconds(task.attempts))
+    db.commit()
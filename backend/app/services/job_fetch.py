@@ -1,8 +1,16 @@
+import logging
 import re
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import httpx
-from bs4 import BeautifulSoup
+
+from app.core import outbound
+from app.core.config import get_settings
+from app.services import extractors, fetch_cache
+from app.services.parse_pool import ParsePoolBusy, parse_pool
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
 
 # Browser-like headers so job sites are less likely to block the request
 DEFAULT_HEADERS = {
@@ -23,85 +31,232 @@ def extract_domain(url: str) -> str | None:
         return None
 
 
-def _extract_text(el) -> str | None:
-    if el is None:
-        return None
-    text = el.get_text(strip=True) if hasattr(el, "get_text") else str(el).strip()
-    return text[:512] if text else None
+_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_.:-]+)""", re.I)
+# Bytes to scan for a <meta charset>; HTML requires the declaration within the first 1024 bytes
+CHARSET_SNIFF_BYTES = 2048
+# Head-only mode: body bytes read after the head (or first </h1>) for a JSON-LD JobPosting,
+# which job boards usually put early in <body>
+JSON_LD_WINDOW = 64 * 1024
+# Everything head-only reading looks for, as it appears lowercased
+_PREFIX_MARKERS = re.compile(
+    rb"og:title|twitter:title|<title|</head>|</h1>|application/ld\+json|jobposting|</script>"
+)
+_MARKER_OVERLAP = len(b"application/ld+json") - 1
 
 
-async def fetch_job_from_url(url: str) -> dict:
-    """Fetch job page and extract title, company, description from meta/OG and fallbacks.
-    Always returns a dict with at least source_domain; may include fetch_error if the request failed.
-    """
-    result = {
+def detect_charset(content_type: str | None, prefix: bytes) -> str:
+    """Charset from the Content-Type header, else from a <meta> in the first bytes, else UTF-8."""
+    if content_type:
+        for param in content_type.split(";")[1:]:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "charset" and value.strip():
+                return value.strip().strip("\"'")
+    match = _CHARSET_RE.search(prefix[:CHARSET_SNIFF_BYTES])
+    if match:
+        return match.group(1).decode("ascii")
+    return "utf-8"
+
+
+def _decode(body: bytes, charset: str) -> str:
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+class _PrefixScanner:
+    """What head-only reading has seen so far. Each chunk is lowercased and scanned once, together
+    with the last few bytes of the previous one so a marker split across chunks is still found."""
+
+    def __init__(self) -> None:
+        self._tail = b""
+        self._fed = 0
+        self._title = False
+        self._head_closed = False
+        self._in_ld_json = False
+        self._job_posting = False
+        # Offset just past a complete <head> with a title candidate, or else the first </h1>
+        self.head_end: int | None = None
+        self.ld_json_read = False  # a complete application/ld+json block holding a JobPosting
+
+    def feed(self, chunk: bytes) -> None:
+        text = self._tail + chunk.lower()
+        seen = len(self._tail)
+        start = self._fed - seen  # offset of text[0] in the body
+        self._fed += len(chunk)
+        for match in _PREFIX_MARKERS.finditer(text):
+            if match.end() <= seen:
+                continue  # wholly inside the overlap: handled with the previous chunk
+            marker = match.group()
+            if marker == b"</head>":
+                self._head_closed = True
+                if self._title and self.head_end is None:
+                    self.head_end = start + match.end()
+            elif marker == b"</h1>":
+                if self.head_end is None:
+                    self.head_end = start + match.end()
+            elif marker == b"application/ld+json":
+                self._in_ld_json, self._job_posting = True, False
+            elif marker == b"jobposting":
+                self._job_posting = self._in_ld_json
+            elif marker == b"</script>":
+                self.ld_json_read = self.ld_json_read or self._job_posting
+                self._in_ld_json = self._job_posting = False
+            elif not self._head_closed:
+                self._title = True
+        self._tail = text[-_MARKER_OVERLAP:]
+
+
+async def read_page_prefix(resp: httpx.Response, max_bytes: int, head_only: bool) -> bytes:
+    """Read the body incrementally, stopping at ``max_bytes`` or, in head-only mode, once
+    extraction has what it needs: a complete JSON-LD JobPosting block, or else the head (with a
+    title candidate) or first </h1> plus at most JSON_LD_WINDOW bytes in which to find one.
+    Memory and transfer scale with the head, not the page."""
+    buf = bytearray()
+    scanner = _PrefixScanner()
+    limit = max_bytes
+    async for chunk in resp.aiter_bytes():
+        buf += chunk
+        if head_only:
+            scanner.feed(chunk)
+            if scanner.ld_json_read:
+                break
+            if scanner.head_end is not None:
+                limit = min(max_bytes, scanner.head_end + JSON_LD_WINDOW)
+        if len(buf) >= limit:
+            del buf[limit:]
+            break
+    return bytes(buf)
+
+
+# Query parameters that only track where a click came from; they never change the posting
+_TRACKING_PARAMS = {"trk", "trkinfo", "refid", "trackingid", "ref", "gclid", "fbclid", "lipi"}
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a job URL so the same posting pasted from different places dedupes:
+    lowercase scheme/host, drop default ports, fragments and tracking params, sort the query.
+    A URL that does not parse (bad port, broken IPv6 host) comes back stripped but otherwise as is."""
+    url = url.strip()
+    try:
+        parsed = urlparse(url)
+        port = parsed.port
+    except ValueError:
+        return url
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse((scheme, host, path, "", urlencode(query), ""))
+
+
+def _empty_result(url: str) -> dict:
+    return {
         "title": None,
         "company": None,
+        "location": None,
         "description": None,
         "source_domain": extract_domain(url),
         "fetch_error": None,
     }
-    text = None
+
+
+def extract_job_fields(text: str | None, url: str) -> dict:
+    """Extract title, company, location, description (JSON-LD, per-domain extractor, then
+    meta/OG fallbacks; see app.services.extractors). Pure: no I/O."""
+    result = _empty_result(url)
+    if not text or len(text.strip()) == 0:
+        return result
     try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=20.0) as client:
-            resp = await client.get(url, headers=DEFAULT_HEADERS)
+        return extractors.extract(text, result)
+    except Exception:
+        logger.warning("extraction failed for %s", url, exc_info=True)
+        return _empty_result(url)
+
+
+async def _load_cached(key: str):
+    try:
+        return await fetch_cache.load_entry(key)
+    except Exception:
+        logger.warning("fetch cache lookup failed for %s", key, exc_info=True)
+        return None
+
+
+async def _store_cached(key: str, result: dict, resp: httpx.Response) -> None:
+    fetch_cache.memory_cache.set(key, result)
+    try:
+        await fetch_cache.store_entry(
+            key,
+            result,
+            resp.headers.get("etag"),
+            resp.headers.get("last-modified"),
+        )
+    except Exception:
+        logger.warning("fetch cache store failed for %s", key, exc_info=True)
+
+
+async def _revalidated(key: str, result: dict) -> None:
+    fetch_cache.memory_cache.set(key, result)
+    try:
+        await fetch_cache.touch_entry(key)
+    except Exception:
+        logger.warning("fetch cache touch failed for %s", key, exc_info=True)
+
+
+async def fetch_job_from_url(url: str) -> dict:
+    """Fetch job page and extract title, company, description from meta/OG and fallbacks.
+    Always returns a dict with at least source_domain; may include fetch_error if the request failed.
+    Results are served from the two-tier fetch cache when fresh; stale entries are revalidated
+    with If-None-Match / If-Modified-Since, so an unchanged page costs a 304 instead of a download.
+    """
+    # Same key as Job.source_url, so variants of one posting share an entry
+    key = canonicalize_url(url)
+    cached = fetch_cache.memory_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    entry = await _load_cached(key)
+    if entry is not None and fetch_cache.is_fresh(entry):
+        fetch_cache.memory_cache.set(key, entry.result)
+        return dict(entry.result)
+
+    headers = dict(DEFAULT_HEADERS)
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+    result = _empty_result(url)
+    try:
+        async with outbound.get_client(outbound.FETCH).stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304 and entry is not None:
+                await _revalidated(key, entry.result)
+                return dict(entry.result)
             resp.raise_for_status()
-            text = resp.text
+            body = await read_page_prefix(resp, settings.fetch_max_bytes, settings.fetch_head_only)
+        text = _decode(body, detect_charset(resp.headers.get("content-type"), body))
     except httpx.HTTPStatusError as e:
         result["fetch_error"] = f"Site returned {e.response.status_code}. You can still add the application and edit details manually."
-        return result
     except (httpx.ConnectError, httpx.TimeoutException) as e:
         result["fetch_error"] = "Could not reach the URL (timeout or connection error). You can still add the application and edit details manually."
-        return result
     except Exception:
         result["fetch_error"] = "Could not fetch the page. You can still add the application and edit details manually."
-        return result
-
-    if not text or len(text.strip()) == 0:
-        return result
+    if result["fetch_error"]:
+        # Serve a stale copy rather than nothing when the origin is unreachable
+        return dict(entry.result) if entry is not None else result
 
     try:
-        soup = BeautifulSoup(text, "html.parser")
-    except Exception:
+        result = await parse_pool.run(extract_job_fields, text, url)
+    except ParsePoolBusy:
+        result["fetch_error"] = "The server is busy reading other pages. Try again in a moment, or add the details manually."
         return result
-
-    # Open Graph / meta (most job sites set these)
-    og_title = soup.find("meta", property="og:title")
-    if og_title and og_title.get("content"):
-        result["title"] = og_title["content"].strip()[:512]
-    og_desc = soup.find("meta", property="og:description")
-    if og_desc and og_desc.get("content"):
-        result["description"] = og_desc["content"].strip()[:10000]
-    # Twitter card fallback
-    if not result["title"]:
-        tw_title = soup.find("meta", attrs={"name": "twitter:title"})
-        if tw_title and tw_title.get("content"):
-            result["title"] = tw_title["content"].strip()[:512]
-
-    # Standard meta
-    if not result["title"]:
-        meta_title = soup.find("meta", attrs={"name": re.compile(r"title", re.I)})
-        if meta_title and meta_title.get("content"):
-            result["title"] = meta_title["content"].strip()[:512]
-    if not result["title"] and soup.title and soup.title.string:
-        result["title"] = soup.title.string.strip()[:512]
-    if not result["description"]:
-        meta_desc = soup.find("meta", attrs={"name": re.compile(r"description", re.I)})
-        if meta_desc and meta_desc.get("content"):
-            result["description"] = meta_desc["content"].strip()[:10000]
-
-    # Fallback: first <h1> (many job pages have "Job Title" in h1)
-    if not result["title"]:
-        h1 = soup.find("h1")
-        if h1:
-            result["title"] = _extract_text(h1)
-
-    # Heuristic: company from title (e.g. "Senior Engineer at Acme" -> Acme) or domain
-    if not result["company"] and result["title"]:
-        at_match = re.search(r"\s+at\s+([A-Za-z0-9&\s]+?)(?:\s*[-|]|$)", result["title"])
-        if at_match:
-            result["company"] = at_match.group(1).strip()[:255]
-    if not result["company"] and result["source_domain"]:
-        result["company"] = result["source_domain"].replace("www.", "").split(".")[0][:255]
-
+    if result["title"] or result["description"]:
+        await _store_cached(key, result, resp)
     return result
@@ -1,10 +1,27 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.job import Job
+from app.services.job_fetch import canonicalize_url
 
+# Returned by upsert_job (everything JobResponse shows)
+JOB_COLUMNS = (
+    Job.id,
+    Job.source_url,
+    Job.title,
+    Job.company,
+    Job.description,
+    Job.location,
+    Job.source_domain,
+)
+# Fields a create may set; given values replace the stored ones, None keeps them
+JOB_FIELDS = ("title", "company", "description", "location", "source_domain")
 
-def get_or_create_job(
-    db: Session,
+
+async def upsert_job(
+    db: AsyncSession,
     *,
     source_url: str,
     title: str | None = None,
@@ -12,34 +29,26 @@ def get_or_create_job(
     description: str | None = None,
     location: str | None = None,
     source_domain: str | None = None,
-) -> Job:
-    """Find existing Job by source_url or create one. No refetch if already exists."""
-    source_url = source_url.strip()
-    job = db.query(Job).filter(Job.source_url == source_url).first()
-    if job:
-        # Optionally update if we have newer fetched data (e.g. title was missing)
-        if title is not None and job.title != title:
-            job.title = title
-        if company is not None and job.company != company:
-            job.company = company
-        if description is not None:
-            job.description = description
-        if location is not None:
-            job.location = location
-        if source_domain is not None:
-            job.source_domain = source_domain
-        db.commit()
-        db.refresh(job)
-        return job
-    job = Job(
-        source_url=source_url,
-        title=title,
-        company=company,
-        description=description,
-        location=location,
-        source_domain=source_domain,
-    )
-    db.add(job)
-    db.commit()
-    db.refresh(job)
-    return job
+) -> Row:
+    """Find the Job for source_url or create it, in one INSERT ... ON CONFLICT ... RETURNING
+    that cannot race on the unique source_url. No refetch if it already exists. Caller commits,
+    and bumps the job's users (data_version.bump_job_users) when it passed any field.
+
+    Jobs are keyed by the canonical URL (canonicalize_url), like imports and the fetch cache,
+    so tracking-parameter variants of one posting share a Job."""
+    values = {
+        "source_url": canonicalize_url(source_url),
+        "title": title,
+        "company": company,
+        "description": description,
+        "location": location,
+        "source_domain": source_domain,
+    }
+    insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(Job).values(values)
+    # Always DO UPDATE (not DO NOTHING) so RETURNING also yields an existing row
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Job.source_url],
+        set_={name: func.coalesce(getattr(stmt.excluded, name), getattr(Job, name)) for name in JOB_FIELDS},
+    ).returning(*JOB_COLUMNS)
+    return (await db.execute(stmt)).one()
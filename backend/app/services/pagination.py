@@ -0,0 +1,43 @@
+import base64
+import json
+from datetime import date
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _encode(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def encode_cursor(applied_at: date, app_id: int) -> str:
+    """Opaque keyset cursor for (applied_at, id). Clients must pass it back unchanged."""
+    return _encode([applied_at.isoformat(), app_id])
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        applied_at, app_id = _decode(cursor)
+        return date.fromisoformat(applied_at), int(app_id)
+    except Exception as e:
+        raise InvalidCursor("Invalid cursor") from e
+
+
+def encode_rank_cursor(score: float, app_id: int) -> str:
+    """Opaque keyset cursor for (score, id) when results are ordered by search relevance."""
+    return _encode([score, app_id])
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        score, app_id = _decode(cursor)
+        return float(score), int(app_id)
+    except Exception as e:
+        raise InvalidCursor("Invalid cursor") from e
@@ -0,0 +1,131 @@
+"""Bounded worker pool for CPU-bound HTML extraction, so parsing never blocks the event loop.
+
+At most ``parse_pool_workers`` pages parse at once and at most ``parse_pool_max_queue`` more
+wait for a worker. When the queue is full, callers wait up to ``parse_pool_queue_timeout``
+seconds for room and then get ParsePoolBusy (backpressure instead of unbounded memory growth).
+"""
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class ParsePoolBusy(Exception):
+    pass
+
+
+def _timed_call(fn: Callable, args: tuple) -> tuple[Any, float, float]:
+    # time.monotonic() is system-wide, so start/end are comparable across worker processes
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started, time.monotonic()
+
+
+class ParsePoolStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.parse_total = 0.0
+        self.parse_max = 0.0
+
+    def record(self, wait: float, parse: float) -> None:
+        with self._lock:
+            self.completed += 1
+            self.queue_wait_total += wait
+            self.queue_wait_max = max(self.queue_wait_max, wait)
+            self.parse_total += parse
+            self.parse_max = max(self.parse_max, parse)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            done = self.completed or 1
+            return {
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "in_flight": self.in_flight,
+                "queue_wait_avg_ms": round(self.queue_wait_total / done * 1000, 3),
+                "queue_wait_max_ms": round(self.queue_wait_max * 1000, 3),
+                "parse_avg_ms": round(self.parse_total / done * 1000, 3),
+                "parse_max_ms": round(self.parse_max * 1000, 3),
+            }
+
+
+class ParsePool:
+    def __init__(self, kind: str, workers: int, max_queue: int, queue_timeout: float):
+        self.kind = kind
+        self.workers = workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.stats = ParsePoolStats()
+        self._executor: Executor | None = None
+        # asyncio primitives belong to one event loop: one semaphore per loop using the pool
+        # (tests, or a worker that runs asyncio.run again in the same process)
+        self._slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _ensure_started(self) -> None:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="parse")
+
+    def _loop_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.workers + self.max_queue)
+        return slots
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        """Run ``fn(*args)`` in the pool. ``fn`` must be a picklable module-level function in process mode."""
+        self._ensure_started()
+        slots = self._loop_slots()
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.stats.rejected += 1
+            raise ParsePoolBusy("Parse queue is full")
+        self.stats.in_flight += 1
+        submitted = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            result, started, finished = await loop.run_in_executor(self._executor, _timed_call, fn, args)
+        except BaseException:
+            self.stats.failed += 1
+            raise
+        finally:
+            self.stats.in_flight -= 1
+            slots.release()
+        self.stats.record(max(started - submitted, 0.0), finished - started)
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._slots.clear()
+
+
+parse_pool = ParsePool(
+    kind=settings.parse_pool_kind,
+    workers=settings.parse_pool_workers,
+    max_queue=settings.parse_pool_max_queue,
+    queue_timeout=settings.parse_pool_queue_timeout,
+)
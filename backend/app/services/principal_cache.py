@@ -0,0 +1,54 @@
+"""Per-process cache of authenticated principals for deps.get_current_user_optional.
+
+Two bounded maps: verified JWT -> user id, kept until the token expires (a hit skips signature
+verification), and user id -> detached snapshot of the active User, kept for
+``auth_cache_ttl_seconds``. Code that changes a user calls invalidate_user() after committing, so
+this worker sees the change on the next request; other workers see it once their snapshot expires.
+"""
+import time
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.security import decode_access_token
+from app.models.user import User
+
+settings = get_settings()
+
+token_cache = TTLCache(maxsize=settings.auth_cache_max_entries, ttl=settings.auth_cache_ttl_seconds)
+user_cache = TTLCache(maxsize=settings.auth_cache_max_entries, ttl=settings.auth_cache_ttl_seconds)
+
+
+def token_user_id(token: str) -> int | None:
+    """User id from a valid access token, or None. Invalid tokens are not cached."""
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+    payload = decode_access_token(token)
+    if not payload:
+        return None
+    try:
+        user_id = int(payload.get("sub"))
+    except (TypeError, ValueError):
+        return None
+    lifetime = payload.get("exp", 0) - time.time()
+    if lifetime > 0:
+        token_cache.set(token, user_id, ttl=lifetime)
+    return user_id
+
+
+def get_user(user_id: int) -> User | None:
+    return user_cache.get(user_id)
+
+
+def put_user(user: User) -> None:
+    """Cache ``user``, which must be loaded and detached from its session (shared across requests)."""
+    user_cache.set(user.id, user)
+
+
+def invalidate_user(user_id: int) -> None:
+    user_cache.pop(user_id)
+
+
+def clear() -> None:
+    token_cache.clear()
+    user_cache.clear()
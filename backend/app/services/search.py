@@ -0,0 +1,102 @@
+"""Full-text search over job title/company, application notes and interview-session notes.
+
+Postgres uses the generated ``search_vector`` tsvector columns plus pg_trgm indexes on
+jobs.title / jobs.company (migration 006). SQLite uses the FTS5 tables kept in sync by
+triggers from the same migration. Both return a subquery of (app_id, score) for the
+user's matching applications, where a higher score is a better match.
+"""
+import re
+
+from sqlalchemy import column, func, literal_column, select, table, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Subquery
+
+from app.models.application import InterviewSession, JobApplication
+from app.models.job import Job
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+MAX_TOKENS = 8
+
+# FTS5 external-content tables (SQLite only); rowid is the id of the source row
+_jobs_fts = table("jobs_fts", column("rowid"), column("rank"))
+_apps_fts = table("job_applications_fts", column("rowid"), column("rank"))
+_sessions_fts = table("interview_sessions_fts", column("rowid"), column("rank"))
+
+
+def search_tokens(term: str | None) -> list[str]:
+    """Split free text into lowercase word tokens; punctuation and query operators are dropped."""
+    return [t.lower() for t in _TOKEN_RE.findall(term or "")][:MAX_TOKENS]
+
+
+def _ranked(*selects) -> Subquery:
+    hits = union_all(*selects).subquery("hits")
+    return (
+        select(hits.c.app_id, func.max(hits.c.score).label("score"))
+        .group_by(hits.c.app_id)
+        .subquery("search_matches")
+    )
+
+
+def _pg_matches(tokens: list[str], term: str, user_id: int) -> Subquery:
+    tsq = func.to_tsquery("simple", " & ".join(f"{t}:*" for t in tokens))
+    like = f"%{term.strip()}%"
+    job_vec = literal_column("jobs.search_vector")
+    notes_vec = literal_column("job_applications.search_vector")
+    session_vec = literal_column("interview_sessions.search_vector")
+    by_job = (
+        select(
+            JobApplication.id.label("app_id"),
+            # Substring-only hits (served by the trigram indexes) still score above zero
+            (func.ts_rank(job_vec, tsq) + 0.01).label("score"),
+        )
+        .join(Job, Job.id == JobApplication.job_id)
+        .where(
+            JobApplication.user_id == user_id,
+            job_vec.op("@@")(tsq) | Job.title.ilike(like) | Job.company.ilike(like),
+        )
+    )
+    by_notes = select(
+        JobApplication.id.label("app_id"),
+        func.ts_rank(notes_vec, tsq).label("score"),
+    ).where(JobApplication.user_id == user_id, notes_vec.op("@@")(tsq))
+    by_session = (
+        select(
+            InterviewSession.job_application_id.label("app_id"),
+            func.ts_rank(session_vec, tsq).label("score"),
+        )
+        .where(InterviewSession.user_id == user_id, session_vec.op("@@")(tsq))
+    )
+    return _ranked(by_job, by_notes, by_session)
+
+
+def _sqlite_matches(tokens: list[str], user_id: int) -> Subquery:
+    match = " ".join(f'"{t}"*' for t in tokens)
+    # FTS5 rank is bm25(), where lower (more negative) is better
+    by_job = (
+        select(JobApplication.id.label("app_id"), (-_jobs_fts.c.rank).label("score"))
+        .join(_jobs_fts, _jobs_fts.c.rowid == JobApplication.job_id)
+        .where(JobApplication.user_id == user_id, literal_column("jobs_fts").op("MATCH")(match))
+    )
+    by_notes = (
+        select(JobApplication.id.label("app_id"), (-_apps_fts.c.rank).label("score"))
+        .join(_apps_fts, _apps_fts.c.rowid == JobApplication.id)
+        .where(JobApplication.user_id == user_id, literal_column("job_applications_fts").op("MATCH")(match))
+    )
+    by_session = (
+        select(InterviewSession.job_application_id.label("app_id"), (-_sessions_fts.c.rank).label("score"))
+        .join(_sessions_fts, _sessions_fts.c.rowid == InterviewSession.id)
+        .where(InterviewSession.user_id == user_id, literal_column("interview_sessions_fts").op("MATCH")(match))
+    )
+    return _ranked(by_job, by_notes, by_session)
+
+
+def search_applications(db: AsyncSession, term: str | None, user_id: int) -> Subquery | None:
+    """Return a (app_id, score) subquery of the user's applications matching ``term``.
+    None when the term has no searchable tokens (caller should return no rows).
+    """
+    tokens = search_tokens(term)
+    if not tokens:
+        return None
+    if db.bind.dialect.name == "postgresql":
+        return _pg_matches(tokens, term, user_id)
+    return _sqlite_matches(tokens, user_id)
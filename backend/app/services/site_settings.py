@@ -0,0 +1,99 @@
+"""Site settings (site_settings table) served from an in-process snapshot.
+
+All rows are loaded in one query into an immutable snapshot. Every write also replaces the
+``settings_version`` row in the same transaction, so each worker polls that single row every
+``site_settings_refresh_seconds`` (watch(), started by the app lifespan) and reloads only when
+it changed. Request handling, including the maintenance-mode gate, reads the snapshot and never
+the database.
+"""
+import asyncio
+import logging
+import uuid
+from types import MappingProxyType
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.models.settings import SiteSettings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "settings_version"
+SITE_NAME = "site_name"
+MAINTENANCE_MODE = "maintenance_mode"
+
+
+class SettingsSnapshot:
+    __slots__ = ("values", "version")
+
+    def __init__(self, values: dict[str, str | None], version: str | None):
+        self.values = MappingProxyType(values)
+        self.version = version
+
+    def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    @property
+    def maintenance_mode(self) -> bool:
+        return self.values.get(MAINTENANCE_MODE) == "true"
+
+
+_snapshot = SettingsSnapshot({}, None)
+_loaded = False
+
+
+def current() -> SettingsSnapshot:
+    return _snapshot
+
+
+def maintenance_enabled() -> bool:
+    return _snapshot.maintenance_mode
+
+
+async def load(db: AsyncSession) -> SettingsSnapshot:
+    """Replace the snapshot with every row, read in one query."""
+    global _snapshot, _loaded
+    rows = (await db.execute(select(SiteSettings.key, SiteSettings.value))).all()
+    values = {key: value for key, value in rows}
+    version = values.pop(VERSION_KEY, None)
+    _snapshot = SettingsSnapshot(values, version)
+    _loaded = True
+    return _snapshot
+
+
+async def refresh_if_changed(db: AsyncSession) -> bool:
+    version = await db.scalar(select(SiteSettings.value).where(SiteSettings.key == VERSION_KEY))
+    if _loaded and version == _snapshot.version:
+        return False
+    await load(db)
+    return True
+
+
+async def update(db: AsyncSession, changes: dict[str, str | None]) -> SettingsSnapshot:
+    """Write ``changes`` and a new version stamp in one transaction, then reload this worker's snapshot."""
+    changes = {**changes, VERSION_KEY: uuid.uuid4().hex}
+    rows = await db.scalars(select(SiteSettings).where(SiteSettings.key.in_(changes)))
+    existing = {row.key: row for row in rows}
+    for key, value in changes.items():
+        row = existing.get(key)
+        if row is None:
+            db.add(SiteSettings(key=key, value=value))
+        else:
+            row.value = value
+    await db.commit()
+    return await load(db)
+
+
+async def watch(interval: float = settings.site_settings_refresh_seconds) -> None:
+    """Keep the snapshot current; runs until cancelled. The first load happens immediately."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                if await refresh_if_changed(db):
+                    logger.info("site settings loaded (version %s)", _snapshot.version)
+        except Exception:
+            logger.warning("site settings refresh failed", exc_info=True)
+        await asyncio.sleep(interval)
@@ -0,0 +1,85 @@
+"""Per-user statistics counters on users (total_applied, total_rejected, total_success).
+
+The counters describe the current state of a user's applications: how many exist, how many are
+rejected and how many got an offer. Write paths collect the net change of their status
+transitions (count_change) and add it server-side, in the UPDATE that bumps data_version, so
+concurrent requests never lose an increment and an application moving from rejected to
+got_offer moves between counters instead of being counted twice. reconcile() recomputes them
+from job_applications (python -m app.commands.reconcile_user_stats).
+"""
+from sqlalchemy import Update, case, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.application import JobApplication
+from app.models.user import User
+
+# Status -> the counter holding applications in that status
+STATUS_COUNTERS = {"rejected": "total_rejected", "got_offer": "total_success"}
+COUNTERS = ("total_applied", "total_rejected", "total_success")
+
+
+def new_counts() -> dict[str, int]:
+    return dict.fromkeys(COUNTERS, 0)
+
+
+def count_change(counts: dict[str, int], old: str | None, new: str | None) -> None:
+    """Add one application's status change to ``counts``: old=None for a new application,
+    new=None for a removed one."""
+    if old == new:
+        return
+    if old is None:
+        counts["total_applied"] += 1
+    if new is None:
+        counts["total_applied"] -= 1
+    if old in STATUS_COUNTERS:
+        counts[STATUS_COUNTERS[old]] -= 1
+    if new in STATUS_COUNTERS:
+        counts[STATUS_COUNTERS[new]] += 1
+
+
+def add_counts(stmt: Update, counts: dict[str, int], user_id: int | None = None) -> Update:
+    """Add ``counts`` to an UPDATE of users (e.g. data_version.bump_users) as in-place increments.
+    With ``user_id``, only that user's row gets them (for updates that touch other users too)."""
+    values = {}
+    for name, n in counts.items():
+        if n:
+            delta = n if user_id is None else case((User.id == user_id, n), else_=0)
+            values[name] = getattr(User, name) + delta
+    return stmt.values(values) if values else stmt
+
+
+def reconcile(db: Session, user_id: int | None = None) -> int:
+    """Set the counters (of one user, or everyone) from job_applications in one GROUP BY pass
+    and commit. Users whose counters drifted also get a data_version bump. Returns their number."""
+    actual = select(
+        JobApplication.user_id,
+        func.count().label("total_applied"),
+        func.sum(case((JobApplication.status == "rejected", 1), else_=0)).label("total_rejected"),
+        func.sum(case((JobApplication.status == "got_offer", 1), else_=0)).label("total_success"),
+    ).group_by(JobApplication.user_id)
+    if user_id is not None:
+        actual = actual.where(JobApplication.user_id == user_id)
+    actual = actual.subquery()
+    fixed = db.execute(
+        update(User)
+        .where(
+            User.id == actual.c.user_id,
+            or_(*(getattr(User, name) != actual.c[name] for name in COUNTERS)),
+        )
+        .values({name: actual.c[name] for name in COUNTERS} | {"data_version": User.data_version + 1})
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    # Users without applications are not in the GROUP BY
+    idle = update(User).where(
+        ~select(JobApplication.id).where(JobApplication.user_id == User.id).exists(),
+        or_(*(getattr(User, name) != 0 for name in COUNTERS)),
+    )
+    if user_id is not None:
+        idle = idle.where(User.id == user_id)
+    fixed += db.execute(
+        idle.values(dict.fromkeys(COUNTERS, 0) | {"data_version": User.data_version + 1}).execution_options(
+            synchronize_session=False
+        )
+    ).rowcount
+    db.commit()
+    return fixed
@@ -0,0 +1,105 @@
+"""Background job-metadata fetch worker.
+
+    python -m app.workers.fetch [--once] [--batch-size N] [--poll-seconds S]
+
+Claims due rows from fetch_tasks, runs fetch_job_from_url for each concurrently and fills in the
+Job. Run as many worker processes as you need; Postgres SKIP LOCKED keeps them from colliding.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+
+from app.core import outbound
+from app.core.config import get_settings
+from app.core.database import SessionLocal, async_engine
+from app.models.fetch_task import FetchTask
+from app.models.job import Job
+from app.services import fetch_queue
+from app.services.job_fetch import fetch_job_from_url
+from app.services.parse_pool import parse_pool
+
+settings = get_settings()
+logger = logging.getLogger("app.workers.fetch")
+
+
+def _finish(task_id: int, result: dict | None, error: str | None) -> None:
+    db = SessionLocal()
+    try:
+        task = db.get(FetchTask, task_id)
+        if task is None:
+            return
+        if error:
+            fetch_queue.fail_task(db, task, error)
+            logger.info("fetch task %s failed (attempt %s): %s", task_id, task.attempts, error)
+        else:
+            fetch_queue.complete_task(db, task, result)
+    finally:
+        db.close()
+
+
+async def _process(task_id: int, url: str) -> None:
+    try:
+        result = await fetch_job_from_url(url)
+        error = result.get("fetch_error")
+    except Exception as e:
+        logger.exception("fetch task %s crashed", task_id)
+        result, error = None, f"{type(e).__name__}: {e}"
+    await asyncio.to_thread(_finish, task_id, result, error)
+
+
+def _claim(worker_id: str, limit: int) -> list[tuple[int, str]]:
+    db = SessionLocal()
+    try:
+        tasks = fetch_queue.claim_tasks(db, worker_id, limit)
+        if not tasks:
+            return []
+        urls = dict(db.query(Job.id, Job.source_url).filter(Job.id.in_([t.job_id for t in tasks])).all())
+        return [(t.id, urls[t.job_id]) for t in tasks if t.job_id in urls]
+    finally:
+        db.close()
+
+
+async def run(batch_size: int, poll_seconds: float, once: bool = False) -> None:
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+    logger.info("fetch worker %s started", worker_id)
+    try:
+        while not stop.is_set():
+            claimed = await asyncio.to_thread(_claim, worker_id, batch_size)
+            if claimed:
+                await asyncio.gather(*(_process(task_id, url) for task_id, url in claimed))
+            if once:
+                break
+            if not claimed:
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+    finally:
+        await outbound.shutdown()
+        parse_pool.shutdown()
+        await async_engine.dispose()
+        logger.info("fetch worker %s stopped", worker_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fill in job metadata from queued fetch tasks.")
+    parser.add_argument("--batch-size", type=int, default=settings.fetch_worker_batch_size)
+    parser.add_argument("--poll-seconds", type=float, default=settings.fetch_worker_poll_seconds)
+    parser.add_argument("--once", action="store_true", help="Process one batch and exit")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(run(args.batch_size, args.poll_seconds, once=args.once))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Drive an ASGI app in-process: one request = scope + receive/send callables, no sockets."""
+import asyncio
+import time
+
+
+def http_scope(method: str, path: str, headers: list[tuple[bytes, bytes]] = ()) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver"), *headers],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+
+
+async def request(app, scope: dict, body: bytes = b"") -> int:
+    """Run one request; returns the response body size."""
+    sent_body = False
+    size = 0
+
+    async def receive():
+        nonlocal sent_body
+        if sent_body:
+            # Like a server, block until the client goes away (cancelled once the response is done)
+            await asyncio.Event().wait()
+        sent_body = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(dict(scope), receive, send)
+    return size
+
+
+async def time_requests(app, scope: dict, n: int, warmup: int = 200) -> float:
+    """Mean microseconds per request over ``n`` requests, after ``warmup`` untimed ones."""
+    for _ in range(warmup):
+        await request(app, scope)
+    started = time.perf_counter()
+    for _ in range(n):
+        await request(app, scope)
+    return (time.perf_counter() - started) / n * 1e6
@@ -0,0 +1,87 @@
+"""Per-request overhead of the CORS layer, driving the ASGI app directly (no sockets).
+
+    cd backend && python -m benchmarks.cors_middleware [--requests 20000]
+
+Compares a bare app, the previous stack (BaseHTTPMiddleware preflight + Starlette's
+CORSMiddleware) and app.core.cors.CORSMiddleware, for a simple GET with an allowed Origin and
+for a preflight.
+"""
+import argparse
+import asyncio
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+
+from app.core.cors import CORSMiddleware, cors_allow_origin
+from benchmarks._asgi import http_scope, time_requests
+
+ORIGIN = b"http://localhost:3000"
+
+
+async def _ok(request: Request) -> Response:
+    return PlainTextResponse("ok")
+
+
+def _bare():
+    return Starlette(routes=[Route("/api/health", _ok)])
+
+
+class _LegacyPreflight(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "OPTIONS":
+            return await call_next(request)
+        allow = cors_allow_origin(request.headers.get("origin"))
+        headers = {
+            "Access-Control-Max-Age": "86400",
+            "Access-Control-Allow-Methods": "GET, POST, PUT, PATCH, DELETE, OPTIONS",
+            "Access-Control-Allow-Headers": "*",
+            "Access-Control-Allow-Credentials": "true",
+        }
+        if allow:
+            headers["Access-Control-Allow-Origin"] = allow
+        return Response(status_code=200, headers=headers)
+
+
+def _legacy():
+    app = _bare()
+    app.add_middleware(
+        StarletteCORSMiddleware,
+        allow_origins=["http://localhost:3000"],
+        allow_origin_regex=r"https://.*\.vercel\.app",
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
+    )
+    app.add_middleware(_LegacyPreflight)
+    return app
+
+
+def _current():
+    app = _bare()
+    app.add_middleware(CORSMiddleware, expose_headers=["X-Next-Cursor"])
+    return app
+
+
+async def _drive(app, method: str, n: int) -> float:
+    return await time_requests(app, http_scope(method, "/api/health", [(b"origin", ORIGIN)]), n)
+
+
+async def main(n: int) -> None:
+    bare = await _drive(_bare(), "GET", n)
+    print(f"{'stack':<10} {'GET us/req':>11} {'+overhead':>10} {'OPTIONS us/req':>15}")
+    print(f"{'bare':<10} {bare:>11.1f} {'':>10} {'':>15}")
+    for name, factory in (("legacy", _legacy), ("asgi", _current)):
+        get = await _drive(factory(), "GET", n)
+        options = await _drive(factory(), "OPTIONS", n)
+        print(f"{name:<10} {get:>11.1f} {get - bare:>10.1f} {options:>15.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,189 @@
+"""Database round trips and latency of POST /api/applications, previous vs current write path.
+
+    cd backend && python -m benchmarks.create_application [--requests 300] [--rtt-ms 0.5]
+
+Runs against a throwaway SQLite file. Every statement and commit counts as a round trip;
+--rtt-ms adds that much delay to each one to stand in for the network hop to Postgres, which
+is where the saved round trips show up in latency. "new job" posts a URL never seen before,
+"known job" one another user already applied to (with a title, so the shared job is updated).
+"""
+import os
+import tempfile
+
+_DB = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB}"
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import time  # noqa: E402
+from typing import Annotated  # noqa: E402
+
+from fastapi import Depends, FastAPI, HTTPException, status  # noqa: E402
+from sqlalchemy import event, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.api import applications  # noqa: E402
+from app.api.applications import _JOB_WITH_DESCRIPTION, _to_payload  # noqa: E402
+from app.api.deps import get_current_user  # noqa: E402
+from app.core.database import Base, SessionLocal, async_engine, engine, get_async_db  # noqa: E402
+from app.core.responses import fast_json  # noqa: E402
+from app.models.application import ACTIVE_STATUSES, JobApplication  # noqa: E402
+from app.models.job import Job  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.application import ApplicationCreate  # noqa: E402
+from app.services import activity, data_version  # noqa: E402
+from app.services.fetch_queue import enqueue_job_fetch, needs_enrichment  # noqa: E402
+from benchmarks._asgi import http_scope, request  # noqa: E402
+
+
+class _RoundTrips:
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.count = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.count += 1
+        if self.rtt:
+            # Runs inside the async driver's greenlet: blocks like a network wait would
+            time.sleep(self.rtt)
+
+
+async def _legacy_get_or_create_job(db: AsyncSession, *, source_url: str, **fields) -> Job:
+    job = await db.scalar(select(Job).where(Job.source_url == source_url.strip()))
+    if job:
+        for name, value in fields.items():
+            if value is not None:
+                setattr(job, name, value)
+        if db.is_modified(job):
+            await db.execute(data_version.bump_job_users(job.id))
+        await db.commit()
+        await db.refresh(job)
+        return job
+    job = Job(source_url=source_url.strip(), **fields)
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+async def _legacy_create(
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    body: ApplicationCreate,
+):
+    """create_application before the single-transaction rewrite."""
+    job = await _legacy_get_or_create_job(
+        db,
+        source_url=body.source_url,
+        title=body.title,
+        company=body.company,
+        description=body.description,
+        source_domain=body.source_domain,
+    )
+    existing = await db.scalar(
+        select(JobApplication.id)
+        .where(
+            JobApplication.user_id == user.id,
+            JobApplication.job_id == job.id,
+            JobApplication.status.in_(ACTIVE_STATUSES),
+        )
+        .limit(1)
+    )
+    if existing:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT)
+    app = JobApplication(user_id=user.id, job_id=job.id, applied_at=body.applied_at, status=body.status)
+    db.add(app)
+    if needs_enrichment(job):
+        await enqueue_job_fetch(db, job.id)
+    u = await db.get(User, user.id)
+    if u:
+        u.total_applied = (u.total_applied or 0) + 1
+    deltas = activity.new_deltas()
+    activity.count(deltas, user.id, body.applied_at, job.source_url, body.status)
+    await activity.apply(db, deltas)
+    await db.execute(data_version.bump_users(user.id))
+    await db.commit()
+    await db.refresh(app)
+    result = await db.execute(
+        select(JobApplication)
+        .options(_JOB_WITH_DESCRIPTION, joinedload(JobApplication.interview_sessions))
+        .where(JobApplication.id == app.id)
+        .execution_options(populate_existing=True)
+    )
+    return fast_json(_to_payload(result.unique().scalar_one()), status_code=status.HTTP_201_CREATED)
+
+
+def _setup(n: int) -> tuple[FastAPI, list[User]]:
+    Base.metadata.create_all(engine)
+    with SessionLocal() as db:
+        users = [User(email=f"bench{i}@example.com", provider="google", provider_id=str(i)) for i in range(3)]
+        db.add_all(users)
+        db.flush()
+        # Jobs another user (users[2]) already applied to, for the "known job" runs
+        for path in ("legacy", "current"):
+            for i in range(n):
+                job = Job(source_url=f"https://jobs.example.com/known/{path}/{i}", title="Engineer", company="Acme")
+                db.add(job)
+                db.flush()
+                db.add(JobApplication(user_id=users[2].id, job_id=job.id, applied_at=job.created_at.date()))
+        db.commit()
+        for user in users:
+            db.refresh(user)
+            db.expunge(user)
+    app = FastAPI()
+    app.include_router(applications.router)
+    app.add_api_route("/legacy", _legacy_create, methods=["POST"], status_code=201)
+    return app, users
+
+
+async def _run(app: FastAPI, path: str, bodies: list[dict], trips: _RoundTrips) -> tuple[float, float, float]:
+    scope = http_scope("POST", path, [(b"content-type", b"application/json")])
+    latencies = []
+    trips.count = 0
+    for body in bodies:
+        started = time.perf_counter()
+        await request(app, scope, json.dumps(body).encode())
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    return trips.count / len(bodies), p50, p99
+
+
+async def main(n: int, rtt_ms: float) -> None:
+    app, users = _setup(n)
+    trips = _RoundTrips(rtt_ms / 1000)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", trips)
+    event.listen(async_engine.sync_engine, "commit", trips)
+    print(f"{n} requests per row, {rtt_ms} ms per round trip")
+    print(f"{'scenario':<12} {'path':<8} {'round trips':>11} {'p50 ms':>8} {'p99 ms':>8}")
+    for scenario in ("new job", "known job"):
+        for user, (name, path) in zip(users, (("legacy", "/legacy"), ("current", "/api/applications"))):
+            app.dependency_overrides[get_current_user] = lambda user=user: user
+            kind = "new" if scenario == "new job" else f"known/{name}"
+            bodies = [
+                {
+                    "source_url": f"https://jobs.example.com/{kind}/{i}",
+                    "applied_at": "2026-10-01",
+                    "title": "Engineer",
+                    "company": "Acme",
+                }
+                for i in range(n)
+            ]
+            if scenario == "new job":
+                for body in bodies:
+                    body["source_url"] += f"/{name}"
+            per_request, p50, p99 = await _run(app, path, bodies, trips)
+            print(f"{scenario:<12} {name:<8} {per_request:>11.1f} {p50:>8.2f} {p99:>8.2f}")
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rtt_ms))
@@ -0,0 +1,77 @@
+"""Serialization cost of a large application list, per request (in-process ASGI, no DB).
+
+    cd backend && python -m benchmarks.list_serialization [--rows 5000] [--requests 20]
+
+"pydantic" is the previous path: an ApplicationListResponse per row, then FastAPI re-validates
+against response_model and encodes. "fast" returns app.core.responses.FastJSONResponse built from
+the same rows, with orjson if installed and pydantic-core's encoder otherwise.
+"""
+import argparse
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import FastAPI
+
+from app.api.applications import LIST_FIELDS
+from app.core import responses
+from app.core.responses import fast_json
+from app.schemas.application import ApplicationListResponse
+from benchmarks._asgi import http_scope, request, time_requests
+
+
+def _rows(n: int) -> list[tuple]:
+    created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        (
+            i,
+            i // 2,
+            date(2026, 1, 1) + timedelta(days=i % 365),
+            ("applied", "in_progress", "rejected")[i % 3],
+            created + timedelta(minutes=i),
+            f"https://boards.example.com/acme/jobs/{i}",
+            f"Senior Software Engineer {i}",
+            "Acme Corporation",
+            "boards.example.com",
+        )
+        for i in range(n)
+    ]
+
+
+def _app(rows: list[tuple]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/pydantic", response_model=list[ApplicationListResponse])
+    async def pydantic_path():
+        return [ApplicationListResponse(**dict(zip(LIST_FIELDS, row))) for row in rows]
+
+    @app.get("/fast", response_model=list[ApplicationListResponse])
+    async def fast_path():
+        return fast_json([dict(zip(LIST_FIELDS, row)) for row in rows])
+
+    return app
+
+
+async def main(n_rows: int, n_requests: int) -> None:
+    app = _app(_rows(n_rows))
+    variants = [("pydantic", "/pydantic", responses.orjson)]
+    if responses.orjson is not None:
+        variants.append(("fast+orjson", "/fast", responses.orjson))
+    variants.append(("fast+pydantic-core", "/fast", None))
+    print(f"{n_rows} rows")
+    print(f"{'path':<20} {'ms/req':>8} {'bytes':>9}")
+    baseline = None
+    for name, path, encoder in variants:
+        responses.orjson = encoder
+        scope = http_scope("GET", path)
+        size = await request(app, scope)
+        ms = await time_requests(app, scope, n_requests, warmup=3) / 1000
+        baseline = baseline or ms
+        print(f"{name:<20} {ms:>8.2f} {size:>9}  ({baseline / ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.requests))
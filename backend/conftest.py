@@ -1,9 +1,48 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.api.deps import get_current_user
+from app.core.database import Base, async_database_url, get_async_db
 from app.main import app
+from app.models.user import User
 
 
 @pytest.fixture
 def client() -> TestClient:
     return TestClient(app)
+
+
+@pytest.fixture
+def api(tmp_path):
+    """TestClient on a fresh SQLite database, signed in as ``api.user``. ``api.engine`` is a sync
+    engine on the same file for arranging and checking rows. The lifespan does not run."""
+    url = f"sqlite:///{tmp_path / 'api.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with Session(engine, expire_on_commit=False) as db:
+        user = User(email="user@example.com", provider="google", provider_id="1")
+        db.add(user)
+        db.commit()
+    # NullPool: without the lifespan, TestClient runs each request on a new event loop
+    async_engine = create_async_engine(async_database_url(url), poolclass=NullPool)
+    sessions = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def db_override():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = db_override
+    app.dependency_overrides[get_current_user] = lambda: user
+    test_client = TestClient(app)
+    test_client.user = user
+    test_client.engine = engine
+    try:
+        yield test_client
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
@@ -0,0 +1,36 @@
+"""Activity rollup delta tests (no DB)."""
+from datetime import date
+
+from sqlalchemy.dialects import postgresql
+
+from app.services import activity
+
+
+def test_rollup_domain_uses_url_host() -> None:
+    assert activity.rollup_domain("https://www.Lever.co/acme/1") == "lever.co"
+    assert activity.rollup_domain("https://boards.greenhouse.io:443/x") == "boards.greenhouse.io"
+    assert activity.rollup_domain("not a url") == ""
+    assert activity.rollup_domain(None) == ""
+
+
+def test_status_and_date_changes_move_one_application() -> None:
+    deltas = activity.new_deltas()
+    day1, day2 = date(2026, 1, 1), date(2026, 1, 2)
+    activity.count(deltas, 1, day1, "https://lever.co/a", "applied")
+    activity.count_change(deltas, 1, "https://lever.co/a", (day1, "applied"), (day2, "rejected"))
+    activity.count_change(deltas, 1, "https://lever.co/a", (day2, "rejected"), (day2, "rejected"))
+    assert deltas[(1, day1, "lever.co")]["applications"] == 0
+    assert deltas[(1, day1, "lever.co")]["status_applied"] == 0
+    assert deltas[(1, day2, "lever.co")]["applications"] == 1
+    assert deltas[(1, day2, "lever.co")]["status_rejected"] == 1
+
+
+def test_upsert_statement_skips_empty_deltas() -> None:
+    deltas = activity.new_deltas()
+    activity.count(deltas, 1, date(2026, 1, 1), None, "applied")
+    activity.count(deltas, 1, date(2026, 1, 1), None, "applied", sign=-1)
+    assert activity.upsert_statement("sqlite", deltas) is None
+    activity.count(deltas, 2, date(2026, 1, 1), None, "applied")
+    sql = str(activity.upsert_statement("postgresql", deltas).compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (user_id, day, source_domain) DO UPDATE" in sql
+
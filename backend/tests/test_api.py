@@ -1,6 +1,19 @@
-"""API endpoint tests (no DB required)."""
+"""API endpoint tests: `client` needs no DB, `api` runs against a throwaway SQLite file."""
+from datetime import date, datetime, timedelta, timezone
+
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.api.applications import _raise_if_active_conflict
+from app.models.activity import ActivityDaily
+from app.models.application import ACTIVE_INDEX
+from app.models.fetch_task import FetchTask
+from app.models.job import Job
+from app.services import activity
 
 
 def test_root_returns_200_and_message(client: TestClient) -> None:
@@ -29,3 +42,153 @@ def test_options_preflight_returns_200(client: TestClient) -> None:
     )
     assert response.status_code == 200
     assert "access-control-allow-methods" in [h.lower() for h in response.headers.keys()]
+
+
+def test_preflight_echoes_allowed_origin_only(client: TestClient) -> None:
+    allowed = client.options("/api/applications", headers={"Origin": "https://preview-1.vercel.app"})
+    assert allowed.headers["access-control-allow-origin"] == "https://preview-1.vercel.app"
+    denied = client.options("/api/applications", headers={"Origin": "https://evil.example"})
+    assert denied.status_code == 200
+    assert "access-control-allow-origin" not in denied.headers
+
+
+def test_simple_response_gets_cors_headers(client: TestClient) -> None:
+    response = client.get("/api/health", headers={"Origin": "http://localhost:3000"})
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-expose-headers"] == "X-Next-Cursor, ETag"
+    assert response.headers["vary"] == "Origin"
+    assert "access-control-allow-origin" not in client.get("/api/health").headers
+
+
+def test_create_and_import_keep_urls_that_do_not_parse(api: TestClient) -> None:
+    created = api.post("/api/applications", json={"source_url": "http://jobs.example:99999/1", "applied_at": "2026-01-02"})
+    assert created.status_code == 201
+    assert created.json()["job"]["source_url"] == "http://jobs.example:99999/1"
+    imported = api.post(
+        "/api/applications/import",
+        content=b"source_url,applied_at\nhttp://[::1/2,2026-01-02\nhttp://[::1]:8000/3/,2026-01-02\n",
+        headers={"Content-Type": "text/csv"},
+    )
+    assert imported.status_code == 200
+    assert imported.json() == {"imported": 2, "failed": 0, "errors": []}
+    urls = api.get("/api/applications").json()
+    assert sorted(row["source_url"] for row in urls) == [
+        "http://[::1/2",
+        "http://[::1]:8000/3",
+        "http://jobs.example:99999/1",
+    ]
+
+
+def test_second_active_application_for_a_job_is_a_conflict(api: TestClient) -> None:
+    body = {"source_url": "https://jobs.example/1", "applied_at": "2026-01-02"}
+    first = api.post("/api/applications", json=body)
+    assert first.status_code == 201
+    assert api.post("/api/applications", json={**body, "status": "in_progress"}).status_code == 409
+    first_id = first.json()["id"]
+    assert api.patch(f"/api/applications/{first_id}", json={"status": "rejected"}).status_code == 200
+    assert api.post("/api/applications", json=body).status_code == 201
+    # Reviving the withdrawn one would make two active applications
+    revived = api.patch(f"/api/applications/{first_id}", json={"status": "applied"})
+    assert revived.status_code == 409
+    assert "active application" in revived.json()["detail"]
+
+
+def test_only_the_active_index_is_reported_as_a_conflict() -> None:
+    class Diag:
+        constraint_name = "jobs_source_url_key"
+
+    class DriverError(Exception):
+        diag = Diag()
+
+    # The driver's constraint name wins over the message text
+    exc = IntegrityError("INSERT ...", {}, DriverError(f"mentions {ACTIVE_INDEX}"))
+    _raise_if_active_conflict(exc)
+    Diag.constraint_name = ACTIVE_INDEX
+    with pytest.raises(HTTPException) as raised:
+        _raise_if_active_conflict(exc)
+    assert raised.value.status_code == 409
+
+
+def _create(api: TestClient, url: str, applied_at: str = "2026-01-02", **fields) -> dict:
+    response = api.post("/api/applications", json={"source_url": url, "applied_at": applied_at, **fields})
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_bulk_update_reports_missing_ids_and_moves_the_counters(api: TestClient) -> None:
+    ids = [_create(api, f"https://jobs.example/{i}")["id"] for i in range(3)]
+    assert api.get("/api/dashboard/stats").json() == {"applied": 3, "rejected": 0, "success": 0}
+    response = api.patch("/api/applications/bulk", json={"ids": [ids[0], 999, ids[1], ids[0]], "status": "rejected"})
+    assert response.status_code == 200
+    assert response.json() == {"updated": [ids[0], ids[1]], "not_found": [999]}
+    assert api.get("/api/dashboard/stats").json() == {"applied": 3, "rejected": 2, "success": 0}
+    api.patch("/api/applications/bulk", json={"ids": [ids[1]], "status": "got_offer", "notes": "Yes"})
+    assert api.get("/api/dashboard/stats").json() == {"applied": 3, "rejected": 1, "success": 1}
+    detail = api.get(f"/api/applications/{ids[1]}").json()
+    assert (detail["status"], detail["notes"]) == ("got_offer", "Yes")
+    assert api.patch("/api/applications/bulk", json={"ids": [ids[2]]}).status_code == 400
+
+
+def test_create_reuses_the_job_and_counts_each_application(api: TestClient) -> None:
+    first = _create(api, "https://jobs.example/7?utm_source=feed", title="Engineer", company="Acme")
+    assert first["job"]["source_url"] == "https://jobs.example/7"
+    api.patch(f"/api/applications/{first['id']}", json={"status": "rejected"})
+    second = _create(api, "HTTPS://JOBS.EXAMPLE/7/", applied_at="2026-01-05", status="in_progress")
+    # Same posting: the upsert hands back the existing job and keeps its fields
+    assert second["job_id"] == first["job_id"]
+    assert (second["job"]["title"], second["job"]["company"]) == ("Engineer", "Acme")
+    assert (second["status"], second["notes"], second["interview_sessions"]) == ("in_progress", None, [])
+    assert api.get("/api/dashboard/stats").json() == {"applied": 2, "rejected": 1, "success": 0}
+    with api.engine.connect() as conn:
+        assert conn.scalar(select(func.count()).select_from(Job)) == 1
+        assert conn.scalar(select(func.sum(ActivityDaily.applications))) == 2
+        # Title and company are known, so nothing was queued for enrichment
+        assert conn.scalar(select(func.count()).select_from(FetchTask)) == 0
+    bare = _create(api, "https://jobs.example/8")
+    with api.engine.connect() as conn:
+        assert conn.scalar(select(FetchTask.job_id)) == bare["job_id"]
+
+
+def test_upcoming_interviews_span_applications_in_time_order(api: TestClient) -> None:
+    now = datetime.now(timezone.utc)
+    first = _create(api, "https://jobs.example/1", title="Engineer", company="Acme")
+    second = _create(api, "https://jobs.example/2", title="Analyst", company="Globex")
+    for app_id, name, hours in (
+        (first["id"], "Onsite", 48),
+        (second["id"], "Phone screen", 2),
+        (first["id"], "Intro call", -24),
+        (second["id"], "Final", 72),
+    ):
+        at = (now + timedelta(hours=hours)).isoformat()
+        assert api.post(f"/api/applications/{app_id}/sessions", json={"name": name, "scheduled_at": at}).status_code == 201
+    upcoming = api.get("/api/dashboard/upcoming-interviews", params={"limit": 2}).json()
+    assert [(i["session_name"], i["company"], i["application_id"]) for i in upcoming] == [
+        ("Phone screen", "Globex", second["id"]),
+        ("Onsite", "Acme", first["id"]),
+    ]
+    assert len(api.get("/api/dashboard/upcoming-interviews").json()) == 3
+
+
+def test_timeseries_rollups_match_a_rebuild(api: TestClient) -> None:
+    today = date.today()
+    days = [(today - timedelta(days=n)).isoformat() for n in (0, 1, 9)]
+    a = _create(api, "https://jobs.example/1", applied_at=days[0])
+    b = _create(api, "https://boards.example/2", applied_at=days[1])
+    c = _create(api, "https://boards.example/3", applied_at=days[2], status="done")
+    api.patch(f"/api/applications/{a['id']}", json={"status": "got_offer", "applied_at": days[2]})
+    api.post(f"/api/applications/{b['id']}/sessions", json={"name": "Phone screen"})
+    api.patch("/api/applications/bulk", json={"ids": [c["id"]], "status": "rejected", "applied_at": days[0]})
+    api.post(
+        "/api/applications/import",
+        content=f"source_url,applied_at,status\nhttps://jobs.example/4,{days[1]},rejected\n".encode(),
+        headers={"Content-Type": "text/csv"},
+    )
+    params = {"days": 30, "bucket": "week"}
+    incremental = api.get("/api/dashboard/timeseries", params=params).json()
+    assert incremental["funnel"]["total"] == 4
+    assert (incremental["funnel"]["got_offer"], incremental["funnel"]["rejected"]) == (1, 2)
+    with Session(api.engine) as db:
+        activity.rebuild(db)
+    assert api.get("/api/dashboard/timeseries", params=params).json() == incremental
+    assert api.get("/api/dashboard/timeseries", params={"days": 30}).json()["funnel"] == incremental["funnel"]
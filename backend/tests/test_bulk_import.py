@@ -0,0 +1,136 @@
+"""Bulk import parsing and row validation tests, and Job dedup against a throwaway SQLite file."""
+from datetime import date
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import app.models  # noqa: F401  (registers every table on Base)
+from app.core.database import Base
+from app.models.application import JobApplication
+from app.models.job import Job
+from app.models.user import User
+from app.services import bulk_import
+from app.services.job_service import upsert_job
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _collect(records) -> list:
+    return [record async for record in records]
+
+
+@pytest.mark.asyncio
+async def test_csv_records_survive_any_chunk_boundary() -> None:
+    data = (
+        "﻿Source_URL,applied_at,notes\n"
+        'https://jobs.example/1,2026-01-02,"two\nlines, one field"\n'
+        "\n"
+        "https://jobs.example/2,2026-01-03,\n"
+    ).encode()
+    expected = [
+        (1, {"source_url": "https://jobs.example/1", "applied_at": "2026-01-02", "notes": "two\nlines, one field"}, None),
+        (2, {"source_url": "https://jobs.example/2", "applied_at": "2026-01-03"}, None),
+    ]
+    for size in (1, 3, 7, len(data)):
+        assert await _collect(bulk_import.csv_records(_chunks(data, size))) == expected
+
+
+@pytest.mark.asyncio
+async def test_csv_records_reject_unusable_uploads() -> None:
+    with pytest.raises(bulk_import.InvalidUpload, match="applied_at"):
+        await _collect(bulk_import.csv_records(_chunks(b"source_url\nhttps://jobs.example/1\n", 4)))
+    with pytest.raises(bulk_import.InvalidUpload, match="UTF-8"):
+        await _collect(bulk_import.csv_records(_chunks(b"source_url,applied_at\n\xff\xfe\n", 4)))
+
+
+@pytest.mark.asyncio
+async def test_ndjson_records_report_bad_lines() -> None:
+    data = b'{"source_url": "https://jobs.example/1"}\n\n[1]\nnot json\n{"applied_at": "2026-01-02"}'
+    records = await _collect(bulk_import.ndjson_records(_chunks(data, 5)))
+    assert records == [
+        (1, {"source_url": "https://jobs.example/1"}, None),
+        (2, None, "Expected a JSON object"),
+        (3, None, "Invalid JSON"),
+        (4, {"applied_at": "2026-01-02"}, None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_records_report_over_long_lines_without_buffering_them() -> None:
+    long_line = b'{"notes": "' + b"x" * bulk_import.MAX_LINE_BYTES + b'"}'
+    data = b'{"a": 1}\n' + long_line + b'\n{"b": 2}\n' + long_line
+    error = f"Line is longer than {bulk_import.MAX_LINE_BYTES} bytes"
+    expected = [(1, {"a": 1}, None), (2, None, error), (3, {"b": 2}, None), (4, None, error)]
+    for size in (1000, len(data)):
+        assert await _collect(bulk_import.ndjson_records(_chunks(data, size))) == expected
+
+
+def test_validate_canonicalizes_url_and_reports_errors() -> None:
+    item, error = bulk_import.validate(
+        {"source_url": "HTTPS://Jobs.Example/1/?utm_source=x", "applied_at": "2026-01-02"}
+    )
+    assert error is None
+    assert item.source_url == "https://jobs.example/1"
+    assert item.status == "applied"
+    assert bulk_import.validate({"source_url": "ftp://jobs.example/1", "applied_at": "2026-01-02"})[1].startswith(
+        "source_url"
+    )
+    assert "status" in bulk_import.validate(
+        {"source_url": "https://jobs.example/1", "applied_at": "2026-01-02", "status": "ghosted"}
+    )[1]
+
+
+@pytest.mark.asyncio
+async def test_import_and_create_share_the_job_of_one_posting(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user = User(email="import@example.com", provider="google", provider_id="1")
+        db.add(user)
+        await db.commit()
+        data = b"source_url,applied_at,title\nhttps://www.linkedin.com/jobs/view/9/?trk=x,2026-01-02,Engineer\n"
+        result = await bulk_import.import_applications(db, user.id, bulk_import.csv_records(_chunks(data, 16)))
+        assert result["imported"] == 1
+        job = await upsert_job(db, source_url="HTTPS://www.linkedin.com/jobs/view/9?utm_source=feed")
+        assert job.source_url == "https://www.linkedin.com/jobs/view/9"
+        assert job.title == "Engineer"
+        assert await db.scalar(select(func.count()).select_from(Job)) == 1
+        # So create_application's insert hits the one-active-application index
+        with pytest.raises(IntegrityError):
+            await db.execute(
+                insert(JobApplication).values(user_id=user.id, job_id=job.id, applied_at=date(2026, 1, 3), status="applied")
+            )
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_import_errors_are_the_lowest_rows_in_order(tmp_path, monkeypatch) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    data = (
+        b"source_url,applied_at\n"
+        b"https://jobs.example/1,2026-01-02\n"
+        b"https://jobs.example/1,2026-01-03\n"  # duplicate, only found when the chunk is written
+        b"https://jobs.example/3,someday\n"
+        b"https://jobs.example/4,2026-01-04\n"
+        b"ftp://jobs.example/5,2026-01-05\n"
+    )
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        user = User(email="import@example.com", provider="google", provider_id="1")
+        db.add(user)
+        await db.commit()
+        result = await bulk_import.import_applications(db, user.id, bulk_import.csv_records(_chunks(data, 64)), chunk_size=3)
+        assert (result["imported"], result["failed"]) == (2, 3)
+        assert [error["row"] for error in result["errors"]] == [2, 3, 5]
+        monkeypatch.setattr(bulk_import, "MAX_REPORTED_ERRORS", 2)
+        result = await bulk_import.import_applications(db, user.id, bulk_import.csv_records(_chunks(data, 64)), chunk_size=3)
+        assert result["failed"] == 5
+        assert [error["row"] for error in result["errors"]] == [1, 2]
+    await engine.dispose()
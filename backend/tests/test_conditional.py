@@ -0,0 +1,57 @@
+"""ETag helper tests and conditional GETs on the application endpoints."""
+from fastapi.testclient import TestClient
+
+from app.api.conditional import etag_matches, make_etag
+
+
+def test_make_etag_depends_on_user_version_and_inputs() -> None:
+    base = make_etag(1, 5, "/api/applications", "")
+    assert base.startswith('W/"1-5-')
+    assert make_etag(1, 6, "/api/applications", "") != base
+    assert make_etag(2, 5, "/api/applications", "") != base
+    assert make_etag(1, 5, "/api/applications", "status=applied") != base
+
+
+def test_etag_matches_uses_weak_comparison_and_lists() -> None:
+    etag = make_etag(1, 5, "/x")
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag.removeprefix("W/"), etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('W/"1-4-00000000"', etag)
+
+
+def _revalidates(api: TestClient, url: str, etag: str) -> bool:
+    response = api.get(url, headers={"If-None-Match": etag})
+    assert response.status_code in (200, 304)
+    return response.status_code == 304
+
+
+def test_application_reads_answer_304_until_the_data_changes(api: TestClient) -> None:
+    created = api.post("/api/applications", json={"source_url": "https://jobs.example/1", "applied_at": "2026-01-02"})
+    detail_url = f"/api/applications/{created.json()['id']}"
+    etags = set()
+    for write in (
+        lambda: api.post("/api/applications", json={"source_url": "https://jobs.example/2", "applied_at": "2026-01-03"}),
+        lambda: api.patch(detail_url, json={"notes": "Called back"}),
+        lambda: api.post(f"{detail_url}/sessions", json={"name": "Phone screen"}),
+    ):
+        listed = api.get("/api/applications")
+        detail = api.get(detail_url)
+        assert listed.headers["ETag"] != detail.headers["ETag"]
+        assert _revalidates(api, "/api/applications", listed.headers["ETag"])
+        assert _revalidates(api, detail_url, detail.headers["ETag"])
+        not_modified = api.get(detail_url, headers={"If-None-Match": detail.headers["ETag"]})
+        assert not_modified.content == b""
+        assert not_modified.headers["ETag"] == detail.headers["ETag"]
+        etags.add(listed.headers["ETag"])
+        assert write().status_code in (200, 201)
+        assert not _revalidates(api, "/api/applications", listed.headers["ETag"])
+        assert not _revalidates(api, detail_url, detail.headers["ETag"])
+    assert len(etags) == 3
+
+
+def test_missing_application_is_404_even_with_a_matching_etag(api: TestClient) -> None:
+    assert api.get("/api/applications/999").status_code == 404
+    assert api.get("/api/applications/999", headers={"If-None-Match": "*"}).status_code == 404
@@ -0,0 +1,53 @@
+"""Database engine helper tests."""
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.exc import IntegrityError, TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+import app.models  # noqa: F401  (registers every table on Base)
+from app.core.database import Base, PoolStats, _timed_pool, async_database_url
+from app.models.application import ACTIVE_INDEX, JobApplication
+
+
+def test_async_database_url_maps_drivers() -> None:
+    assert async_database_url("postgresql://u:p@db:5432/x") == "postgresql+asyncpg://u:p@db:5432/x"
+    assert async_database_url("postgresql+psycopg2://u@db/x") == "postgresql+asyncpg://u@db/x"
+    assert async_database_url("sqlite:///./jobs.db") == "sqlite+aiosqlite:///./jobs.db"
+
+
+def test_timed_pool_records_checkouts_and_timeouts(tmp_path) -> None:
+    stats = PoolStats()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=_timed_pool(QueuePool, stats),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    conn = engine.connect()
+    assert stats.snapshot(engine.pool)["checked_out"] == 1
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    conn.close()
+    engine.dispose()  # the recreated pool keeps reporting into the same stats
+    engine.connect().close()
+    snap = stats.snapshot(engine.pool)
+    assert snap["checkouts"] == 2
+    assert snap["timeouts"] == 1
+    assert snap["checked_out"] == 0
+    assert snap["size"] == 1
+
+
+def test_one_active_application_per_user_and_job(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'apps.db'}")
+    Base.metadata.create_all(engine)
+    row = {"user_id": 1, "job_id": 1, "applied_at": date(2026, 1, 1)}
+    with engine.begin() as conn:
+        conn.execute(insert(JobApplication), [{**row, "status": "rejected"}, {**row, "status": "applied"}])
+        conn.execute(insert(JobApplication), {**row, "user_id": 2, "status": "in_progress"})
+    with pytest.raises(IntegrityError, match="job_applications.user_id, job_applications.job_id"):
+        with engine.begin() as conn:
+            conn.execute(insert(JobApplication), {**row, "status": "in_progress"})
+    assert ACTIVE_INDEX in {index.name for index in JobApplication.__table__.indexes}
@@ -0,0 +1,72 @@
+"""Export encoding tests (no DB)."""
+import csv
+import io
+import json
+from datetime import date, datetime
+
+import pytest
+
+from app.services import bulk_import, export
+
+
+async def _batches(*batches):
+    for rows in batches:
+        yield rows
+
+
+async def _join(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+def test_export_fields_match_import_columns() -> None:
+    fields = export.export_fields(1, notes=True, sessions=True)
+    assert {"source_url", "applied_at", "status", "notes", "title", "company"} <= set(fields)
+    assert fields[-1] == "interview_sessions"
+    assert export.export_fields(None, notes=False, sessions=False)[:2] == ["user_id", "user_email"]
+    assert "notes" not in export.export_fields(1, notes=False, sessions=False)
+
+
+@pytest.mark.asyncio
+async def test_encode_csv_quotes_and_embeds_sessions() -> None:
+    row = {
+        "source_url": "https://jobs.example/1",
+        "applied_at": date(2026, 1, 2),
+        "notes": 'two\nlines, "quoted"',
+        "interview_sessions": [{"name": "Phone", "scheduled_at": datetime(2026, 1, 5, 9, 0)}],
+    }
+    fields = ["source_url", "applied_at", "notes", "interview_sessions"]
+    body = await _join(export.encode_csv(_batches([row], []), fields))
+    header, line = list(csv.reader(io.StringIO(body.decode())))
+    assert header == fields
+    assert line[:3] == ["https://jobs.example/1", "2026-01-02", 'two\nlines, "quoted"']
+    assert json.loads(line[3]) == [{"name": "Phone", "scheduled_at": "2026-01-05T09:00:00"}]
+
+
+@pytest.mark.asyncio
+async def test_encode_csv_neutralizes_formulas_and_import_restores_them() -> None:
+    row = {
+        "id": -1,
+        "source_url": "https://jobs.example/1",
+        "applied_at": date(2026, 1, 2),
+        "title": '=HYPERLINK("https://evil.example","Apply")',
+        "company": "@SUM(A1)",
+        "location": "+44 London",
+        "notes": "-1 round",
+    }
+    fields = list(row)
+    body = await _join(export.encode_csv(_batches([row]), fields))
+    _, line = list(csv.reader(io.StringIO(body.decode())))
+    assert line == ["-1", "https://jobs.example/1", "2026-01-02"] + ["'" + row[name] for name in fields[3:]]
+
+    async def chunks():
+        yield body
+
+    [(_, fields_back, _)] = [record async for record in bulk_import.csv_records(chunks())]
+    assert fields_back["title"] == row["title"]
+    assert fields_back["notes"] == "-1 round"
+
+
+@pytest.mark.asyncio
+async def test_encode_ndjson_one_object_per_line() -> None:
+    body = await _join(export.encode_ndjson(_batches([{"id": 1}, {"id": 2}], [{"id": 3}])))
+    assert [json.loads(line) for line in body.splitlines()] == [{"id": 1}, {"id": 2}, {"id": 3}]
@@ -0,0 +1,55 @@
+"""Job page extractor tests."""
+import json
+
+from app.services.extractors import extractor_for, greenhouse, linkedin
+from app.services.job_fetch import extract_job_fields
+
+POSTING = {
+    "@context": "https://schema.org",
+    "@graph": [
+        {"@type": "Organization", "name": "Ignored"},
+        {
+            "@type": "JobPosting",
+            "title": "Platform Engineer",
+            "hiringOrganization": {"@type": "Organization", "name": "Initech"},
+            "jobLocation": [
+                {"@type": "Place", "address": {"addressLocality": "Austin", "addressRegion": "TX", "addressCountry": "US"}},
+            ],
+            "jobLocationType": "TELECOMMUTE",
+            "description": "<p>Build <b>things</b>.</p><ul><li>Ship</li><li>Own it</li></ul>",
+        },
+    ],
+}
+
+
+def test_json_ld_job_posting_wins() -> None:
+    html = (
+        '<html><head><meta property="og:title" content="Careers | Initech">'
+        f'<script type="application/ld+json">{json.dumps(POSTING)}</script></head></html>'
+    )
+    result = extract_job_fields(html, "https://careers.initech.example/jobs/7")
+    assert result["title"] == "Platform Engineer"
+    assert result["company"] == "Initech"
+    assert result["location"] == "Remote; Austin, TX, US"
+    assert result["description"] == "Build things. Ship Own it"
+
+
+def test_linkedin_extractor_parses_og_title() -> None:
+    html = '<head><meta property="og:title" content="Acme hiring Senior Engineer in Berlin, Germany | LinkedIn"></head>'
+    result = extract_job_fields(html, "https://www.linkedin.com/jobs/view/1")
+    assert (result["title"], result["company"], result["location"]) == ("Senior Engineer", "Acme", "Berlin, Germany")
+
+
+def test_generic_fallbacks() -> None:
+    html = "<html><head><title>Backend Developer at Globex - Careers</title></head><body><h1>Ignored</h1></body></html>"
+    result = extract_job_fields(html, "https://www.globex.example/jobs/3")
+    assert result["title"] == "Backend Developer at Globex - Careers"
+    assert result["company"] == "Globex"
+    assert extract_job_fields("<body><h1>Data <em>Analyst</em></h1></body>", "https://x.example/1")["title"] == "DataAnalyst"
+
+
+def test_extractor_for_matches_subdomains() -> None:
+    assert extractor_for("www.linkedin.com") is linkedin
+    assert extractor_for("boards.greenhouse.io") is greenhouse
+    assert extractor_for("notlinkedin.com") is None
+    assert extractor_for(None) is None
@@ -0,0 +1,96 @@
+"""Fetch queue tests: helpers, and enqueue / claim / complete / fail against a throwaway SQLite file."""
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401  (registers every table on Base)
+from app.core.database import Base
+from app.models.fetch_task import FetchTask
+from app.models.job import Job
+from app.services import fetch_queue
+from app.services.fetch_queue import backoff_seconds, needs_enrichment, settings
+
+
+def test_backoff_grows_exponentially() -> None:
+    base = settings.fetch_queue_backoff_seconds
+    assert 0.8 * base <= backoff_seconds(1) <= 1.2 * base
+    assert 0.8 * base * 8 <= backoff_seconds(4) <= 1.2 * base * 8
+
+
+def test_needs_enrichment_when_title_or_company_missing() -> None:
+    assert needs_enrichment(Job(source_url="https://jobs.example/1"))
+    assert needs_enrichment(Job(source_url="https://jobs.example/1", title="Engineer"))
+    assert not needs_enrichment(Job(source_url="https://jobs.example/1", title="Engineer", company="Acme"))
+
+
+@pytest.mark.asyncio
+async def test_enqueue_skips_jobs_already_queued(tmp_path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'queue.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as db:
+        db.add_all([Job(source_url="https://jobs.example/1"), Job(source_url="https://jobs.example/2")])
+        await db.flush()
+        assert await fetch_queue.enqueue_job_fetches(db, [1, 1, 2]) == 2
+        assert await fetch_queue.enqueue_job_fetches(db, [1, 2]) == 0
+        assert not await fetch_queue.enqueue_job_fetch(db, 1)
+        task = await db.scalar(select(FetchTask).where(FetchTask.job_id == 1))
+        task.status = fetch_queue.DONE
+        await db.flush()
+        # A finished task does not block a new fetch
+        assert await fetch_queue.enqueue_job_fetch(db, 1)
+    await engine.dispose()
+
+
+def _queue(db: Session) -> dict[str, FetchTask]:
+    now = fetch_queue._now()
+    db.add_all([Job(source_url=f"https://jobs.example/{i}", company="Acme") for i in range(1, 5)])
+    db.flush()
+    tasks = {
+        "due": FetchTask(job_id=1, status="pending", attempts=0, next_attempt_at=now - timedelta(seconds=1)),
+        "later": FetchTask(job_id=2, status="pending", attempts=0, next_attempt_at=now + timedelta(hours=1)),
+        "expired": FetchTask(job_id=3, status="running", attempts=1, locked_until=now - timedelta(seconds=1)),
+        "leased": FetchTask(job_id=4, status="running", attempts=1, locked_until=now + timedelta(hours=1)),
+    }
+    db.add_all(tasks.values())
+    db.commit()
+    return tasks
+
+
+@pytest.mark.parametrize("dialect", ["sqlite", "postgresql"])
+def test_claim_leases_due_tasks_then_complete_and_fail(tmp_path, monkeypatch, dialect) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}")
+    Base.metadata.create_all(engine)
+    # "postgresql" runs the SELECT ... FOR UPDATE SKIP LOCKED branch (SQLite ignores the lock clause)
+    monkeypatch.setattr(engine.dialect, "name", dialect)
+    with Session(engine) as db:
+        tasks = _queue(db)
+        claimed = fetch_queue.claim_tasks(db, "w1", limit=10)
+        assert {t.id for t in claimed} == {tasks["due"].id, tasks["expired"].id}
+        assert all(t.status == "running" and t.locked_by == "w1" for t in claimed)
+        assert {t.id: t.attempts for t in claimed} == {tasks["due"].id: 1, tasks["expired"].id: 2}
+        assert fetch_queue.claim_tasks(db, "w2", limit=10) == []
+
+        fetch_queue.complete_task(db, tasks["due"], {"title": "Engineer", "company": "Other"})
+        job = db.get(Job, 1)
+        assert (job.title, job.company) == ("Engineer", "Acme")
+        assert (tasks["due"].status, tasks["due"].locked_by) == ("done", None)
+
+        fetch_queue.fail_task(db, tasks["expired"], "Site returned 503")
+        assert tasks["expired"].status == "pending"
+        assert tasks["expired"].last_error == "Site returned 503"
+        assert tasks["expired"].locked_until is None
+        tasks["expired"].attempts = settings.fetch_queue_max_attempts
+        fetch_queue.fail_task(db, tasks["expired"], "Site returned 503")
+        assert tasks["expired"].status == "failed"
+    engine.dispose()
+
+
+def test_claim_query_skips_locked_rows_on_postgres() -> None:
+    due = select(FetchTask.id).where(fetch_queue._claimable(fetch_queue._now())).limit(5)
+    sql = str(due.with_for_update(skip_locked=True).compile(dialect=postgresql.dialect()))
+    assert sql.endswith("FOR UPDATE SKIP LOCKED")
@@ -0,0 +1,113 @@
+"""Streaming job-page reader and charset detection tests (mock transport, no network)."""
+import httpx
+import pytest
+
+from app.services.job_fetch import (
+    JSON_LD_WINDOW,
+    canonicalize_url,
+    detect_charset,
+    extract_job_fields,
+    read_page_prefix,
+)
+
+HEAD = b'<html><head><meta charset="iso-8859-1"><meta property="og:title" content="Caf\xe9 Engineer"></head>'
+
+
+def _chunked(body: bytes, size: int, sent: list[int] | None = None):
+    async def stream():
+        for i in range(0, len(body), size):
+            if sent is not None:
+                sent.append(len(body[i:i + size]))
+            yield body[i:i + size]
+    return stream()
+
+
+async def _read(
+    body: bytes, *, max_bytes: int = 1 << 20, head_only: bool = True, chunk: int = 16, sent: list[int] | None = None
+) -> bytes:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=_chunked(body, chunk, sent)))
+    async with httpx.AsyncClient(transport=transport) as client:
+        async with client.stream("GET", "https://jobs.example/1") as resp:
+            return await read_page_prefix(resp, max_bytes, head_only)
+
+
+LD_BLOCK = b'<script type="application/ld+json">{"@type": "JobPosting", "title": "LD Title"}</script>'
+
+
+@pytest.mark.asyncio
+async def test_head_only_reads_past_head_to_json_ld_in_body() -> None:
+    body = (
+        HEAD
+        + b'<body><script type="application/ld+json">{"@type": "BreadcrumbList"}</script>'
+        + b"x" * 20_000
+        + LD_BLOCK
+        + b"y" * 100_000
+        + b"</body></html>"
+    )
+    for chunk in (7, 4096):
+        prefix = await _read(body, chunk=chunk)
+        assert LD_BLOCK in prefix
+        assert len(prefix) < body.index(LD_BLOCK) + len(LD_BLOCK) + chunk
+    # JSON-LD wins over the og:title in <head>
+    assert extract_job_fields(prefix.decode("latin-1"), "https://jobs.example/1")["title"] == "LD Title"
+
+
+@pytest.mark.asyncio
+async def test_head_only_stops_at_json_ld_in_head() -> None:
+    body = b"<html><head>" + LD_BLOCK + b"<title>T</title></head><body>" + b"y" * 100_000
+    prefix = await _read(body, chunk=64)
+    assert len(prefix) < body.index(LD_BLOCK) + len(LD_BLOCK) + 64
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("page, end", [(HEAD + b"<body>", b"</head>"), (b"<html><body><h1>Data Engineer</h1>", b"</h1>")])
+async def test_head_only_reads_a_bounded_window_past_the_head(page: bytes, end: bytes) -> None:
+    body = page + b"y" * 3_000_000 + b"</body></html>"
+    window_end = body.index(end) + len(end) + JSON_LD_WINDOW
+    sent: list[int] = []
+    prefix = await _read(body, max_bytes=2 * 1024 * 1024, chunk=4096, sent=sent)
+    assert len(prefix) == window_end
+    # The stream is abandoned there: not read on to max_bytes or the end of the page
+    assert sum(sent) < window_end + 4096
+
+
+@pytest.mark.asyncio
+async def test_head_only_without_a_title_or_h1_reads_to_max_bytes() -> None:
+    assert len(await _read(b"<html><head></head><body>" + b"y" * 50_000, max_bytes=10_000, chunk=1000)) == 10_000
+
+
+@pytest.mark.asyncio
+async def test_max_bytes_caps_download() -> None:
+    prefix = await _read(b"z" * 10_000, max_bytes=1000, head_only=False, chunk=300)
+    assert len(prefix) == 1000
+
+
+def test_detect_charset() -> None:
+    assert detect_charset("text/html; charset=Shift_JIS", HEAD) == "Shift_JIS"
+    assert detect_charset("text/html", HEAD) == "iso-8859-1"
+    assert detect_charset(None, b'<meta http-equiv="Content-Type" content="text/html; charset=windows-1252">') == "windows-1252"
+    assert detect_charset(None, b"<html><head>") == "utf-8"
+
+
+def test_canonicalize_url_dedupes_tracking_variants() -> None:
+    canonical = "https://www.linkedin.com/jobs/view/123?a=1&b=2"
+    assert canonicalize_url("HTTPS://www.LinkedIn.com:443/jobs/view/123/?trk=abc&utm_source=x&b=2&a=1#apply") == canonical
+    assert canonicalize_url(" https://www.linkedin.com/jobs/view/123?a=1&b=2 ") == canonical
+    assert canonicalize_url("http://jobs.example:8080") == "http://jobs.example:8080/"
+
+
+@pytest.mark.parametrize(
+    "url, canonical",
+    [
+        ("https://x.com//", "https://x.com/"),
+        ("https://x.com/a//?b=1", "https://x.com/a?b=1"),
+        ("http://[::1]:8000/a/", "http://[::1]:8000/a"),
+        ("HTTP://[2001:DB8::1]:80/", "http://[2001:db8::1]/"),
+        # Unparseable: returned stripped, never raised
+        (" http://x.com:99999/a/ ", "http://x.com:99999/a/"),
+        ("http://[::1/a", "http://[::1/a"),
+    ],
+)
+def test_canonicalize_url_edge_cases_are_stable(url: str, canonical: str) -> None:
+    assert canonicalize_url(url) == canonical
+    assert canonicalize_url(canonical) == canonical
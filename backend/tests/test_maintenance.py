@@ -0,0 +1,24 @@
+"""Maintenance-mode gate tests (snapshot only, no DB)."""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services import site_settings
+
+
+@pytest.fixture
+def maintenance(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(site_settings, "_snapshot", site_settings.SettingsSnapshot({"maintenance_mode": "true"}, "v1"))
+
+
+def test_maintenance_blocks_api_but_not_health_or_admin(client: TestClient, maintenance: None) -> None:
+    response = client.get("/api/applications", headers={"Origin": "http://localhost:3000"})
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "60"
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert client.get("/api/health").status_code == 200
+    assert client.get("/api/admin/settings").status_code == 401  # reaches the router, not the gate
+
+
+def test_maintenance_off_by_default(client: TestClient) -> None:
+    assert site_settings.maintenance_enabled() is False
+    assert client.get("/api/applications").status_code == 401
@@ -0,0 +1,92 @@
+"""Shared outbound HTTP client tests (mock transport, no network)."""
+import asyncio
+import socket
+
+import httpcore
+import httpx
+import pytest
+
+from app.core.outbound import CachingResolverBackend, build_client
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit_caps_concurrency() -> None:
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+
+    client = build_client(max_connections=10, per_host=2, timeout=5.0, transport=httpx.MockTransport(handler))
+    async with client:
+        urls = [f"https://{host}/job/{i}" for i in range(6) for host in ("a.example", "b.example")]
+        responses = await asyncio.gather(*(client.get(u) for u in urls))
+    assert all(r.status_code == 200 for r in responses)
+    assert peak == {"a.example": 2, "b.example": 2}
+
+
+class _RecordingBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, down: tuple[str, ...] = ()) -> None:
+        self.targets: list[str] = []
+        self.down = down
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.targets.append(host)
+        if host in self.down:
+            raise httpcore.ConnectError(f"{host} refused")
+        return httpcore.AsyncMockStream([])
+
+
+@pytest.mark.asyncio
+async def test_resolver_backend_caches_lookups(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: list[str] = []
+
+    async def fake_getaddrinfo(host, port, **kwargs):
+        lookups.append(host)
+        return [(None, None, None, "", ("10.0.0.7", port))]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo)
+    inner = _RecordingBackend()
+    backend = CachingResolverBackend(inner, ttl=60)
+    await backend.connect_tcp("jobs.example", 443)
+    await backend.connect_tcp("jobs.example", 443)
+    await backend.connect_tcp("127.0.0.1", 8000)
+    assert lookups == ["jobs.example"]
+    assert inner.targets == ["10.0.0.7", "10.0.0.7", "127.0.0.1"]
+
+
+@pytest.mark.asyncio
+async def test_resolver_backend_falls_back_across_addresses(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_getaddrinfo(host, port, **kwargs):
+        return [(None, None, None, "", (ip, port)) for ip in ("10.0.0.1", "10.0.0.1", "10.0.0.2")]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo)
+    inner = _RecordingBackend(down=("10.0.0.1",))
+    backend = CachingResolverBackend(inner, ttl=60)
+    await backend.connect_tcp("jobs.example", 443)
+    assert inner.targets == ["10.0.0.1", "10.0.0.2"]
+    inner.down = ("10.0.0.1", "10.0.0.2")
+    with pytest.raises(httpcore.ConnectError):
+        await backend.connect_tcp("jobs.example", 443)
+    assert ("jobs.example", 443) not in backend._entries
+
+
+@pytest.mark.asyncio
+async def test_resolver_backend_reports_unresolvable_hosts_as_connect_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_getaddrinfo(host, port, **kwargs):
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo)
+    backend = CachingResolverBackend(_RecordingBackend(), ttl=60)
+    with pytest.raises(httpcore.ConnectError, match="not known"):
+        await backend.connect_tcp("jobs.invalid", 443)
+    assert backend._entries == {}
+    # Callers of the shared client see the usual httpx error
+    async with build_client(max_connections=2, per_host=1, timeout=5.0) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://jobs.invalid/")
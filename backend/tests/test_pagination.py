@@ -0,0 +1,52 @@
+"""Keyset cursor unit tests and paging through GET /api/applications."""
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+
+def test_cursor_roundtrip() -> None:
+    cursor = encode_cursor(date(2026, 3, 1), 1234)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (date(2026, 3, 1), 1234)
+
+
+@pytest.mark.parametrize("bad", ["", "not-a-cursor", "W10", "WyJ4IiwxXQ"])
+def test_decode_cursor_invalid_raises(bad: str) -> None:
+    with pytest.raises(InvalidCursor):
+        decode_cursor(bad)
+
+
+@pytest.mark.parametrize("sort", ["-applied_at", "applied_at"])
+def test_list_pages_cover_every_row_once(api: TestClient, sort: str) -> None:
+    # Several applications share each applied_at, so only the id breaks the ties
+    for i in range(7):
+        created = api.post(
+            "/api/applications",
+            json={"source_url": f"https://jobs.example/{i}", "applied_at": f"2026-01-0{1 + i % 3}"},
+        )
+        assert created.status_code == 201
+    rows = api.get("/api/applications", params={"sort": sort}).json()
+    everything = [row["id"] for row in rows]
+    keys = [(row["applied_at"], row["id"]) for row in rows]
+    assert keys == sorted(keys, reverse=sort.startswith("-"))
+    paged, pages = [], 0
+    params = {"sort": sort, "limit": 2}
+    while True:
+        response = api.get("/api/applications", params=params)
+        assert response.status_code == 200
+        paged += [row["id"] for row in response.json()]
+        pages += 1
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+    assert paged == everything
+    assert len(everything) == 7 and pages == 4
+
+
+def test_list_rejects_a_malformed_cursor(api: TestClient) -> None:
+    response = api.get("/api/applications", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
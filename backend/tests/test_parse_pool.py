@@ -0,0 +1,56 @@
+"""Parse worker pool tests."""
+import asyncio
+import time
+
+import pytest
+
+from app.services.job_fetch import extract_job_fields
+from app.services.parse_pool import ParsePool, ParsePoolBusy
+
+
+def _slow(x: int) -> int:
+    time.sleep(0.05)
+    return x * 2
+
+
+@pytest.mark.asyncio
+async def test_parse_pool_runs_and_records_metrics() -> None:
+    pool = ParsePool(kind="thread", workers=1, max_queue=4, queue_timeout=1.0)
+    try:
+        html = '<html><head><meta property="og:title" content="Engineer at Acme"></head></html>'
+        result = await pool.run(extract_job_fields, html, "https://jobs.example/1")
+        assert result["title"] == "Engineer at Acme"
+        assert result["company"] == "Acme"
+        assert await asyncio.gather(pool.run(_slow, 1), pool.run(_slow, 2)) == [2, 4]
+        stats = pool.stats.snapshot()
+        assert stats["completed"] == 3
+        assert stats["in_flight"] == 0
+        assert stats["queue_wait_max_ms"] > 0
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_parse_pool_rejects_when_queue_full() -> None:
+    pool = ParsePool(kind="thread", workers=1, max_queue=0, queue_timeout=0.01)
+    try:
+        results = await asyncio.gather(pool.run(_slow, 1), pool.run(_slow, 2), return_exceptions=True)
+        assert results[0] == 2
+        assert isinstance(results[1], ParsePoolBusy)
+        assert pool.stats.snapshot()["rejected"] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_parse_pool_works_across_event_loops() -> None:
+    pool = ParsePool(kind="thread", workers=1, max_queue=1, queue_timeout=1.0)
+
+    async def contended() -> list[int]:
+        # Three callers for two slots: the third waits on the semaphore, binding it to this loop
+        return await asyncio.gather(pool.run(_slow, 1), pool.run(_slow, 2), pool.run(_slow, 3))
+
+    try:
+        assert asyncio.run(contended()) == [2, 4, 6]
+        assert asyncio.run(contended()) == [2, 4, 6]
+    finally:
+        pool.shutdown()
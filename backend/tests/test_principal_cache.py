@@ -0,0 +1,22 @@
+"""Authenticated-principal cache tests."""
+from app.core.security import create_access_token
+from app.models.user import User
+from app.services import principal_cache
+
+
+def test_token_user_id_caches_valid_tokens_only() -> None:
+    principal_cache.clear()
+    token = create_access_token({"sub": "42"})
+    assert principal_cache.token_user_id(token) == 42
+    assert principal_cache.token_cache.get(token) == 42
+    assert principal_cache.token_user_id("not-a-jwt") is None
+    assert principal_cache.token_user_id(create_access_token({"sub": "abc"})) is None
+    assert len(principal_cache.token_cache) == 1
+
+
+def test_invalidate_user_drops_snapshot() -> None:
+    principal_cache.clear()
+    principal_cache.put_user(User(id=7, email="a@example.com", is_active=True, is_admin=False))
+    assert principal_cache.get_user(7).email == "a@example.com"
+    principal_cache.invalidate_user(7)
+    assert principal_cache.get_user(7) is None
@@ -0,0 +1,33 @@
+"""Fast JSON response tests."""
+from datetime import date, datetime, timezone
+
+import pydantic_core
+from fastapi import Response
+
+from app.core import responses
+from app.core.responses import fast_json
+
+
+def test_dumps_matches_pydantic_encoding(monkeypatch) -> None:
+    value = {
+        "created_at": datetime(2026, 1, 1, 9, 30, tzinfo=timezone.utc),
+        "applied_at": date(2026, 1, 2),
+        "naive": datetime(2026, 1, 1, 3, 4, 5, 123456),
+        "score": None,
+    }
+    expected = pydantic_core.to_json(value)
+    assert responses.dumps(value) == expected
+    monkeypatch.setattr(responses, "orjson", None)
+    assert responses.dumps(value) == expected
+
+
+def test_fast_json_keeps_endpoint_headers() -> None:
+    injected = Response()
+    injected.headers["ETag"] = 'W/"1-2-3"'
+    injected.headers["X-Next-Cursor"] = "abc"
+    out = fast_json([{"id": 1}], injected, status_code=201)
+    assert out.status_code == 201
+    assert out.body == b'[{"id":1}]'
+    assert out.headers["etag"] == 'W/"1-2-3"'
+    assert out.headers["x-next-cursor"] == "abc"
+    assert out.headers["content-length"] == str(len(out.body))
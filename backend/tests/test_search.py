@@ -0,0 +1,68 @@
+"""Search tokenizer unit tests and searching GET /api/applications on SQLite (FTS5)."""
+import importlib.util
+from pathlib import Path
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from fastapi.testclient import TestClient
+
+from app.services.search import MAX_TOKENS, search_tokens
+
+
+def test_search_tokens_strips_query_syntax() -> None:
+    assert search_tokens('Senior "Python" OR dev*') == ["senior", "python", "or", "dev"]
+    assert search_tokens("C++ & (Go)") == ["c", "go"]
+
+
+def test_search_tokens_empty_and_capped() -> None:
+    assert search_tokens(None) == []
+    assert search_tokens("  !! ") == []
+    assert len(search_tokens(" ".join(["word"] * 20))) == MAX_TOKENS
+
+
+def _add_full_text_search(engine) -> None:
+    """Migration 006's FTS5 tables and triggers, which Base.metadata.create_all does not make."""
+    path = Path(__file__).resolve().parents[1] / "alembic" / "versions" / "006_add_full_text_search.py"
+    spec = importlib.util.spec_from_file_location("migration_006", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    with engine.begin() as conn, Operations.context(MigrationContext.configure(conn)):
+        migration._upgrade_sqlite()
+
+
+def test_search_matches_titles_notes_and_session_notes(api: TestClient) -> None:
+    _add_full_text_search(api.engine)
+
+    def create(url: str, **fields) -> int:
+        response = api.post("/api/applications", json={"source_url": url, "applied_at": "2026-01-02", **fields})
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    by_title = create("https://jobs.example/1", title="Python Engineer", company="Acme")
+    by_notes = create("https://jobs.example/2", title="Backend Developer", company="Globex")
+    by_session = create("https://jobs.example/3", title="Data Analyst", company="Initech")
+    create("https://jobs.example/4", title="Rust Developer", company="Python-free Ltd")
+    api.patch(f"/api/applications/{by_notes}", json={"notes": "Mostly Python services"})
+    api.post(f"/api/applications/{by_session}/sessions", json={"name": "Tech", "notes": "Asked about pythonic code"})
+
+    def search(term: str, **params) -> list[int]:
+        response = api.get("/api/applications", params={"search": term, **params})
+        assert response.status_code == 200
+        return [row["id"] for row in response.json()]
+
+    # Prefix match on every token; the fourth job's company is also a hit
+    assert len(search("pyth")) == 4
+    assert search("python engineer") == [by_title]
+    assert search("developer", sort="applied_at") == sorted(search("developer"))
+    assert search("!!") == []
+    ranked = search("pyth", sort="relevance")
+    paged, params = [], {"search": "pyth", "sort": "relevance", "limit": 1}
+    while True:
+        response = api.get("/api/applications", params=params)
+        paged += [row["id"] for row in response.json()]
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+    assert paged == ranked
+    assert sorted(paged) == sorted(set(paged)) and len(paged) == 4
+    assert api.get("/api/applications", params={**params, "cursor": "bad"}).status_code == 400
@@ -0,0 +1,25 @@
+"""User statistics counter tests (no DB)."""
+from sqlalchemy.dialects import postgresql
+
+from app.services import data_version, user_stats
+
+
+def test_count_change_follows_current_status() -> None:
+    counts = user_stats.new_counts()
+    user_stats.count_change(counts, None, "applied")
+    user_stats.count_change(counts, "applied", "rejected")
+    user_stats.count_change(counts, "rejected", "got_offer")
+    user_stats.count_change(counts, "got_offer", "got_offer")
+    assert counts == {"total_applied": 1, "total_rejected": 0, "total_success": 1}
+    user_stats.count_change(counts, "got_offer", None)
+    assert counts == user_stats.new_counts()
+
+
+def test_add_counts_increments_in_place() -> None:
+    counts = user_stats.new_counts()
+    user_stats.count_change(counts, None, "rejected")
+    stmt = user_stats.add_counts(data_version.bump_users(1), counts, user_id=1)
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "total_applied=(users.total_applied + CASE WHEN (users.id = %(id_1)s)" in sql
+    assert "total_rejected=(users.total_rejected + CASE" in sql
+    assert "total_success" not in sql